@@ -1,5 +1,17 @@
 # DMA Example Package
 
 from .op import DmaOp
+from .desc import pack_devcpy_desc, pack_memcpy_desc
 from .impl.op_op_alg import DmaOpOpAlg
-
+from .impl.arbiter import ArbMode, MemArbiter
+from .impl.mem_paged import PagedMemory
+from .impl.mem_mmap import MmapMemory
+from .impl.mem_router import MemRouter
+from .impl.dma_csr import DmaCsr
+from .impl.stats import XferStats
+from .impl.trace import TraceMemory, TraceReplay, read_trace
+from .handle import XferHandle
+from .impl.csum import CsumMode
+from .impl.ranges import OverlapPolicy
+from .impl.estimate import MemModel, XferEstimator
+from .impl.runner import Scenario, ScenarioResult, ScenarioRunner, run_scenarios
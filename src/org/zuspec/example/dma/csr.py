@@ -0,0 +1,52 @@
+
+# Register map of the DMA control/status register block (see
+# docs/spec/control_model.md). Offsets are relative to the block base.
+# All registers are 32 bits except the 64-bit address registers, which
+# may be accessed as a whole or as 32-bit halves (_LO/_HI).
+
+# Global registers
+GLOBAL_EN = 0x000
+INT_STATUS = 0x004
+
+# Channel n registers are at CH_BASE + n * CH_STRIDE + <offset>
+CH_BASE = 0x100
+CH_STRIDE = 0x40
+
+CH_SRC_ADDR = 0x00
+CH_SRC_ADDR_HI = 0x04
+CH_DST_ADDR = 0x08
+CH_DST_ADDR_HI = 0x0C
+CH_XFER_SIZE = 0x10
+CH_CTRL = 0x14
+CH_STATUS = 0x18
+
+# CHn_CTRL fields
+CTRL_ENABLE = 1 << 0
+CTRL_START = 1 << 1         # Self-clearing
+CTRL_RESET = 1 << 2         # Self-clearing
+CTRL_TRIG_MODE = 1 << 3     # 0: programmatic, 1: peripheral trigger
+CTRL_TRIG_SEL_SHIFT = 4
+CTRL_TRIG_SEL_MASK = 0xF << CTRL_TRIG_SEL_SHIFT
+CTRL_INT_EN = 1 << 8
+CTRL_ERR_INT_EN = 1 << 9
+
+# CHn_STATUS fields
+STATUS_IDLE = 1 << 0
+STATUS_ACTIVE = 1 << 1
+STATUS_COMPLETE = 1 << 2    # Cleared on read
+STATUS_ERROR = 1 << 3       # Cleared on read
+STATUS_ERR_CODE_SHIFT = 4
+STATUS_ERR_CODE_MASK = 0xF << STATUS_ERR_CODE_SHIFT
+
+# STATUS.ERR_CODE values
+ERR_NONE = 0
+ERR_SRC_ADDR = 1
+ERR_DST_ADDR = 2
+ERR_ALIGN = 3
+ERR_SIZE = 4
+ERR_XFER = 5        # Transfer failed for a reason other than its addresses
+
+
+def ch_reg(ch: int, offset: int) -> int:
+    """Returns the block offset of register 'offset' in channel ch."""
+    return CH_BASE + ch * CH_STRIDE + offset
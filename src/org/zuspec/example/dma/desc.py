@@ -0,0 +1,48 @@
+
+import struct
+
+# In-memory descriptor layouts used by DmaOp.memcpy_desc/devcpy_desc.
+# Descriptors are little-endian, 8-byte aligned, and linked through their
+# first field. A next address of 0 ends the chain.
+
+# MemCpy descriptor (32 bytes)
+#   0x00  next    u64
+#   0x08  src     u64
+#   0x10  dst     u64
+#   0x18  sz      u32
+#   0x1C  -       u32 (reserved)
+MEMCPY_DESC = struct.Struct("<QQQI4x")
+
+# DevCpy descriptor (40 bytes)
+#   0x00  next    u64
+#   0x08  src     u64
+#   0x10  dst     u64
+#   0x18  sz      u32
+#   0x1C  chk_sz  u32
+#   0x20  acc_sz  u8
+#   0x21  flags   u8  (DESC_INC_SRC | DESC_INC_DST)
+#   0x22  -       6 bytes (reserved)
+DEVCPY_DESC = struct.Struct("<QQQIIBB6x")
+
+DESC_INC_SRC = 0x1
+DESC_INC_DST = 0x2
+
+
+def pack_memcpy_desc(src: int, dst: int, sz: int, next: int = 0) -> bytes:
+    """Returns the in-memory image of a MemCpy descriptor."""
+    return MEMCPY_DESC.pack(next, src, dst, sz)
+
+
+def pack_devcpy_desc(
+        src: int,
+        dst: int,
+        sz: int,
+        acc_sz: int,
+        chk_sz: int,
+        inc_src: bool,
+        inc_dst: bool,
+        next: int = 0) -> bytes:
+    """Returns the in-memory image of a DevCpy descriptor."""
+    flags = ((DESC_INC_SRC if inc_src else 0)
+             | (DESC_INC_DST if inc_dst else 0))
+    return DEVCPY_DESC.pack(next, src, dst, sz, chk_sz, acc_sz, flags)
@@ -0,0 +1,84 @@
+
+import asyncio
+import zuspec.dataclasses as zdc
+from typing import Callable, List
+
+
+class XferHandle(object):
+    """Completion handle for a transfer submitted with a submit_* method.
+
+    A handle may be awaited (returning the transfer's result), polled with
+    done(), or given callbacks that run when the transfer completes. If
+    the transfer raised, awaiting the handle or calling result() raises
+    the same exception.
+    """
+    __slots__ = ("_done", "_result", "_exc", "_ev", "_callbacks")
+
+    def __init__(self):
+        self._done = False
+        self._result = None
+        self._exc = None
+        # Created only if someone waits before completion
+        self._ev = None
+        self._callbacks: List[Callable] = None
+
+    def done(self) -> bool:
+        """Returns True once the transfer has completed."""
+        return self._done
+
+    def result(self):
+        """Returns the transfer's result (its XferStats record, or None).
+        Raises RuntimeError if the transfer has not completed."""
+        if not self._done:
+            raise RuntimeError("Transfer has not completed")
+        if self._exc is not None:
+            raise self._exc
+        return self._result
+
+    def exception(self) -> BaseException:
+        """Returns the exception raised by the transfer, or None."""
+        if not self._done:
+            raise RuntimeError("Transfer has not completed")
+        return self._exc
+
+    def add_done_callback(self, fn: Callable[["XferHandle"], None]):
+        """Call fn(handle) when the transfer completes. If it already has,
+        fn is called immediately. Exceptions raised by fn on completion
+        are passed to the event loop's exception handler."""
+        if self._done:
+            fn(self)
+        elif self._callbacks is None:
+            self._callbacks = [fn]
+        else:
+            self._callbacks.append(fn)
+
+    async def wait(self):
+        """Wait for the transfer to complete. Returns its result."""
+        if not self._done:
+            if self._ev is None:
+                self._ev = zdc.Event()
+            await self._ev.wait()
+        return self.result()
+
+    def __await__(self):
+        return self.wait().__await__()
+
+    def _complete(self, result, exc: BaseException):
+        self._done = True
+        self._result = result
+        self._exc = exc
+        if self._ev is not None:
+            self._ev.set()
+        if self._callbacks is not None:
+            for fn in self._callbacks:
+                try:
+                    fn(self)
+                except Exception as e:
+                    # Report the error as asyncio does for a failed callback,
+                    # without disturbing the transfer or other callbacks
+                    asyncio.get_event_loop().call_exception_handler({
+                        "message": "Exception in XferHandle callback %r" % fn,
+                        "exception": e,
+                        "handle": self,
+                    })
+            self._callbacks = None
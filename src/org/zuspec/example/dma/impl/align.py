@@ -0,0 +1,39 @@
+
+from typing import Dict
+
+# Mask selecting the low bytes of a word for each access size
+_SIZE_MASK = {1: 0xFF, 2: 0xFFFF, 4: 0xFFFFFFFF, 8: 0xFFFFFFFFFFFFFFFF}
+
+
+def _access_size(addr: int, remaining: int) -> int:
+    """Largest power-of-2 access size (up to 8) that is aligned at addr
+    and does not exceed remaining bytes."""
+    align = addr & 0x7  # Low 3 bits give alignment
+    if align == 0 and remaining >= 8:
+        return 8
+    elif (align & 0x3) == 0 and remaining >= 4:
+        return 4
+    elif (align & 0x1) == 0 and remaining >= 2:
+        return 2
+    return 1
+
+
+def _access_counts(addr: int, nbytes: int) -> Dict[int, int]:
+    """Returns {size: count} of the accesses _access_size splits
+    [addr, addr+nbytes) into, in constant time."""
+    counts: Dict[int, int] = {}
+    # Head: at most three accesses reach 8-byte alignment
+    while nbytes > 0 and (addr & 0x7):
+        sz = _access_size(addr, nbytes)
+        counts[sz] = counts.get(sz, 0) + 1
+        addr += sz
+        nbytes -= sz
+    if nbytes >= 8:
+        counts[8] = nbytes // 8
+        nbytes &= 0x7
+    # Tail: at most a 4, 2 and 1-byte access
+    for sz in (4, 2, 1):
+        if nbytes >= sz:
+            counts[sz] = counts.get(sz, 0) + 1
+            nbytes -= sz
+    return counts
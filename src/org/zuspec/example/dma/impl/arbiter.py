@@ -0,0 +1,150 @@
+
+import asyncio
+import enum
+import zuspec.dataclasses as zdc
+from typing import Dict, List
+
+
+class ArbMode(enum.IntEnum):
+    """Arbitration policy used by MemArbiter."""
+    STRICT = 0  # Highest priority first, FIFO within a priority level
+    WRR = 1     # Weighted round-robin across priority levels
+
+
+class _Waiter(object):
+    __slots__ = ("pri", "seq", "grants", "ev")
+
+    def __init__(self, pri: int, seq: int, grants: int, ev: zdc.Event):
+        self.pri = pri
+        self.seq = seq
+        self.grants = grants
+        self.ev = ev
+
+
+@zdc.dataclass
+class MemArbiter(zdc.Component):
+    """Priority arbiter for the DMA memory port.
+
+    Requesters call acquire(pri) before a burst of accesses and release()
+    afterward. Priorities range from PRI_MIN to PRI_MAX, with PRI_MAX being
+    the most urgent. Grants are never preempted; a requester holds the
+    port until it releases it. Up to `n_ports` requesters may hold a grant
+    at once, modeling that many outstanding memory transactions. Raising
+    `n_ports` grants waiting requesters the new ports at once; lowering it
+    lets current holders drain before waiters are granted.
+
+    In STRICT mode, the highest-priority waiter is granted next. A non-zero
+    `aging` raises a waiter's effective priority by one level for every
+    `aging` grants made to others while it waits, bounding starvation.
+
+    In WRR mode, waiting priority levels are served round-robin from the
+    highest down, with level `pri` receiving up to pri+1 consecutive grants
+    per round.
+    """
+    PRI_MIN = 0
+    PRI_MAX = 15
+
+    mode: ArbMode = zdc.field(default=ArbMode.STRICT)
+    n_ports: zdc.u32 = zdc.field(default=1)
+    aging: zdc.u32 = zdc.field(default=0)
+
+    def __post_init__(self):
+        self.reset()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "n_ports" and "_waiters" in self.__dict__:
+            self._fill()
+
+    def reset(self):
+        """Return to the initial state, clearing max_wait. Only valid while
+        no requester holds or waits for a port."""
+        self._active = 0
+        self._waiters: List[_Waiter] = []
+        self._seq = 0
+        self._grants = 0
+        # WRR state: level currently being served and its remaining credit
+        self._rr_pri = self.PRI_MAX + 1
+        self._rr_credit = 0
+        # Worst-case time (ns) spent waiting for a grant, per priority
+        self.max_wait: Dict[int, int] = {}
+
+    async def acquire(self, pri: zdc.i32 = 0):
+        """Wait until the memory port is granted at priority pri."""
+        pri = min(max(pri, self.PRI_MIN), self.PRI_MAX)
+
+        if self._active < self.n_ports and not self._waiters:
+            self._active += 1
+            self._grant(pri)
+            self.max_wait.setdefault(pri, 0)
+            return
+
+        start = self.time().as_ns()
+        w = _Waiter(pri, self._seq, self._grants, zdc.Event())
+        self._seq += 1
+        self._waiters.append(w)
+        try:
+            await w.ev.wait()
+        except asyncio.CancelledError:
+            if w in self._waiters:
+                self._waiters.remove(w)
+            else:
+                # The port was handed to us as we were cancelled; pass it on
+                self.release()
+            raise
+
+        waited = self.time().as_ns() - start
+        if waited > self.max_wait.get(pri, -1):
+            self.max_wait[pri] = waited
+
+    def release(self):
+        """Release a port, handing it to the next waiter (if any)."""
+        self._active -= 1
+        self._fill()
+
+    def _fill(self):
+        # Grant waiters, in arbitration order, while ports are free
+        while self._waiters and self._active < self.n_ports:
+            if self.mode == ArbMode.WRR:
+                w = self._select_wrr()
+            else:
+                w = self._select_strict()
+            self._waiters.remove(w)
+            self._active += 1
+            self._grant(w.pri)
+            w.ev.set()
+
+    def _grant(self, pri: int):
+        self._grants += 1
+        if pri != self._rr_pri or self._rr_credit <= 0:
+            self._rr_pri = pri
+            self._rr_credit = pri + 1
+        self._rr_credit -= 1
+
+    def _select_strict(self) -> _Waiter:
+        best = None
+        best_pri = -1
+        for w in self._waiters:
+            pri = w.pri
+            if self.aging:
+                pri = min(pri + (self._grants - w.grants) // self.aging,
+                          self.PRI_MAX)
+            if pri > best_pri or (pri == best_pri and w.seq < best.seq):
+                best, best_pri = w, pri
+        return best
+
+    def _select_wrr(self) -> _Waiter:
+        levels = set(w.pri for w in self._waiters)
+
+        if self._rr_credit > 0 and self._rr_pri in levels:
+            pri = self._rr_pri
+        else:
+            # Move to the next lower level with waiters, wrapping to the top
+            lower = [p for p in levels if p < self._rr_pri]
+            pri = max(lower) if lower else max(levels)
+
+        best = None
+        for w in self._waiters:
+            if w.pri == pri and (best is None or w.seq < best.seq):
+                best = w
+        return best
@@ -0,0 +1,95 @@
+
+import enum
+import zlib
+
+
+class CsumMode(enum.IntEnum):
+    """Checksum computed by DmaOpOpAlg over the data a transfer writes."""
+    NONE = 0
+    CRC32 = 1   # IEEE 802.3 CRC-32, as zlib.crc32
+    CRC32C = 2  # Castagnoli CRC-32C
+    SUM = 3     # Sum of bytes, modulo 2**32
+
+
+def _crc32c_table():
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ (0x82F63B78 if crc & 1 else 0)
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _crc32c_table()
+
+
+def crc32c(data: bytes, crc: int = 0) -> int:
+    """Returns the CRC-32C of data, continuing from crc."""
+    table = _CRC32C_TABLE
+    crc ^= 0xFFFFFFFF
+    for b in data:
+        crc = table[(crc ^ b) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def checksum(mode: CsumMode, data: bytes, value: int = 0) -> int:
+    """Returns the checksum of data, continuing from value."""
+    if mode == CsumMode.CRC32:
+        return zlib.crc32(data, value)
+    elif mode == CsumMode.CRC32C:
+        return crc32c(data, value)
+    elif mode == CsumMode.SUM:
+        return (value + sum(data)) & 0xFFFFFFFF
+    raise ValueError("No checksum for mode %s" % mode)
+
+
+class _Csum(object):
+    """Running checksum of one transfer."""
+    __slots__ = ("mode", "value")
+
+    def __init__(self, mode: CsumMode):
+        self.mode = mode
+        self.value = 0
+
+    def update(self, data: bytes):
+        self.value = checksum(self.mode, data, self.value)
+
+
+class _CsumMem(object):
+    """Wraps a memory port, feeding written data to a running checksum."""
+    __slots__ = ("mem", "csum")
+
+    def __init__(self, mem, csum: _Csum):
+        self.mem = mem
+        self.csum = csum
+
+    async def read(self, addr: int) -> int:
+        return await self.mem.read(addr)
+
+    async def write(self, addr: int, data: int, size: int):
+        self.csum.update(
+            (data & ((1 << (8 * size)) - 1)).to_bytes(size, "little"))
+        await self.mem.write(addr, data, size)
+
+    def read_lt(self, addr: int, delay: int):
+        return self.mem.read_lt(addr, delay)
+
+    def write_lt(self, addr: int, data: int, size: int, delay: int) -> int:
+        self.csum.update(
+            (data & ((1 << (8 * size)) - 1)).to_bytes(size, "little"))
+        return self.mem.write_lt(addr, data, size, delay)
+
+    async def read_burst(self, addr: int, nbytes: int) -> bytes:
+        return await self.mem.read_burst(addr, nbytes)
+
+    async def write_burst(self, addr: int, data: bytes):
+        self.csum.update(data)
+        await self.mem.write_burst(addr, data)
+
+    def load(self, addr: int, data: bytes):
+        self.csum.update(data)
+        self.mem.load(addr, data)
+
+    def dump(self, addr: int, nbytes: int) -> bytes:
+        return self.mem.dump(addr, nbytes)
@@ -0,0 +1,320 @@
+
+import asyncio
+import zuspec.dataclasses as zdc
+from typing import Dict, List, Tuple
+
+from ..csr import (
+    GLOBAL_EN, INT_STATUS, CH_BASE, CH_STRIDE,
+    CH_SRC_ADDR, CH_SRC_ADDR_HI, CH_DST_ADDR, CH_DST_ADDR_HI,
+    CH_XFER_SIZE, CH_CTRL, CH_STATUS,
+    CTRL_ENABLE, CTRL_START, CTRL_RESET, CTRL_TRIG_MODE,
+    CTRL_TRIG_SEL_MASK, CTRL_TRIG_SEL_SHIFT, CTRL_INT_EN, CTRL_ERR_INT_EN,
+    STATUS_IDLE, STATUS_ACTIVE, STATUS_COMPLETE, STATUS_ERROR,
+    STATUS_ERR_CODE_SHIFT, ERR_SRC_ADDR, ERR_DST_ADDR, ERR_ALIGN, ERR_SIZE,
+    ERR_XFER)
+from ..mem import MemoryAddressError, MemoryOp
+from ..op import DmaOp
+from .align import _SIZE_MASK
+
+_LO = 0xFFFFFFFF
+_HI = _LO << 32
+# CTRL bits that hold state; START/RESET are self-clearing
+_CTRL_RW = (CTRL_ENABLE | CTRL_TRIG_MODE | CTRL_TRIG_SEL_MASK
+            | CTRL_INT_EN | CTRL_ERR_INT_EN)
+
+
+class _Channel(object):
+    __slots__ = ("idx", "src", "dst", "size", "ctrl", "status", "task",
+                 "start_ns", "done_ns")
+
+    def __init__(self, idx: int):
+        self.idx = idx
+        self.src = 0
+        self.dst = 0
+        self.size = 0
+        self.ctrl = 0
+        self.status = STATUS_IDLE
+        self.task = None
+        # Time (ns) the last transfer was launched and completed
+        self.start_ns = None
+        self.done_ns = None
+
+
+@zdc.dataclass
+class DmaCsr(MemoryOp, zdc.Component):
+    """Memory-mapped control/status register front end for a DmaOp engine.
+
+    Implements the register model in docs/spec/control_model.md, with the
+    layout defined in csr.py. The block implements MemoryOp, so a CPU or
+    driver model accesses it like memory; `base` is the address of the
+    first register. Each access decodes through a table, built once, that
+    maps a register address to its handler and channel.
+
+    Writing CTRL.START on an enabled channel (with GLOBAL_EN set) launches
+    a memcpy of XFER_SIZE units. Enabling a channel with TRIG_MODE set arms
+    it for a peripheral trigger: one request on TRIG_SEL runs the whole
+    transfer as a devcpy. Configuration errors are reported through
+    STATUS.ERROR and ERR_CODE without starting a transfer. A transfer the
+    engine fails ends with ERR_SRC_ADDR or ERR_DST_ADDR if a memory
+    refused one of its reads or writes, or ERR_XFER otherwise.
+
+    `irq` is a level-sensitive interrupt, set while INT_STATUS is non-zero.
+    A channel's interrupt is cleared by reading its STATUS register.
+    """
+
+    dma: DmaOp = zdc.port()
+
+    base: zdc.u64 = zdc.field(default=0)
+    n_channels: zdc.u32 = zdc.field(default=4)
+
+    # Bytes per transfer unit; XFER_SIZE counts units
+    unit_sz: zdc.u8 = zdc.field(default=4)
+
+    # Largest XFER_SIZE accepted (0: no limit)
+    max_xfer: zdc.u32 = zdc.field(default=0)
+
+    # Latency of a register access
+    access_delay: zdc.Time = zdc.field(default=None)
+
+    def __post_init__(self):
+        self.global_en = 0
+        self.int_status = 0
+        self.irq = zdc.Event()
+        self._channels: List[_Channel] = []
+        self._rd: Dict[int, Tuple] = {}
+        self._wr: Dict[int, Tuple] = {}
+        self._wr64: Dict[int, Tuple] = {}
+        self._decode_key = None
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        """Read the register at addr. Unmapped addresses read as zero."""
+        if self.access_delay is not None:
+            await self.wait(self.access_delay)
+        if self._decode_key != (self.base, self.n_channels):
+            self._build_decode()
+        ent = self._rd.get(addr)
+        if ent is None:
+            return 0
+        return ent[0](ent[1])
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        """Write the register at addr. An 8-byte write to the low half of
+        an address register writes the full 64-bit address; other wide
+        writes are split into 32-bit register writes. 1- and 2-byte writes
+        replace only their bytes of the register."""
+        if self.access_delay is not None:
+            await self.wait(self.access_delay)
+        if self._decode_key != (self.base, self.n_channels):
+            self._build_decode()
+        if size < 4:
+            reg = addr & ~0x3
+            ent = self._wr.get(reg)
+            if ent is not None:
+                # Merge into the current value; writable registers have
+                # side-effect free reads
+                rd = self._rd[reg]
+                shift = 8 * (addr - reg)
+                mask = (_SIZE_MASK[size] << shift) & _LO
+                data = (rd[0](rd[1]) & ~mask) | ((data << shift) & mask)
+                ent[0](ent[1], data & _LO)
+            return
+        if size > 4:
+            ent = self._wr64.get(addr)
+            if ent is not None:
+                ent[0](ent[1], data)
+                return
+        ent = self._wr.get(addr)
+        while True:
+            if ent is not None:
+                ent[0](ent[1], data & _LO)
+            size -= 4
+            if size <= 0:
+                break
+            addr += 4
+            data >>= 32
+            ent = self._wr.get(addr)
+
+    def channel_time(self, ch: int) -> int:
+        """Returns the duration (ns) of channel ch's last completed
+        transfer, from launch to completion, or None."""
+        c = self._channels[ch]
+        if c.done_ns is None or c.start_ns is None or c.done_ns < c.start_ns:
+            return None
+        return c.done_ns - c.start_ns
+
+    def _build_decode(self):
+        old = self._channels
+        self._channels = [
+            old[i] if i < len(old) else _Channel(i)
+            for i in range(self.n_channels)]
+
+        base = self.base
+        self._rd = {
+            base + GLOBAL_EN: (self._rd_global_en, None),
+            base + INT_STATUS: (self._rd_int_status, None),
+        }
+        self._wr = {
+            base + GLOBAL_EN: (self._wr_global_en, None),
+        }
+        self._wr64 = {}
+        for c in self._channels:
+            cb = base + CH_BASE + c.idx * CH_STRIDE
+            self._rd.update({
+                cb + CH_SRC_ADDR: (self._rd_src, c),
+                cb + CH_SRC_ADDR_HI: (self._rd_src_hi, c),
+                cb + CH_DST_ADDR: (self._rd_dst, c),
+                cb + CH_DST_ADDR_HI: (self._rd_dst_hi, c),
+                cb + CH_XFER_SIZE: (self._rd_size, c),
+                cb + CH_CTRL: (self._rd_ctrl, c),
+                cb + CH_STATUS: (self._rd_status, c),
+            })
+            self._wr.update({
+                cb + CH_SRC_ADDR: (self._wr_src, c),
+                cb + CH_SRC_ADDR_HI: (self._wr_src_hi, c),
+                cb + CH_DST_ADDR: (self._wr_dst, c),
+                cb + CH_DST_ADDR_HI: (self._wr_dst_hi, c),
+                cb + CH_XFER_SIZE: (self._wr_size, c),
+                cb + CH_CTRL: (self._wr_ctrl, c),
+            })
+            self._wr64.update({
+                cb + CH_SRC_ADDR: (self._wr_src64, c),
+                cb + CH_DST_ADDR: (self._wr_dst64, c),
+            })
+        self._decode_key = (self.base, self.n_channels)
+
+    # Register handlers
+
+    def _rd_global_en(self, _) -> int:
+        return self.global_en
+
+    def _wr_global_en(self, _, data: int):
+        self.global_en = data & 1
+
+    def _rd_int_status(self, _) -> int:
+        return self.int_status
+
+    def _rd_src(self, c: _Channel) -> int:
+        return c.src
+
+    def _rd_src_hi(self, c: _Channel) -> int:
+        return c.src >> 32
+
+    def _rd_dst(self, c: _Channel) -> int:
+        return c.dst
+
+    def _rd_dst_hi(self, c: _Channel) -> int:
+        return c.dst >> 32
+
+    def _rd_size(self, c: _Channel) -> int:
+        return c.size
+
+    def _rd_ctrl(self, c: _Channel) -> int:
+        return c.ctrl
+
+    def _rd_status(self, c: _Channel) -> int:
+        status = c.status
+        if status & (STATUS_COMPLETE | STATUS_ERROR):
+            c.status = status & ~(STATUS_COMPLETE | STATUS_ERROR)
+            self._clear_int(c)
+        return status
+
+    def _wr_src(self, c: _Channel, data: int):
+        c.src = (c.src & _HI) | data
+
+    def _wr_src64(self, c: _Channel, data: int):
+        c.src = data & (_HI | _LO)
+
+    def _wr_src_hi(self, c: _Channel, data: int):
+        c.src = (c.src & _LO) | (data << 32)
+
+    def _wr_dst(self, c: _Channel, data: int):
+        c.dst = (c.dst & _HI) | data
+
+    def _wr_dst64(self, c: _Channel, data: int):
+        c.dst = data & (_HI | _LO)
+
+    def _wr_dst_hi(self, c: _Channel, data: int):
+        c.dst = (c.dst & _LO) | (data << 32)
+
+    def _wr_size(self, c: _Channel, data: int):
+        c.size = data
+
+    def _wr_ctrl(self, c: _Channel, data: int):
+        if data & CTRL_RESET:
+            self._reset(c)
+
+        was_enabled = c.ctrl & CTRL_ENABLE
+        c.ctrl = data & _CTRL_RW
+        if c.task is not None or not self.global_en:
+            return
+        if not (c.ctrl & CTRL_ENABLE):
+            return
+
+        if c.ctrl & CTRL_TRIG_MODE:
+            # Arm on the 0->1 transition of ENABLE
+            if not was_enabled:
+                self._launch(c)
+        elif data & CTRL_START:
+            self._launch(c)
+
+    # Channel control
+
+    def _reset(self, c: _Channel):
+        if c.task is not None:
+            c.task.cancel()
+            c.task = None
+        c.status = STATUS_IDLE
+        c.ctrl = 0
+        self._clear_int(c)
+
+    def _launch(self, c: _Channel):
+        unit = self.unit_sz
+        if c.size == 0 or (self.max_xfer and c.size > self.max_xfer):
+            self._finish(c, ERR_SIZE)
+        elif c.src % unit or c.dst % unit:
+            self._finish(c, ERR_ALIGN)
+        else:
+            c.status = STATUS_ACTIVE
+            c.start_ns = self.time().as_ns()
+            c.task = asyncio.ensure_future(self._run(c))
+
+    async def _run(self, c: _Channel):
+        unit = self.unit_sz
+        nbytes = c.size * unit
+        err = None
+        try:
+            if c.ctrl & CTRL_TRIG_MODE:
+                # One trigger moves the complete transfer
+                req_id = (c.ctrl & CTRL_TRIG_SEL_MASK) >> CTRL_TRIG_SEL_SHIFT
+                await self.dma.devcpy(
+                    src=c.src, dst=c.dst, sz=nbytes, acc_sz=unit,
+                    chk_sz=c.size, inc_src=True, inc_dst=True, req_id=req_id)
+            else:
+                await self.dma.memcpy(src=c.src, dst=c.dst, sz=nbytes)
+        except PermissionError:
+            # Memories refuse writes to read-only regions
+            err = ERR_DST_ADDR
+        except MemoryAddressError as e:
+            err = ERR_DST_ADDR if e.write else ERR_SRC_ADDR
+        except Exception:
+            err = ERR_XFER
+        c.task = None
+        c.done_ns = self.time().as_ns()
+        self._finish(c, err)
+
+    def _finish(self, c: _Channel, err: int):
+        if err is None:
+            c.status = STATUS_IDLE | STATUS_COMPLETE
+            int_en = c.ctrl & CTRL_INT_EN
+        else:
+            c.status = (STATUS_IDLE | STATUS_ERROR
+                        | (err << STATUS_ERR_CODE_SHIFT))
+            int_en = c.ctrl & CTRL_ERR_INT_EN
+        if int_en:
+            self.int_status |= 1 << c.idx
+            self.irq.set()
+
+    def _clear_int(self, c: _Channel):
+        self.int_status &= ~(1 << c.idx)
+        if not self.int_status:
+            self.irq.clear()
@@ -0,0 +1,218 @@
+
+import dataclasses
+import math
+from typing import Callable, Dict, List
+
+from ..op import DevCpy, MemCpy
+from .align import _access_counts
+from .stats import XferStats
+
+
+@dataclasses.dataclass
+class MemModel(object):
+    """Latency model of a memory, matching the timing of PagedMemory.
+
+    Word accesses take read_ns/write_ns. A burst takes the same plus
+    beat_ns for each 8-byte beat after the first.
+    """
+    read_ns: float = 0
+    write_ns: float = 0
+    beat_ns: float = 0
+    # The memory implements MemoryBurstOp
+    burst: bool = True
+
+    @classmethod
+    def from_paged(cls, mem) -> "MemModel":
+        """Returns the model of a PagedMemory's current delays."""
+        def ns(t):
+            return 0 if t is None else t.as_ns()
+        return cls(ns(mem.read_delay), ns(mem.write_delay), ns(mem.beat_delay))
+
+
+class _Tally(object):
+    """Access counts and time accumulated by an estimate."""
+    __slots__ = ("mem", "reads", "writes", "burst_reads", "burst_writes",
+                 "nbytes", "ns")
+
+    def __init__(self, mem: MemModel):
+        self.mem = mem
+        self.reads = 0
+        self.writes: Dict[int, int] = {}
+        self.burst_reads = 0
+        self.burst_writes = 0
+        self.nbytes = 0
+        self.ns = 0
+
+    def add(self, other: "_Tally", times: int = 1):
+        self.reads += other.reads * times
+        for sz, n in other.writes.items():
+            self.writes[sz] = self.writes.get(sz, 0) + n * times
+        self.burst_reads += other.burst_reads * times
+        self.burst_writes += other.burst_writes * times
+        self.nbytes += other.nbytes * times
+        self.ns += other.ns * times
+
+    def words(self, n_reads: int, writes: Dict[int, int]):
+        self.reads += n_reads
+        n_writes = 0
+        for sz, n in writes.items():
+            self.writes[sz] = self.writes.get(sz, 0) + n
+            self.nbytes += sz * n
+            n_writes += n
+        self.ns += n_reads * self.mem.read_ns + n_writes * self.mem.write_ns
+
+    def bursts(self, nbytes: int, times: int):
+        beats = (nbytes + 7) // 8 - 1
+        self.burst_reads += times
+        self.burst_writes += times
+        self.nbytes += nbytes * times
+        self.ns += times * (self.mem.read_ns + self.mem.write_ns
+                            + 2 * beats * self.mem.beat_ns)
+
+
+@dataclasses.dataclass
+class XferEstimator(object):
+    """Closed-form estimate of DmaOpOpAlg transfers.
+
+    Computes the accesses a transfer makes, per size class, and its
+    duration on the timed path, using the engine's alignment rules. The
+    transfer is assumed to run alone (no arbitration wait), and a device
+    transfer to always have a request pending. Pipelining, prefetch,
+    combining and functional mode are not modeled.
+
+    Results are XferStats records starting at 0 ns, comparable with those
+    the engine returns when `stats` is set. The cost does not grow with
+    the transfer size.
+    """
+    mem: MemModel = dataclasses.field(default_factory=MemModel)
+    max_burst: int = 4096
+    arb_quantum: int = 4096
+
+    @classmethod
+    def for_engine(cls, dma, mem: MemModel) -> "XferEstimator":
+        """Returns an estimator using the burst and quantum settings of
+        the engine dma."""
+        return cls(mem, dma.max_burst, dma.arb_quantum)
+
+    def memcpy(self, src: int, dst: int, sz: int) -> XferStats:
+        """Estimate DmaOpOpAlg.memcpy(src, dst, sz)."""
+        t = _Tally(self.mem)
+        self._memcpy(t, src, dst, sz)
+        return self._result("memcpy", t)
+
+    def memcpy_chain(self, xfers: List[MemCpy]) -> XferStats:
+        """Estimate DmaOpOpAlg.memcpy_chain(xfers)."""
+        t = _Tally(self.mem)
+        for x in xfers:
+            self._memcpy(t, x.src, x.dst, x.sz)
+        return self._result("memcpy_chain", t)
+
+    def devcpy(
+            self,
+            src: int,
+            dst: int,
+            sz: int,
+            acc_sz: int,
+            chk_sz: int,
+            inc_src: bool,
+            inc_dst: bool) -> XferStats:
+        """Estimate DmaOpOpAlg.devcpy with the same arguments (req_id
+        aside)."""
+        t = _Tally(self.mem)
+        self._devcpy(t, src, dst, sz, acc_sz, chk_sz, inc_src, inc_dst)
+        return self._result("devcpy", t)
+
+    def devcpy_chain(self, xfers: List[DevCpy]) -> XferStats:
+        """Estimate DmaOpOpAlg.devcpy_chain(xfers)."""
+        t = _Tally(self.mem)
+        for x in xfers:
+            self._devcpy(t, x.src, x.dst, x.sz, x.acc_sz, x.chk_sz,
+                         x.inc_src, x.inc_dst)
+        return self._result("devcpy_chain", t)
+
+    def _memcpy(self, t: _Tally, src: int, dst: int, sz: int):
+        if not self.mem.burst:
+            self._copy_words(t, src, dst, sz)
+            return
+
+        # Segments end on quantum boundaries of the source
+        q = self.arb_quantum
+        first = sz if not q else min(sz, q - src % q)
+        self._copy_burst(t, src, dst, first)
+        src += first
+        dst += first
+        sz -= first
+        if sz > 0:
+            n_full, last = divmod(sz, q)
+            self._repeat(t, src, dst, q, n_full,
+                         lambda t, s, d: self._copy_burst(t, s, d, q))
+            if last:
+                self._copy_burst(t, src + n_full * q, dst + n_full * q, last)
+
+    def _devcpy(
+            self,
+            t: _Tally,
+            src: int,
+            dst: int,
+            sz: int,
+            acc_sz: int,
+            chk_sz: int,
+            inc_src: bool,
+            inc_dst: bool):
+        chunk = chk_sz * acc_sz
+        n_full, last = divmod(sz, chunk)
+        if inc_src and inc_dst and self.mem.burst:
+            self._repeat(t, src, dst, chunk, n_full,
+                         lambda t, s, d: self._copy_burst(t, s, d, chunk))
+            if last:
+                self._copy_burst(
+                    t, src + n_full * chunk, dst + n_full * chunk, last)
+            return
+
+        # One acc_sz read and write per access; a partial access rounds up
+        n = n_full * chk_sz + (last + acc_sz - 1) // acc_sz
+        t.words(n, {acc_sz: n})
+
+    def _copy_words(self, t: _Tally, src: int, dst: int, sz: int):
+        # Reads split the source range and writes the destination range
+        t.words(sum(_access_counts(src, sz).values()), _access_counts(dst, sz))
+
+    def _copy_burst(self, t: _Tally, src: int, dst: int, sz: int):
+        head = min((-src) & 0x7, sz)
+        if head:
+            self._copy_words(t, src, dst, head)
+        body = (sz - head) & ~0x7
+        n_full, rem = divmod(body, self.max_burst)
+        if n_full:
+            t.bursts(self.max_burst, n_full)
+        if rem:
+            t.bursts(rem, 1)
+        tail = sz - head - body
+        if tail:
+            off = head + body
+            self._copy_words(t, src + off, dst + off, tail)
+
+    def _repeat(
+            self,
+            t: _Tally,
+            src: int,
+            dst: int,
+            step: int,
+            count: int,
+            fn: Callable[[_Tally, int, int], None]):
+        """Add fn(src + i*step, dst + i*step) for i in range(count).
+
+        Costs only depend on the addresses modulo 8, which repeat with a
+        period of at most 8 steps, so each phase is estimated once.
+        """
+        period = 8 // math.gcd(step, 8)
+        for i in range(min(count, period)):
+            sub = _Tally(self.mem)
+            fn(sub, src + i * step, dst + i * step)
+            t.add(sub, (count - i + period - 1) // period)
+
+    def _result(self, kind: str, t: _Tally) -> XferStats:
+        return XferStats(
+            kind=kind, n_xfers=1, start_ns=0, end_ns=t.ns, nbytes=t.nbytes,
+            reads=t.reads, writes=t.writes, burst_reads=t.burst_reads,
+            burst_writes=t.burst_writes)
@@ -0,0 +1,153 @@
+
+import mmap
+import os
+import zuspec.dataclasses as zdc
+from typing import Iterator
+
+from .mem_paged import PagedMemory
+from .ranges import RegionMap
+
+
+class _Region(object):
+    __slots__ = ("base", "end", "mm", "skew", "writable", "path")
+
+    def __init__(self, base, end, mm, skew, writable, path):
+        self.base = base
+        self.end = end
+        self.mm = mm
+        # Offset of 'base' within mm (file offsets are mapped page-aligned)
+        self.skew = skew
+        self.writable = writable
+        self.path = path
+
+
+@zdc.dataclass
+class MmapMemory(PagedMemory):
+    """Memory whose address space may be backed by memory-mapped files.
+
+    map_file() places a file (or a window of it) at a base address. The
+    file is mapped read-only or copy-on-write, so mapping a multi-GB image
+    is O(1) and pages are only brought in when the DMA touches them.
+    Addresses outside any mapped region behave like PagedMemory.
+
+    save() streams a memory range to a file in bounded-size pieces,
+    writing mapped regions directly from the mapping.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._regions = RegionMap()
+
+    def map_file(
+            self,
+            base: int,
+            path: str,
+            offset: int = 0,
+            size: int = None,
+            cow: bool = False) -> int:
+        """Map size bytes of the file at path, starting at offset, at base.
+
+        Args:
+            base: Address at which the first mapped byte appears
+            path: File to map
+            offset: Byte offset within the file
+            size: Number of bytes to map (default: to end of file)
+            cow: If True, writes go to a private copy of the mapped pages.
+                 Otherwise, the region is read-only.
+
+        Returns:
+            Number of bytes mapped
+        """
+        if size is None:
+            size = os.path.getsize(path) - offset
+        if size <= 0:
+            raise ValueError("Empty mapping of %s at offset %d" % (path, offset))
+
+        if self._regions.overlaps(base, base + size):
+            raise ValueError(
+                "Mapping of %s at 0x%x overlaps an existing region" % (path, base))
+
+        skew = offset % mmap.ALLOCATIONGRANULARITY
+        with open(path, "rb") as fp:
+            mm = mmap.mmap(
+                fp.fileno(), size + skew,
+                access=mmap.ACCESS_COPY if cow else mmap.ACCESS_READ,
+                offset=offset - skew)
+
+        self._regions.add(_Region(base, base + size, mm, skew, cow, path))
+        return size
+
+    def unmap(self, base: int):
+        """Remove the region mapped at base."""
+        self._regions.remove(base).mm.close()
+
+    def close(self):
+        """Remove all mapped regions."""
+        for r in self._regions:
+            r.mm.close()
+        self._regions.clear()
+
+    def load(self, addr: int, data: bytes):
+        """Copy data into memory at addr without consuming simulated time."""
+        view = memoryview(data)
+        while len(view):
+            r, n = self._regions.span(addr, len(view))
+            if r is None:
+                super().load(addr, view[:n])
+            elif not r.writable:
+                raise PermissionError(
+                    "Write to read-only mapping of %s at 0x%x" % (r.path, addr))
+            else:
+                off = addr - r.base + r.skew
+                r.mm[off:off + n] = view[:n]
+            addr += n
+            view = view[n:]
+
+    def dump(self, addr: int, nbytes: int) -> bytes:
+        """Return nbytes of memory at addr without consuming simulated time."""
+        r, n = self._regions.span(addr, nbytes)
+        if n == nbytes:
+            if r is None:
+                return super().dump(addr, nbytes)
+            off = addr - r.base + r.skew
+            return r.mm[off:off + nbytes]
+        return b"".join(self._pieces(addr, nbytes, nbytes))
+
+    def save(self, addr: int, nbytes: int, path: str, chunk: int = 1 << 20):
+        """Write nbytes of memory at addr to the file at path.
+
+        At most 'chunk' bytes of unmapped memory are materialized at a time;
+        mapped regions are written directly from the mapping.
+        """
+        with open(path, "wb") as fp:
+            for piece in self._pieces(addr, nbytes, chunk):
+                fp.write(piece)
+
+    def _peek(self, addr: int) -> int:
+        r, n = self._regions.span(addr, 8)
+        if n == 8:
+            if r is None:
+                return super()._peek(addr)
+            off = addr - r.base + r.skew
+            return int.from_bytes(r.mm[off:off + 8], "little")
+        return int.from_bytes(self.dump(addr, 8), "little")
+
+    def _poke(self, addr: int, data: int, size: int):
+        r, n = self._regions.span(addr, size)
+        if r is None and n == size:
+            super()._poke(addr, data, size)
+        else:
+            self.load(addr, (data & ((1 << (8 * size)) - 1)).to_bytes(size, "little"))
+
+    def _pieces(self, addr: int, nbytes: int, chunk: int) -> Iterator:
+        """Yields the contents of [addr, addr+nbytes) in pieces of at most
+        chunk bytes. Mapped pieces are zero-copy views of the mapping."""
+        while nbytes > 0:
+            r, n = self._regions.span(addr, min(nbytes, chunk))
+            if r is None:
+                yield super().dump(addr, n)
+            else:
+                off = addr - r.base + r.skew
+                yield memoryview(r.mm)[off:off + n]
+            addr += n
+            nbytes -= n
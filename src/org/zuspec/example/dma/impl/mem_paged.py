@@ -0,0 +1,130 @@
+
+import zuspec.dataclasses as zdc
+from typing import Dict, Tuple
+
+from ..mem import MemoryBurstOp, MemoryLtOp
+
+
+@zdc.dataclass
+class PagedMemory(MemoryBurstOp, MemoryLtOp, zdc.Component):
+    """Sparse byte-addressable memory backed by fixed-size pages.
+
+    Pages are bytearrays allocated on first write; unwritten memory reads
+    as zero. Implements MemoryOp and MemoryBurstOp with configurable
+    access latency, plus untimed load/dump helpers for preloading and
+    checking memory contents. The MemoryLtOp methods annotate the same
+    read_delay/write_delay rather than waiting for it.
+
+    A burst costs one read_delay/write_delay plus beat_delay for each
+    8-byte beat after the first.
+    """
+
+    page_size: zdc.u32 = zdc.field(default=4096)
+    read_delay: zdc.Time = zdc.field(default=None)
+    write_delay: zdc.Time = zdc.field(default=None)
+    beat_delay: zdc.Time = zdc.field(default=None)
+
+    def __post_init__(self):
+        self._pages: Dict[int, bytearray] = {}
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        """Read 8 bytes starting at addr, returned little-endian."""
+        if self.read_delay is not None:
+            await self.wait(self.read_delay)
+        return self._peek(addr)
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        """Write the low 'size' bytes of data starting at addr."""
+        if self.write_delay is not None:
+            await self.wait(self.write_delay)
+        self._poke(addr, data, size)
+
+    def read_lt(self, addr: zdc.u64, delay: int) -> Tuple[int, int]:
+        """Read 8 bytes starting at addr. Returns (data, delay) with
+        read_delay added to delay."""
+        if self.read_delay is not None:
+            delay += self.read_delay.as_ns()
+        return self._peek(addr), delay
+
+    def write_lt(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8, delay: int) -> int:
+        """Write the low 'size' bytes of data starting at addr. Returns
+        delay with write_delay added."""
+        self._poke(addr, data, size)
+        if self.write_delay is not None:
+            delay += self.write_delay.as_ns()
+        return delay
+
+    async def read_burst(self, addr: zdc.u64, nbytes: zdc.u32) -> bytes:
+        """Read nbytes starting at addr."""
+        await self._burst_wait(self.read_delay, nbytes)
+        return self.dump(addr, nbytes)
+
+    async def write_burst(self, addr: zdc.u64, data: bytes) -> None:
+        """Write data starting at addr."""
+        await self._burst_wait(self.write_delay, len(data))
+        self.load(addr, data)
+
+    def load(self, addr: int, data: bytes):
+        """Copy data into memory at addr without consuming simulated time."""
+        view = memoryview(data)
+        ps = self.page_size
+        while len(view):
+            idx, off = divmod(addr, ps)
+            n = min(ps - off, len(view))
+            page = self._pages.get(idx)
+            if page is None:
+                page = self._pages[idx] = bytearray(ps)
+            page[off:off + n] = view[:n]
+            addr += n
+            view = view[n:]
+
+    def dump(self, addr: int, nbytes: int) -> bytes:
+        """Return nbytes of memory at addr without consuming simulated time."""
+        ps = self.page_size
+        idx, off = divmod(addr, ps)
+        if off + nbytes <= ps:
+            page = self._pages.get(idx)
+            if page is None:
+                return bytes(nbytes)
+            return bytes(page[off:off + nbytes])
+
+        parts = []
+        while nbytes > 0:
+            idx, off = divmod(addr, ps)
+            n = min(ps - off, nbytes)
+            page = self._pages.get(idx)
+            parts.append(bytes(n) if page is None else page[off:off + n])
+            addr += n
+            nbytes -= n
+        return b"".join(parts)
+
+    def _peek(self, addr: int) -> int:
+        idx, off = divmod(addr, self.page_size)
+        if off + 8 <= self.page_size:
+            page = self._pages.get(idx)
+            if page is None:
+                return 0
+            return int.from_bytes(page[off:off + 8], "little")
+        return int.from_bytes(self.dump(addr, 8), "little")
+
+    def _poke(self, addr: int, data: int, size: int):
+        buf = (data & ((1 << (8 * size)) - 1)).to_bytes(size, "little")
+        idx, off = divmod(addr, self.page_size)
+        if off + size <= self.page_size:
+            page = self._pages.get(idx)
+            if page is None:
+                page = self._pages[idx] = bytearray(self.page_size)
+            page[off:off + size] = buf
+        else:
+            self.load(addr, buf)
+
+    def clear(self):
+        """Release all pages."""
+        self._pages.clear()
+
+    async def _burst_wait(self, delay: zdc.Time, nbytes: int):
+        if delay is not None:
+            await self.wait(delay)
+        if self.beat_delay is not None and nbytes > 8:
+            await self.wait(zdc.Time.ns(
+                self.beat_delay.as_ns() * ((nbytes + 7) // 8 - 1)))
@@ -0,0 +1,203 @@
+
+import zuspec.dataclasses as zdc
+
+from ..mem import MemoryAddressError, MemoryOp, _optional_op
+from .ranges import RegionMap
+from .sem import FifoSem
+
+
+class _Target(object):
+    """A region of the address map and the memory it routes to."""
+    __slots__ = ("base", "end", "mem", "skew", "ports", "accesses", "wait_ns")
+
+    def __init__(self, base, end, mem, skew, n_ports):
+        self.base = base
+        self.end = end
+        self.mem = mem
+        # Added to a router address to form the target address
+        self.skew = skew
+        self.ports = FifoSem(n_ports)
+        self.accesses = 0
+        # Total time (ns) accesses spent waiting for a port
+        self.wait_ns = 0
+
+    async def acquire(self):
+        """Wait for one of the target's ports."""
+        self.accesses += 1
+        await self.ports.acquire()
+
+    def release(self):
+        self.ports.release()
+
+
+@zdc.dataclass
+class MemRouter(MemoryOp, zdc.Component):
+    """Address decoder routing memory accesses to several targets.
+
+    map_target() places a memory (any MemoryOp) at a range of the
+    router's address space. Bind the DMA's mem port to the router to give
+    it a system address map, for example DDR, SRAM and a peripheral
+    region, each with its own latency.
+
+    Each target accepts up to `n_ports` accesses at once; further accesses
+    to it wait in FIFO order, while accesses to other targets proceed. To
+    let transfers on different channels reach different targets
+    concurrently, raise the DMA arbiter's n_ports to match: the arbiter
+    then limits outstanding transactions in the engine and the router
+    models contention at each target.
+
+    Accesses spanning a region boundary are split between the targets. A
+    word read that runs off the end of a region into unmapped space reads
+    zeros there; any other access to unmapped addresses raises
+    MemoryAddressError (a ValueError). The burst and backdoor methods are
+    only present if every mapped target has them, so the DMA selects the
+    same paths as it would for the targets themselves.
+    """
+
+    def __post_init__(self):
+        self._targets = RegionMap()
+
+    def map_target(
+            self,
+            base: int,
+            size: int,
+            mem: MemoryOp,
+            n_ports: int = 1,
+            tgt_base: int = None):
+        """Route accesses to [base, base+size) to mem.
+
+        Args:
+            base: First address of the region
+            size: Size of the region in bytes
+            mem: Target memory
+            n_ports: Number of accesses the target serves at once
+            tgt_base: Target address of the region's first byte
+                      (default: base, passing addresses unchanged)
+        """
+        if size <= 0:
+            raise ValueError("Empty region at 0x%x" % base)
+        if n_ports < 1:
+            raise ValueError("Target at 0x%x needs at least one port" % base)
+
+        if self._targets.overlaps(base, base + size):
+            raise ValueError(
+                "Region at 0x%x overlaps an existing region" % base)
+
+        skew = 0 if tgt_base is None else tgt_base - base
+        self._targets.add(_Target(base, base + size, mem, skew, n_ports))
+
+    def unmap(self, base: int):
+        """Remove the region mapped at base."""
+        self._targets.remove(base)
+
+    def target_stats(self, base: int):
+        """Returns (accesses, wait_ns) of the region mapped at base: the
+        number of accesses routed to it and the total time they spent
+        waiting for one of its ports."""
+        t = self._targets.find(base)
+        if t is None or t.base != base:
+            raise KeyError("No region mapped at 0x%x" % base)
+        return t.accesses, t.wait_ns
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        """Read 8 bytes starting at addr, returned little-endian."""
+        t, n = self._targets.span(addr, 8)
+        if t is None:
+            raise MemoryAddressError(addr, False)
+        data = await self._read(t, addr)
+        if n == 8:
+            return data
+
+        # Fill in the bytes beyond the region from the next target(s)
+        data &= (1 << (8 * n)) - 1
+        off = n
+        while off < 8:
+            t, n = self._targets.span(addr + off, 8 - off)
+            if t is not None:
+                part = await self._read(t, addr + off)
+                data |= (part & ((1 << (8 * n)) - 1)) << (8 * off)
+            off += n
+        return data
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        """Write the low 'size' bytes of data starting at addr."""
+        off = 0
+        while off < size:
+            t, n = self._targets.span(addr + off, size - off)
+            if t is None:
+                raise MemoryAddressError(addr + off, True)
+            part = (data >> (8 * off)) & ((1 << (8 * n)) - 1)
+            await self._acquire(t)
+            try:
+                await t.mem.write(addr + off + t.skew, part, n)
+            finally:
+                t.release()
+            off += n
+
+    async def _read_burst(self, addr: zdc.u64, nbytes: zdc.u32) -> bytes:
+        parts = []
+        off = 0
+        while off < nbytes:
+            t, n = self._targets.span(addr + off, nbytes - off)
+            if t is None:
+                raise MemoryAddressError(addr + off, False)
+            await self._acquire(t)
+            try:
+                parts.append(await t.mem.read_burst(addr + off + t.skew, n))
+            finally:
+                t.release()
+            off += n
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    async def _write_burst(self, addr: zdc.u64, data: bytes) -> None:
+        view = memoryview(data)
+        off = 0
+        while off < len(view):
+            t, n = self._targets.span(addr + off, len(view) - off)
+            if t is None:
+                raise MemoryAddressError(addr + off, True)
+            await self._acquire(t)
+            try:
+                await t.mem.write_burst(addr + off + t.skew, view[off:off + n])
+            finally:
+                t.release()
+            off += n
+
+    def _load(self, addr: int, data: bytes):
+        view = memoryview(data)
+        off = 0
+        while off < len(view):
+            t, n = self._targets.span(addr + off, len(view) - off)
+            if t is None:
+                raise MemoryAddressError(addr + off, True)
+            t.mem.load(addr + off + t.skew, view[off:off + n])
+            off += n
+
+    def _dump(self, addr: int, nbytes: int) -> bytes:
+        parts = []
+        off = 0
+        while off < nbytes:
+            t, n = self._targets.span(addr + off, nbytes - off)
+            if t is None:
+                raise MemoryAddressError(addr + off, False)
+            parts.append(t.mem.dump(addr + off + t.skew, n))
+            off += n
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails
+        targets = self.__dict__.get("_targets", ())
+        return _optional_op(self, name, [t.mem for t in targets])
+
+    async def _read(self, t: _Target, addr: int) -> int:
+        await self._acquire(t)
+        try:
+            return await t.mem.read(addr + t.skew)
+        finally:
+            t.release()
+
+    async def _acquire(self, t: _Target):
+        start = self.time().as_ns() if t.ports.locked() else None
+        await t.acquire()
+        if start is not None:
+            t.wait_ns += self.time().as_ns() - start
@@ -1,27 +1,262 @@
 
+import asyncio
+import collections
+import contextvars
+import math
+import struct
 import zuspec.dataclasses as zdc
-from typing import Dict, List
+from typing import Awaitable, Callable, Dict, List, Set, Tuple
 
+from ..handle import XferHandle
+from ..desc import DEVCPY_DESC, DESC_INC_DST, DESC_INC_SRC, MEMCPY_DESC
 from ..mem import MemoryOp
 from ..op import DmaOp, MemCpy, DevCpy
 from ..req import ReqOp
+from .align import _SIZE_MASK, _access_size
+from .arbiter import MemArbiter
+from .csum import CsumMode, _Csum, _CsumMem
+from .ranges import OverlapPolicy, RangeClaim, RangeIndex, self_overlap
+from .sem import FifoSem
+from .stats import XferStats, _StatsMem
+
+
+def _devcpy_ranges(
+        src: int, dst: int, sz: int, acc_sz: int,
+        inc_src: bool, inc_dst: bool) -> tuple:
+    """Returns the (reads, writes) ranges touched by a device copy."""
+    return ([(src, src + (sz if inc_src else acc_sz))],
+            [(dst, dst + (sz if inc_dst else acc_sz))])
+
+
+async def _run_all(*coros):
+    """Run coroutines concurrently until all complete. If one raises, the
+    others are cancelled and awaited before the exception propagates, so
+    none keeps accessing memory after the transfer has failed."""
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _XferCtx(object):
+    """Identifies the transfer running in the current task."""
+    __slots__ = ("ch", "pri", "stats", "csum")
+
+    def __init__(self, ch: int, pri: int, stats: XferStats, csum: _Csum):
+        self.ch = ch
+        self.pri = pri
+        self.stats = stats
+        self.csum = csum
+
+
+_cur_xfer: contextvars.ContextVar = contextvars.ContextVar(
+    "_cur_xfer", default=None)
+
+
+def current_xfer() -> Tuple[int, int]:
+    """Returns (channel, priority) of the DMA transfer running in the
+    calling task, or (-1, 0) outside of a transfer."""
+    x = _cur_xfer.get()
+    if x is None:
+        return -1, 0
+    return x.ch, x.pri
+
+
+class _ReqCredits(object):
+    """Counts outstanding transfer requests for one req_id."""
+    __slots__ = ("count", "armed", "ev", "t_req")
+
+    def __init__(self):
+        self.count = 0
+        # Device transfers currently waiting on these requests
+        self.armed = 0
+        self.ev = zdc.Event()
+        # Time (ns) a request last arrived with none pending
+        self.t_req = 0
+
+    async def take(self):
+        """Wait for a request, then consume it."""
+        while self.count == 0:
+            self.ev.clear()
+            await self.ev.wait()
+        self.count -= 1
 
 
 @zdc.dataclass
 class DmaOpOpAlg(DmaOp, ReqOp, zdc.Component):
-    """DMA engine with no fixed channels. Uses MemoryOp for memory access
-    and implements ReqOp for device transfer request control."""
+    """DMA engine with a pool of n_channels channels. Uses MemoryOp for
+    memory access and implements ReqOp for device transfer request control.
+
+    Each memcpy, devcpy, or chain occupies one channel until it completes;
+    further transfers wait for a free channel. Transfers on different
+    channels overlap in simulated time, limited by the number of memory
+    transactions the arbiter allows in flight (arb.n_ports).
+
+    With a non-zero pipeline_depth, word-path reads are issued up to that
+    many accesses ahead of the writes that consume them, so a read and a
+    write may be in flight at the same time.
+
+    Setting `lt_quantum` selects a loosely-timed word path when the memory
+    implements MemoryLtOp. Accesses complete immediately and annotate
+    their latency to a local delay. The engine waits out the accumulated
+    delay when it reaches the quantum, before releasing the memory port,
+    and at the end of each chunk or copy. The total time is the same as
+    on the timed path, but other transfers only observe it at those
+    synchronization points. The loosely-timed path takes precedence over
+    pipeline_depth.
+
+    Setting `functional` switches to an untimed mode in which copies whose
+    memory implements MemoryBackdoorOp are performed as a single bulk copy.
+    The end memory state is the same as that of the timed path. The mode
+    may be toggled between transfers.
+
+    Transfers request the memory port from `arb` at their priority. A
+    memcpy is re-arbitrated every arb_quantum bytes, and a device transfer
+    once per chunk, so a long low-priority copy cannot hold off a
+    high-priority transfer for more than one quantum.
+
+    Setting `devcpy_prefetch` lets a devcpy from an incrementing source
+    read up to that many chunks into a staging buffer ahead of the
+    device's requests, so a request only waits for the chunk's writes.
+    Memory-to-memory chunks that use bursts or the functional path are
+    not prefetched.
+
+    Setting `combine` changes how a devcpy moves data between a fixed
+    device address and incrementing memory when acc_sz is below 8. The
+    device side still sees one acc_sz access per element. On the memory
+    side, each chunk is gathered into, or split from, a buffer, which is
+    written or read with the widest aligned accesses, or bursts when the
+    memory supports them.
+
+    The submit_* methods queue a transfer and return an XferHandle without
+    waiting for it. Queued transfers are run by up to n_channels worker
+    coroutines, which are started when work is queued and exit when the
+    queue is empty.
+
+    Setting `stats` counts each transfer's accesses, bytes, arbitration
+    wait and request latency into an XferStats record. When clear, no
+    counting code runs on the access path.
+
+    Setting `overlap` checks the source and destination ranges of each
+    transfer. A transfer whose destination overlaps its own source raises
+    ValueError. One that conflicts with an in-flight transfer (a write
+    overlapping the other's reads or writes, or a read overlapping its
+    writes) waits for it to complete (SERIALIZE) or raises ValueError
+    (REJECT). Disjoint transfers proceed in parallel. Strided transfers
+    are checked over their bounding ranges; descriptor chains in memory
+    are not checked.
+
+    Setting `csum_mode` computes a checksum of the data each transfer
+    writes, as it is written, and returns it in the transfer's XferStats
+    record (access counters are only collected if `stats` is also set).
+    """
     
     mem: MemoryOp = zdc.port()
+
+    # Largest burst issued to a MemoryBurstOp memory (bytes, multiple of 8)
+    max_burst: zdc.u32 = zdc.field(default=4096)
     
-    _mem_l: zdc.Lock = zdc.field()
-    # Map of req_id -> Event for device transfer synchronization
-    _req_events: Dict[zdc.i32, zdc.Event] = zdc.field(default_factory=dict)
+    # Bytes moved per memory-port grant (0 holds the port for the whole copy)
+    arb_quantum: zdc.u32 = zdc.field(default=4096)
+
+    # Functional mode: copy through MemoryBackdoorOp, taking sz/functional_bw
+    # ns of simulated time (0 bytes/ns: no time at all)
+    functional: bool = zdc.field(default=False)
+    functional_bw: float = zdc.field(default=0.0)
+
+    # Reads issued ahead of writes (0: each write waits for its read)
+    pipeline_depth: zdc.u32 = zdc.field(default=0)
+
+    # Descriptors fetched ahead of the one executing (0: fetch on demand)
+    desc_prefetch: zdc.u32 = zdc.field(default=1)
+
+    # Loosely-timed word path: annotated delay is synchronized once it
+    # reaches this quantum (None: wait on every access)
+    lt_quantum: zdc.Time = zdc.field(default=None)
+
+    # Chunks of an incrementing-source devcpy read ahead of the device's
+    # requests (0: read each chunk when it is requested)
+    devcpy_prefetch: zdc.u32 = zdc.field(default=0)
+
+    # Combine the narrow accesses of a devcpy between a device FIFO and
+    # incrementing memory into wide memory accesses
+    combine: bool = zdc.field(default=False)
+
+    # Number of transfers that may be active concurrently
+    n_channels: zdc.u32 = zdc.field(default=4)
+
+    arb: MemArbiter = zdc.field()
+
+    # Requests held per req_id, whether or not a devcpy is armed for it.
+    # Requests beyond this are dropped.
+    max_pending_req: zdc.u32 = zdc.field(default=64)
+
+    # Collect per-transfer statistics. When set, transfer methods return
+    # an XferStats record, and totals are kept in stats_total and, per
+    # priority, in stats_pri.
+    stats: bool = zdc.field(default=False)
+    stats_total: XferStats = zdc.field(default_factory=XferStats)
+    stats_pri: Dict[int, XferStats] = zdc.field(default_factory=dict)
+
+    # Checksum computed over the data written by each transfer
+    csum_mode: CsumMode = zdc.field(default=CsumMode.NONE)
+
+    # Handling of transfers whose address ranges overlap themselves or an
+    # in-flight transfer
+    overlap: OverlapPolicy = zdc.field(default=OverlapPolicy.NONE)
+
+    # Transfers that may be queued by submit_* (0: no limit). Submitters
+    # wait while the queue is full.
+    submit_depth: zdc.u32 = zdc.field(default=0)
+
+    # Map of req_id -> pending request credits for device transfers
+    _req_credits: Dict[zdc.i32, "_ReqCredits"] = zdc.field(default_factory=dict)
+    # Channel ids in use, and the semaphore transfers wait on for a channel
+    _ch_busy: Set[int] = zdc.field(default_factory=set)
+    _ch_sem: FifoSem = zdc.field(default_factory=FifoSem)
+    # Submitted transfers: (handle, method, args), the worker count, and
+    # the running worker tasks
+    _work: collections.deque = zdc.field(default_factory=collections.deque)
+    _work_space: zdc.Event = zdc.field(default=None)
+    _n_workers: int = zdc.field(default=0)
+    _workers: Set[asyncio.Task] = zdc.field(default_factory=set)
+    # Address ranges of in-flight transfers, when overlap is checked
+    _ranges: RangeIndex = zdc.field(default_factory=RangeIndex)
 
     async def req_transfer(self, id: zdc.i32):
-        """Request a transfer for the given id."""
-        if id in self._req_events:
-            self._req_events[id].set()
+        """Request a transfer for the given id.
+
+        Each request is a credit for one chunk. Requests are counted, so
+        back-to-back requests are not lost, and requests made before a
+        devcpy arms the id are held for it, up to max_pending_req. Device
+        transfers running concurrently on one id share its requests.
+        """
+        rc = self._req_credits.get(id)
+        if rc is None:
+            rc = self._req_credits[id] = _ReqCredits()
+        if rc.count < self.max_pending_req:
+            if self.stats and rc.count == 0:
+                rc.t_req = self.time().as_ns()
+            rc.count += 1
+            rc.ev.set()
+
+    def _arm_req(self, req_id: int) -> "_ReqCredits":
+        rc = self._req_credits.get(req_id)
+        if rc is None:
+            rc = self._req_credits[req_id] = _ReqCredits()
+        rc.armed += 1
+        return rc
+
+    def _disarm_req(self, req_id: int):
+        # Unconsumed requests remain pending for the next transfer, and
+        # the credits stay while other transfers on the id are armed
+        rc = self._req_credits[req_id]
+        rc.armed -= 1
+        if rc.armed == 0 and rc.count == 0:
+            del self._req_credits[req_id]
 
     async def memcpy(
             self,
@@ -31,39 +266,669 @@ class DmaOpOpAlg(DmaOp, ReqOp, zdc.Component):
             pri: zdc.i32 = 0):
         """Copy memory from src to dst.
         
-        Performs narrow accesses until 8-byte aligned, then wide accesses.
+        Performs narrow accesses until 8-byte aligned, then wide accesses,
+        keeping reads aligned on src and writes aligned on dst even when
+        the two alignments differ. When the bound memory implements
+        MemoryBurstOp, the aligned body is moved with bursts of up to
+        max_burst bytes. The memory port is re-arbitrated at pri every
+        arb_quantum bytes.
+
+        Returns the transfer's XferStats record if stats or csum_mode is
+        set.
         """
-        await self._mem_l.acquire()
+        claim = await self._claim([([(src, src + sz)], [(dst, dst + sz)])])
+        ch = await self._acquire_channel()
+        ctx, token = self._xfer_begin("memcpy", ch, pri)
         try:
-            remaining = sz
-            while remaining > 0:
-                # Determine access size based on alignment and remaining bytes
-                # Use the largest power-of-2 size that is both aligned and fits
-                align = src & 0x7  # Low 3 bits give alignment
-                if align == 0 and remaining >= 8:
-                    xfer_sz = 8
-                elif (align & 0x3) == 0 and remaining >= 4:
-                    xfer_sz = 4
-                elif (align & 0x1) == 0 and remaining >= 2:
-                    xfer_sz = 2
+            await self._memcpy(src, dst, sz, pri)
+        finally:
+            self._xfer_end(ctx, token)
+            self._release_channel(ch)
+            self._unclaim(claim)
+        return ctx.stats
+
+    async def submit_memcpy(
+            self,
+            src: zdc.uptr,
+            dst: zdc.uptr,
+            sz: zdc.u32,
+            pri: zdc.i32 = 0) -> XferHandle:
+        """Queue a memcpy. Returns a handle that completes with it."""
+        return await self._submit(self.memcpy, (src, dst, sz, pri))
+
+    async def submit_memcpy_chain(
+            self,
+            xfers: List[MemCpy],
+            pri: zdc.i32 = 0) -> XferHandle:
+        """Queue a memcpy_chain. Returns a handle that completes with it."""
+        return await self._submit(self.memcpy_chain, (xfers, pri))
+
+    async def submit_devcpy(
+            self,
+            src: zdc.uptr,
+            dst: zdc.uptr,
+            sz: zdc.u32,
+            acc_sz: zdc.u8,
+            chk_sz: zdc.u32,
+            inc_src: bool,
+            inc_dst: bool,
+            req_id: zdc.i32,
+            pri: zdc.i32 = 0) -> XferHandle:
+        """Queue a devcpy. Returns a handle that completes with it."""
+        return await self._submit(
+            self.devcpy,
+            (src, dst, sz, acc_sz, chk_sz, inc_src, inc_dst, req_id, pri))
+
+    async def submit_devcpy_chain(
+            self,
+            xfers: List[DevCpy],
+            req_id: zdc.i32,
+            pri: zdc.i32 = 0) -> XferHandle:
+        """Queue a devcpy_chain. Returns a handle that completes with it."""
+        return await self._submit(self.devcpy_chain, (xfers, req_id, pri))
+
+    async def _submit(self, method: Callable, args: tuple) -> XferHandle:
+        while self.submit_depth and len(self._work) >= self.submit_depth:
+            if self._work_space is None:
+                self._work_space = zdc.Event()
+            self._work_space.clear()
+            await self._work_space.wait()
+
+        handle = XferHandle()
+        self._work.append((handle, method, args))
+        if self._n_workers < self.n_channels:
+            self._n_workers += 1
+            # Hold a reference so the running task is not collected
+            task = asyncio.ensure_future(self._worker())
+            self._workers.add(task)
+            task.add_done_callback(self._workers.discard)
+        return handle
+
+    async def _worker(self):
+        """Run queued transfers until the queue is empty."""
+        try:
+            while self._work:
+                handle, method, args = self._work.popleft()
+                if self._work_space is not None:
+                    self._work_space.set()
+                try:
+                    result = await method(*args)
+                except Exception as e:
+                    handle._complete(None, e)
                 else:
-                    xfer_sz = 1
-                
-                data = await self.mem.read(src)
-                await self.mem.write(dst, data, xfer_sz)
-                src += xfer_sz
-                dst += xfer_sz
-                remaining -= xfer_sz
+                    handle._complete(result, None)
         finally:
-            self._mem_l.release()
+            self._n_workers -= 1
+
+    async def _memcpy(self, src: int, dst: int, sz: int, pri: int):
+        if self.functional and self._has_backdoor():
+            await self._copy_functional(src, dst, sz)
+            return
+
+        if not self._has_burst():
+            await self._copy_words(src, dst, sz, pri)
+            return
+
+        quantum = self.arb_quantum
+        while sz > 0:
+            nbytes = sz
+            if quantum:
+                # Keep segment boundaries quantum-aligned on the source
+                nbytes = min(sz, quantum - (src % quantum))
+            await self._arb_acquire(pri)
+            try:
+                await self._copy_burst(src, dst, nbytes)
+            finally:
+                self.arb.release()
+            src += nbytes
+            dst += nbytes
+            sz -= nbytes
+
+    async def _claim(self, parts: List[tuple]) -> RangeClaim:
+        """Claim the address ranges of a transfer, given as a list of
+        (reads, writes) range lists, one per element of the transfer.
+        Returns the claim, or None if overlap is not checked."""
+        if not self.overlap:
+            return None
+        reads = []
+        writes = []
+        for rd, wr in parts:
+            rd = [r for r in rd if r[1] > r[0]]
+            wr = [r for r in wr if r[1] > r[0]]
+            if self_overlap(rd, wr):
+                raise ValueError(
+                    "Transfer destination overlaps its source: %s -> %s" % (
+                        ", ".join("0x%x-0x%x" % r for r in rd),
+                        ", ".join("0x%x-0x%x" % r for r in wr)))
+            reads.extend(rd)
+            writes.extend(wr)
+
+        while True:
+            other = self._ranges.conflict(reads, writes)
+            if other is None:
+                return self._ranges.add(reads, writes)
+            if self.overlap == OverlapPolicy.REJECT:
+                raise ValueError(
+                    "Transfer conflicts with an in-flight transfer")
+            await other.wait()
+
+    def _unclaim(self, claim: RangeClaim):
+        if claim is not None:
+            self._ranges.remove(claim)
+
+    async def _acquire_channel(self) -> int:
+        """Wait for a free channel. Returns the channel id."""
+        self._ch_sem.limit = self.n_channels
+        await self._ch_sem.acquire()
+        ch = 0
+        while ch in self._ch_busy:
+            ch += 1
+        self._ch_busy.add(ch)
+        return ch
+
+    def _release_channel(self, ch: int):
+        self._ch_busy.discard(ch)
+        self._ch_sem.release()
+
+    async def _arb_acquire(self, pri: int):
+        """Acquire the memory port, accounting the wait to the current
+        transfer's statistics."""
+        x = _cur_xfer.get() if self.stats else None
+        if x is None or x.stats is None:
+            await self.arb.acquire(pri)
+            return
+        start = self.time().as_ns()
+        await self.arb.acquire(pri)
+        x.stats.arb_wait_ns += self.time().as_ns() - start
+
+    def _mem(self):
+        """Returns the memory port, wrapped to count accesses and compute
+        the checksum when the current transfer collects them."""
+        x = _cur_xfer.get() if self.stats or self.csum_mode else None
+        if x is None:
+            return self.mem
+        mem = self.mem
+        if self.stats and x.stats is not None:
+            mem = _StatsMem(mem, x.stats)
+        if x.csum is not None:
+            mem = _CsumMem(mem, x.csum)
+        return mem
+
+    def _xfer_begin(self, kind: str, ch: int, pri: int):
+        """Make a transfer on channel ch current in the calling task,
+        starting its statistics record if stats are enabled. Returns
+        (context, token) for _xfer_end."""
+        st = None
+        csum = None
+        if self.stats or self.csum_mode:
+            st = XferStats(
+                kind=kind, pri=pri, n_xfers=1, start_ns=self.time().as_ns())
+        if self.csum_mode:
+            csum = _Csum(self.csum_mode)
+        ctx = _XferCtx(ch, pri, st, csum)
+        return ctx, _cur_xfer.set(ctx)
+
+    def _xfer_end(self, ctx: _XferCtx, token):
+        _cur_xfer.reset(token)
+        st = ctx.stats
+        if st is None:
+            return
+        st.end_ns = self.time().as_ns()
+        if ctx.csum is not None:
+            st.csum = ctx.csum.value
+        if not self.stats:
+            return
+        self.stats_total.add(st)
+        agg = self.stats_pri.get(st.pri)
+        if agg is None:
+            agg = self.stats_pri[st.pri] = XferStats(pri=st.pri)
+        agg.add(st)
+
+    def _has_burst(self) -> bool:
+        """Returns True if the bound memory implements MemoryBurstOp."""
+        return (hasattr(self.mem, "read_burst")
+                and hasattr(self.mem, "write_burst"))
+
+    def _lt_quantum_ns(self) -> int:
+        """Returns the loosely-timed quantum in ns, or None if accesses
+        are timed individually."""
+        if (self.lt_quantum is None or not hasattr(self.mem, "read_lt")
+                or not hasattr(self.mem, "write_lt")):
+            return None
+        return self.lt_quantum.as_ns()
+
+    async def _lt_sync(self, delay: int):
+        """Wait out delay (ns) annotated by loosely-timed accesses."""
+        if delay:
+            await self.wait(zdc.Time.ns(delay))
+
+    def _has_backdoor(self) -> bool:
+        """Returns True if the bound memory implements MemoryBackdoorOp."""
+        return hasattr(self.mem, "load") and hasattr(self.mem, "dump")
+
+    async def _copy_functional(self, src: int, dst: int, sz: int):
+        """Copy as a single untimed bulk operation."""
+        mem = self._mem()
+        mem.load(dst, mem.dump(src, sz))
+        if self.functional_bw > 0:
+            await self.wait(zdc.Time.ns(math.ceil(sz / self.functional_bw)))
+
+    async def _copy_words(self, src: int, dst: int, sz: int, pri: int = None):
+        """Copy using single-word accesses.
+
+        Reads are naturally aligned on src and writes on dst, each using the
+        largest power-of-2 size (up to 8) that is aligned and fits. Data is
+        realigned through a shift buffer, so copies whose src and dst have
+        different alignments still use wide accesses on both sides.
+
+        If pri is given, the memory port is acquired at pri and re-arbitrated
+        every arb_quantum bytes. Otherwise, the caller holds the port.
+        """
+        lt_quantum = self._lt_quantum_ns()
+        if lt_quantum is not None:
+            await self._copy_words_lt(src, dst, sz, pri, lt_quantum)
+            return
+        if self.pipeline_depth:
+            await self._copy_words_pipelined(src, dst, sz, pri)
+            return
+
+        mem = self._mem()
+        await self._realign_words(src, dst, sz, pri, mem.read, mem.write)
+
+    async def _copy_words_lt(
+            self, src: int, dst: int, sz: int, pri: int, lt_quantum: int):
+        """Loosely-timed variant of _copy_words, using MemoryLtOp.
+
+        Accesses annotate their time instead of waiting for it. The
+        annotated delay is waited for once it reaches lt_quantum, before
+        the memory port is re-arbitrated, and at the end of the copy.
+        """
+        mem = self._mem()
+        delay = 0   # Annotated time (ns) not yet waited for
+
+        async def read(addr: int) -> int:
+            nonlocal delay
+            data, delay = mem.read_lt(addr, delay)
+            return data
+
+        async def write(addr: int, data: int, size: int):
+            nonlocal delay
+            delay = mem.write_lt(addr, data, size, delay)
+
+        async def sync(force: bool):
+            nonlocal delay
+            if force or delay >= lt_quantum:
+                await self._lt_sync(delay)
+                delay = 0
+
+        await self._realign_words(src, dst, sz, pri, read, write, sync)
+
+    async def _realign_words(
+            self,
+            src: int,
+            dst: int,
+            sz: int,
+            pri: int,
+            read: Callable[[int], Awaitable],
+            write: Callable[[int, int, int], Awaitable],
+            sync: Callable[[bool], Awaitable] = None):
+        """Word copy loop of _copy_words and _copy_words_lt.
+
+        read(addr) and write(addr, data, size) perform the accesses. If
+        given, sync(force) is awaited before each write, with force set
+        when the memory port is about to be re-arbitrated, and once more,
+        forced, at the end of the copy.
+        """
+        quantum = self.arb_quantum if pri is not None else 0
+        held = False
+        granted = 0
+        buf = 0     # Bytes read but not yet written, little-endian
+        nbuf = 0
+        rd_left = sz
+        wr_left = sz
+        try:
+            if pri is not None:
+                await self._arb_acquire(pri)
+                held = True
+            while wr_left > 0:
+                if quantum and granted >= quantum:
+                    if sync is not None:
+                        await sync(True)
+                    # The shift buffer carries over to the next grant
+                    self.arb.release()
+                    held = False
+                    await self._arb_acquire(pri)
+                    held = True
+                    granted = 0
+                elif sync is not None:
+                    await sync(False)
+
+                wr_sz = _access_size(dst, wr_left)
+                while nbuf < wr_sz:
+                    rd_sz = _access_size(src, rd_left)
+                    data = await read(src)
+                    buf |= (data & _SIZE_MASK[rd_sz]) << (8 * nbuf)
+                    nbuf += rd_sz
+                    src += rd_sz
+                    rd_left -= rd_sz
+
+                await write(dst, buf & _SIZE_MASK[wr_sz], wr_sz)
+                buf >>= 8 * wr_sz
+                nbuf -= wr_sz
+                dst += wr_sz
+                wr_left -= wr_sz
+                granted += wr_sz
+            if sync is not None:
+                await sync(True)
+        finally:
+            if held:
+                self.arb.release()
+
+    async def _copy_words_pipelined(
+            self, src: int, dst: int, sz: int, pri: int = None):
+        """Pipelined form of _copy_words.
+
+        Within each arbitration quantum, a reader issues aligned reads into
+        a FIFO of pipeline_depth entries while a writer drains it into
+        aligned writes. Bytes that do not fill a whole aligned write at the
+        end of a quantum carry over to the next one.
+        """
+        mem = self._mem()
+        quantum = self.arb_quantum if pri is not None else 0
+        buf = 0     # Bytes read but not yet written, little-endian
+        nbuf = 0
+        wr_left = sz
+
+        async def reader(src: int, nbytes: int, fifo: asyncio.Queue):
+            while nbytes > 0:
+                rd_sz = _access_size(src, nbytes)
+                data = await mem.read(src)
+                await fifo.put((data & _SIZE_MASK[rd_sz], rd_sz))
+                src += rd_sz
+                nbytes -= rd_sz
+            await fifo.put(None)
+
+        async def writer(fifo: asyncio.Queue):
+            nonlocal buf, nbuf, dst, wr_left
+            done = False
+            while wr_left > 0:
+                wr_sz = _access_size(dst, wr_left)
+                while nbuf < wr_sz and not done:
+                    item = await fifo.get()
+                    if item is None:
+                        done = True
+                    else:
+                        buf |= item[0] << (8 * nbuf)
+                        nbuf += item[1]
+                if nbuf < wr_sz:
+                    # Reads for this quantum are exhausted
+                    break
+                await mem.write(dst, buf & _SIZE_MASK[wr_sz], wr_sz)
+                buf >>= 8 * wr_sz
+                nbuf -= wr_sz
+                dst += wr_sz
+                wr_left -= wr_sz
+            if not done:
+                await fifo.get()
+
+        while sz > 0:
+            nbytes = sz
+            if quantum:
+                nbytes = min(sz, quantum - (src % quantum))
+            fifo = asyncio.Queue(self.pipeline_depth)
+            if pri is not None:
+                await self._arb_acquire(pri)
+            try:
+                await _run_all(reader(src, nbytes, fifo), writer(fifo))
+            finally:
+                if pri is not None:
+                    self.arb.release()
+            src += nbytes
+            sz -= nbytes
+
+    async def _copy_burst(self, src: int, dst: int, sz: int):
+        """Copy using bursts for the 8-byte-aligned body of the transfer.
+
+        The unaligned head and the sub-word tail use word accesses.
+        """
+        mem = self._mem()
+        head = min((-src) & 0x7, sz)
+        if head:
+            await self._copy_words(src, dst, head)
+            src += head
+            dst += head
+            sz -= head
+
+        body = sz & ~0x7
+        while body > 0:
+            nbytes = min(body, self.max_burst)
+            data = await mem.read_burst(src, nbytes)
+            await mem.write_burst(dst, data)
+            src += nbytes
+            dst += nbytes
+            body -= nbytes
+            sz -= nbytes
+
+        if sz:
+            await self._copy_words(src, dst, sz)
+
+    async def fill(
+            self,
+            dst: zdc.uptr,
+            pattern: zdc.u64,
+            sz: zdc.u32,
+            pattern_width: zdc.u8 = 1,
+            pri: zdc.i32 = 0):
+        """Fill sz bytes at dst with the low pattern_width bytes of pattern,
+        repeated. The pattern is anchored at dst.
+
+        Only writes are issued: aligned word writes for the unaligned head
+        and tail, and wide writes (or bursts, when the memory implements
+        MemoryBurstOp) for the body. The memory port is re-arbitrated at
+        pri every arb_quantum bytes.
+
+        Returns the transfer's XferStats record if stats or csum_mode is
+        set.
+        """
+        if pattern_width not in _SIZE_MASK:
+            raise ValueError("pattern_width must be 1, 2, 4 or 8, not %d" % (
+                pattern_width,))
+        claim = await self._claim([([], [(dst, dst + sz)])])
+        ch = await self._acquire_channel()
+        ctx, token = self._xfer_begin("fill", ch, pri)
+        try:
+            await self._fill(dst, pattern, sz, pattern_width, pri)
+        finally:
+            self._xfer_end(ctx, token)
+            self._release_channel(ch)
+            self._unclaim(claim)
+        return ctx.stats
+
+    async def _fill(self, dst: int, pattern: int, sz: int, width: int, pri: int):
+        # 16 bytes of pattern: the 8-byte word at any phase is pat[p:p+8]
+        pat = (pattern & _SIZE_MASK[width]).to_bytes(width, "little") \
+            * (16 // width)
+        mem = self._mem()
+
+        if self.functional and self._has_backdoor():
+            mem.load(dst, pat[:width] * (sz // width) + pat[:sz % width])
+            if self.functional_bw > 0:
+                await self.wait(zdc.Time.ns(math.ceil(sz / self.functional_bw)))
+            return
+
+        burst = self._has_burst()
+        quantum = self.arb_quantum
+        off = 0
+        while off < sz:
+            nbytes = sz - off
+            if quantum:
+                nbytes = min(nbytes, quantum - ((dst + off) % quantum))
+            await self._arb_acquire(pri)
+            try:
+                await self._fill_seg(
+                    mem, dst + off, nbytes, pat, off % width, width, burst)
+            finally:
+                self.arb.release()
+            off += nbytes
+
+    async def _fill_seg(
+            self,
+            mem,
+            addr: int,
+            nbytes: int,
+            pat: bytes,
+            phase: int,
+            width: int,
+            burst: bool):
+        """Write nbytes of pattern at addr, starting at byte phase of it."""
+        while nbytes > 0:
+            if burst and not (addr & 0x7) and nbytes >= 8:
+                # Burst lengths are multiples of 8, so the phase is unchanged
+                body = nbytes & ~0x7
+                unit = pat[phase:phase + width]
+                buf = None
+                while body > 0:
+                    n = min(body, self.max_burst)
+                    if buf is None or len(buf) != n:
+                        buf = unit * (n // width)
+                    await mem.write_burst(addr, buf)
+                    addr += n
+                    body -= n
+                    nbytes -= n
+                continue
+
+            wr_sz = _access_size(addr, nbytes)
+            data = int.from_bytes(pat[phase:phase + 8], "little")
+            await mem.write(addr, data & _SIZE_MASK[wr_sz], wr_sz)
+            addr += wr_sz
+            nbytes -= wr_sz
+            phase = (phase + wr_sz) % width
+
+    async def memcpy_2d(
+            self,
+            src: zdc.uptr,
+            dst: zdc.uptr,
+            row_sz: zdc.u32,
+            n_rows: zdc.u32,
+            src_stride: zdc.u32,
+            dst_stride: zdc.u32,
+            n_planes: zdc.u32 = 1,
+            src_plane_stride: zdc.u32 = 0,
+            dst_plane_stride: zdc.u32 = 0,
+            pri: zdc.i32 = 0):
+        """Copy a strided block of n_planes x n_rows rows of row_sz bytes.
+
+        Row r of plane p is copied from src + p * src_plane_stride +
+        r * src_stride to dst + p * dst_plane_stride + r * dst_stride.
+        Rows are copied under a single grant of the memory port, which is
+        re-arbitrated every arb_quantum bytes rather than per row. Rows
+        that are contiguous on both sides are copied as one block.
+
+        Returns the transfer's XferStats record if stats or csum_mode is
+        set.
+        """
+        claim = None
+        if self.overlap and row_sz and n_rows and n_planes:
+            # Bounding ranges of the source and destination blocks
+            src_end = (src + (n_planes - 1) * src_plane_stride
+                       + (n_rows - 1) * src_stride + row_sz)
+            dst_end = (dst + (n_planes - 1) * dst_plane_stride
+                       + (n_rows - 1) * dst_stride + row_sz)
+            claim = await self._claim([([(src, src_end)], [(dst, dst_end)])])
+        ch = await self._acquire_channel()
+        ctx, token = self._xfer_begin("memcpy_2d", ch, pri)
+        try:
+            await self._memcpy_2d(
+                src, dst, row_sz, n_rows, src_stride, dst_stride,
+                n_planes, src_plane_stride, dst_plane_stride, pri)
+        finally:
+            self._xfer_end(ctx, token)
+            self._release_channel(ch)
+            self._unclaim(claim)
+        return ctx.stats
+
+    async def _memcpy_2d(
+            self,
+            src: int,
+            dst: int,
+            row_sz: int,
+            n_rows: int,
+            src_stride: int,
+            dst_stride: int,
+            n_planes: int,
+            src_plane_stride: int,
+            dst_plane_stride: int,
+            pri: int):
+        if src_stride == row_sz and dst_stride == row_sz:
+            row_sz *= n_rows
+            n_rows = 1
+            if (n_planes > 1 and src_plane_stride == row_sz
+                    and dst_plane_stride == row_sz):
+                row_sz *= n_planes
+                n_planes = 1
+        if row_sz == 0:
+            return
+
+        rows = [(src + p * src_plane_stride + r * src_stride,
+                 dst + p * dst_plane_stride + r * dst_stride)
+                for p in range(n_planes) for r in range(n_rows)]
+
+        if self.functional and self._has_backdoor():
+            mem = self._mem()
+            for s, d in rows:
+                mem.load(d, mem.dump(s, row_sz))
+            if self.functional_bw > 0:
+                await self.wait(zdc.Time.ns(
+                    math.ceil(row_sz * len(rows) / self.functional_bw)))
+            return
+
+        # Both copy routines expect the caller to hold the port
+        copy = self._copy_burst if self._has_burst() else self._copy_words
+        quantum = self.arb_quantum
+        held = False
+        granted = 0
+        try:
+            await self._arb_acquire(pri)
+            held = True
+            for s, d in rows:
+                left = row_sz
+                while left > 0:
+                    if quantum and granted >= quantum:
+                        self.arb.release()
+                        held = False
+                        await self._arb_acquire(pri)
+                        held = True
+                        granted = 0
+                    n = min(left, quantum - granted) if quantum else left
+                    await copy(s, d, n)
+                    s += n
+                    d += n
+                    left -= n
+                    granted += n
+        finally:
+            if held:
+                self.arb.release()
 
     async def memcpy_chain(
             self,
             xfers: List[MemCpy],
             pri: zdc.i32 = 0):
-        """Execute a chain of memory copies."""
-        for xfer in xfers:
-            await self.memcpy(xfer.src, xfer.dst, xfer.sz, pri)
+        """Execute a chain of memory copies on a single channel."""
+        claim = None
+        if self.overlap:
+            claim = await self._claim([
+                ([(x.src, x.src + x.sz)], [(x.dst, x.dst + x.sz)])
+                for x in xfers])
+        ch = await self._acquire_channel()
+        ctx, token = self._xfer_begin("memcpy_chain", ch, pri)
+        try:
+            for xfer in xfers:
+                await self._memcpy(xfer.src, xfer.dst, xfer.sz, pri)
+        finally:
+            self._xfer_end(ctx, token)
+            self._release_channel(ch)
+            self._unclaim(claim)
+        return ctx.stats
 
     async def devcpy(
             self,
@@ -77,38 +942,253 @@ class DmaOpOpAlg(DmaOp, ReqOp, zdc.Component):
             req_id: zdc.i32,
             pri: zdc.i32 = 0):
         """Device copy with chunk-based request synchronization."""
-        # Create event for this request id
-        ev = zdc.Event()
-        self._req_events[req_id] = ev
+        claim = None
+        if self.overlap:
+            claim = await self._claim([_devcpy_ranges(
+                src, dst, sz, acc_sz, inc_src, inc_dst)])
+        ch = await self._acquire_channel()
+        rc = self._arm_req(req_id)
+        ctx, token = self._xfer_begin("devcpy", ch, pri)
         
         try:
-            remaining = sz
-            while remaining > 0:
-                # Wait for device to request a chunk
-                await ev.wait()
-                ev.clear()
-                
-                # Transfer one chunk
-                chunk_bytes = chk_sz * acc_sz
-                xfer_bytes = min(chunk_bytes, remaining)
-                
-                await self._mem_l.acquire()
+            await self._devcpy(
+                rc, src, dst, sz, acc_sz, chk_sz, inc_src, inc_dst, pri)
+        finally:
+            self._xfer_end(ctx, token)
+            self._disarm_req(req_id)
+            self._release_channel(ch)
+            self._unclaim(claim)
+        return ctx.stats
+
+    async def _devcpy(
+            self,
+            rc: "_ReqCredits",
+            src: int,
+            dst: int,
+            sz: int,
+            acc_sz: int,
+            chk_sz: int,
+            inc_src: bool,
+            inc_dst: bool,
+            pri: int):
+        if self.devcpy_prefetch and inc_src and not (inc_dst and (
+                self._has_burst()
+                or (self.functional and self._has_backdoor()))):
+            await self._devcpy_prefetch(
+                rc, src, dst, sz, acc_sz, chk_sz, inc_dst, pri)
+            return
+
+        remaining = sz
+        while remaining > 0:
+            # Wait for device to request a chunk
+            await rc.take()
+            
+            # Transfer one chunk
+            chunk_bytes = chk_sz * acc_sz
+            xfer_bytes = min(chunk_bytes, remaining)
+            
+            await self._arb_acquire(pri)
+            self._note_req_latency(rc)
+            try:
+                src, dst = await self._xfer_chunk(
+                    src, dst, xfer_bytes, acc_sz, inc_src, inc_dst)
+            finally:
+                self.arb.release()
+            
+            remaining -= xfer_bytes
+
+    async def _devcpy_prefetch(
+            self,
+            rc: "_ReqCredits",
+            src: int,
+            dst: int,
+            sz: int,
+            acc_sz: int,
+            chk_sz: int,
+            inc_dst: bool,
+            pri: int):
+        """Device copy from an incrementing source. A reader fills up to
+        devcpy_prefetch chunks of staging buffer without waiting for
+        requests; each request is served by writing a staged chunk."""
+        mem = self._mem()
+        chunk_bytes = chk_sz * acc_sz
+        # Device writes are fed from wide memory reads
+        combine = self.combine and acc_sz < 8 and not inc_dst
+        fifo = asyncio.Queue()
+        # One slot per chunk the staging buffer holds
+        slots = asyncio.Semaphore(self.devcpy_prefetch)
+
+        async def reader(src: int):
+            for off in range(0, sz, chunk_bytes):
+                n = (min(chunk_bytes, sz - off) + acc_sz - 1) // acc_sz
+                await slots.acquire()
+                await self._arb_acquire(pri)
                 try:
-                    chunk_remaining = xfer_bytes
-                    while chunk_remaining > 0:
-                        data = await self.mem.read(src)
-                        await self.mem.write(dst, data, acc_sz)
-                        if inc_src:
+                    if combine:
+                        staged = await self._read_bytes(mem, src, n * acc_sz)
+                        src += n * acc_sz
+                    else:
+                        staged = []
+                        for _ in range(n):
+                            staged.append(await mem.read(src))
                             src += acc_sz
-                        if inc_dst:
-                            dst += acc_sz
-                        chunk_remaining -= acc_sz
                 finally:
-                    self._mem_l.release()
-                
-                remaining -= xfer_bytes
-        finally:
-            del self._req_events[req_id]
+                    self.arb.release()
+                fifo.put_nowait(staged)
+
+        async def writer(dst: int):
+            for _ in range(0, sz, chunk_bytes):
+                # A request is only consumed once its chunk is staged
+                staged = await fifo.get()
+                await rc.take()
+                await self._arb_acquire(pri)
+                self._note_req_latency(rc)
+                try:
+                    if combine:
+                        await self._split_bytes(mem, dst, staged, acc_sz)
+                    else:
+                        for data in staged:
+                            await mem.write(dst, data, acc_sz)
+                            if inc_dst:
+                                dst += acc_sz
+                finally:
+                    self.arb.release()
+                slots.release()
+
+        await _run_all(reader(src), writer(dst))
+
+    async def _read_bytes(self, mem, addr: int, nbytes: int) -> bytes:
+        """Read nbytes at addr with the widest aligned accesses, using
+        bursts for the 8-byte-aligned body if the memory supports them."""
+        burst = self._has_burst()
+        parts = []
+        while nbytes > 0:
+            if burst and not (addr & 0x7) and nbytes >= 8:
+                n = min(nbytes & ~0x7, self.max_burst)
+                parts.append(await mem.read_burst(addr, n))
+            else:
+                n = _access_size(addr, nbytes)
+                data = await mem.read(addr)
+                parts.append((data & _SIZE_MASK[n]).to_bytes(n, "little"))
+            addr += n
+            nbytes -= n
+        return b"".join(parts)
+
+    async def _write_bytes(self, mem, addr: int, data: bytes):
+        """Write data at addr with the widest aligned accesses, using
+        bursts for the 8-byte-aligned body if the memory supports them."""
+        burst = self._has_burst()
+        view = memoryview(data)
+        off = 0
+        while off < len(view):
+            nbytes = len(view) - off
+            if burst and not (addr & 0x7) and nbytes >= 8:
+                n = min(nbytes & ~0x7, self.max_burst)
+                await mem.write_burst(addr, bytes(view[off:off + n]))
+            else:
+                n = _access_size(addr, nbytes)
+                await mem.write(
+                    addr, int.from_bytes(view[off:off + n], "little"), n)
+            addr += n
+            off += n
+
+    async def _split_bytes(self, mem, addr: int, data: bytes, acc_sz: int):
+        """Write data to the fixed address addr, acc_sz bytes at a time."""
+        for off in range(0, len(data), acc_sz):
+            await mem.write(
+                addr, int.from_bytes(data[off:off + acc_sz], "little"), acc_sz)
+
+    def _note_req_latency(self, rc: "_ReqCredits"):
+        """Record the request latency of the current transfer, on the
+        first chunk it serves."""
+        x = _cur_xfer.get() if self.stats else None
+        st = x.stats if x is not None else None
+        if st is not None and st.req_latency_ns is None:
+            now = self.time().as_ns()
+            st.req_latency_ns = now - max(rc.t_req, st.start_ns)
+
+    async def _xfer_chunk(
+            self,
+            src: int,
+            dst: int,
+            nbytes: int,
+            acc_sz: int,
+            inc_src: bool,
+            inc_dst: bool):
+        """Transfer one device chunk. Returns the updated (src, dst).
+
+        Memory-to-memory chunks (both addresses incrementing) use bursts
+        when the memory supports them, or a bulk copy in functional mode.
+        Chunks between a device and memory are combined on the memory
+        side if `combine` is set. Otherwise, each access is acc_sz.
+        """
+        mem = self._mem()
+        if inc_src and inc_dst:
+            if self.functional and self._has_backdoor():
+                await self._copy_functional(src, dst, nbytes)
+                return src + nbytes, dst + nbytes
+            if self._has_burst():
+                await self._copy_burst(src, dst, nbytes)
+                return src + nbytes, dst + nbytes
+        elif self.combine and acc_sz < 8 and (inc_src or inc_dst):
+            total = (nbytes + acc_sz - 1) // acc_sz * acc_sz
+            if inc_dst:
+                buf = bytearray()
+                for _ in range(total // acc_sz):
+                    data = await mem.read(src)
+                    buf += (data & _SIZE_MASK[acc_sz]).to_bytes(acc_sz, "little")
+                await self._write_bytes(mem, dst, buf)
+                return src, dst + total
+            buf = await self._read_bytes(mem, src, total)
+            await self._split_bytes(mem, dst, buf, acc_sz)
+            return src + total, dst
+
+        lt_quantum = self._lt_quantum_ns()
+        if lt_quantum is not None:
+            delay = 0
+            while nbytes > 0:
+                data, delay = mem.read_lt(src, delay)
+                delay = mem.write_lt(dst, data, acc_sz, delay)
+                if delay >= lt_quantum:
+                    await self._lt_sync(delay)
+                    delay = 0
+                if inc_src:
+                    src += acc_sz
+                if inc_dst:
+                    dst += acc_sz
+                nbytes -= acc_sz
+            await self._lt_sync(delay)
+            return src, dst
+
+        if self.pipeline_depth:
+            n = (nbytes + acc_sz - 1) // acc_sz
+            fifo = asyncio.Queue(self.pipeline_depth)
+
+            async def reader(src: int):
+                for _ in range(n):
+                    await fifo.put(await mem.read(src))
+                    if inc_src:
+                        src += acc_sz
+
+            async def writer(dst: int):
+                for _ in range(n):
+                    await mem.write(dst, await fifo.get(), acc_sz)
+                    if inc_dst:
+                        dst += acc_sz
+
+            await _run_all(reader(src), writer(dst))
+            return ((src + n * acc_sz) if inc_src else src,
+                    (dst + n * acc_sz) if inc_dst else dst)
+
+        while nbytes > 0:
+            data = await mem.read(src)
+            await mem.write(dst, data, acc_sz)
+            if inc_src:
+                src += acc_sz
+            if inc_dst:
+                dst += acc_sz
+            nbytes -= acc_sz
+        return src, dst
 
     async def devcpy_chain(
             self,
@@ -116,40 +1196,127 @@ class DmaOpOpAlg(DmaOp, ReqOp, zdc.Component):
             req_id: zdc.i32,
             pri: zdc.i32 = 0):
         """Execute a chain of device copies sharing the same req_id."""
-        # Create event for this request id
-        ev = zdc.Event()
-        self._req_events[req_id] = ev
+        claim = None
+        if self.overlap:
+            claim = await self._claim([
+                _devcpy_ranges(x.src, x.dst, x.sz, x.acc_sz,
+                               x.inc_src, x.inc_dst)
+                for x in xfers])
+        ch = await self._acquire_channel()
+        rc = self._arm_req(req_id)
+        ctx, token = self._xfer_begin("devcpy_chain", ch, pri)
         
         try:
             for xfer in xfers:
-                src = xfer.src
-                dst = xfer.dst
-                remaining = xfer.sz
-                
-                while remaining > 0:
-                    # Wait for device to request a chunk
-                    await ev.wait()
-                    ev.clear()
-                    
-                    # Transfer one chunk
-                    chunk_bytes = xfer.chk_sz * xfer.acc_sz
-                    xfer_bytes = min(chunk_bytes, remaining)
-                    
-                    await self._mem_l.acquire()
-                    try:
-                        chunk_remaining = xfer_bytes
-                        while chunk_remaining > 0:
-                            data = await self.mem.read(src)
-                            await self.mem.write(dst, data, xfer.acc_sz)
-                            if xfer.inc_src:
-                                src += xfer.acc_sz
-                            if xfer.inc_dst:
-                                dst += xfer.acc_sz
-                            chunk_remaining -= xfer.acc_sz
-                    finally:
-                        self._mem_l.release()
-                    
-                    remaining -= xfer_bytes
+                await self._devcpy(
+                    rc, xfer.src, xfer.dst, xfer.sz, xfer.acc_sz,
+                    xfer.chk_sz, xfer.inc_src, xfer.inc_dst, pri)
+        finally:
+            self._xfer_end(ctx, token)
+            self._disarm_req(req_id)
+            self._release_channel(ch)
+            self._unclaim(claim)
+        return ctx.stats
+
+    async def memcpy_desc(
+            self,
+            desc: zdc.uptr,
+            pri: zdc.i32 = 0):
+        """Execute a linked list of MemCpy descriptors held in memory.
+
+        Descriptors are read through the mem port. While one descriptor
+        executes, up to desc_prefetch following descriptors are fetched.
+        """
+        async def execute(fields):
+            _, src, dst, sz = fields
+            await self._memcpy(src, dst, sz, pri)
+
+        ch = await self._acquire_channel()
+        ctx, token = self._xfer_begin("memcpy_desc", ch, pri)
+        try:
+            await self._run_desc_chain(desc, MEMCPY_DESC, pri, execute)
+        finally:
+            self._xfer_end(ctx, token)
+            self._release_channel(ch)
+        return ctx.stats
+
+    async def devcpy_desc(
+            self,
+            desc: zdc.uptr,
+            req_id: zdc.i32,
+            pri: zdc.i32 = 0):
+        """Execute a linked list of DevCpy descriptors held in memory,
+        sharing the same req_id."""
+        ch = await self._acquire_channel()
+        rc = self._arm_req(req_id)
+
+        async def execute(fields):
+            _, src, dst, sz, chk_sz, acc_sz, flags = fields
+            await self._devcpy(
+                rc, src, dst, sz, acc_sz, chk_sz,
+                bool(flags & DESC_INC_SRC), bool(flags & DESC_INC_DST), pri)
+
+        ctx, token = self._xfer_begin("devcpy_desc", ch, pri)
+        try:
+            await self._run_desc_chain(desc, DEVCPY_DESC, pri, execute)
         finally:
-            del self._req_events[req_id]
+            self._xfer_end(ctx, token)
+            self._disarm_req(req_id)
+            self._release_channel(ch)
+        return ctx.stats
+
+    async def _run_desc_chain(
+            self,
+            desc: int,
+            layout: struct.Struct,
+            pri: int,
+            execute: Callable[[tuple], Awaitable]):
+        """Fetch and execute descriptors starting at desc until next is 0."""
+        if not self.desc_prefetch:
+            while desc:
+                fields = await self._fetch_desc(desc, layout, pri)
+                desc = fields[0]
+                await execute(fields)
+            return
+
+        fifo = asyncio.Queue()
+        # One slot per descriptor that may be fetched ahead
+        slots = asyncio.Semaphore(self.desc_prefetch)
 
+        async def fetcher(desc: int):
+            while desc:
+                await slots.acquire()
+                fields = await self._fetch_desc(desc, layout, pri)
+                fifo.put_nowait(fields)
+                desc = fields[0]
+            fifo.put_nowait(None)
+
+        async def executor():
+            while True:
+                fields = await fifo.get()
+                if fields is None:
+                    break
+                slots.release()
+                await execute(fields)
+
+        await _run_all(fetcher(desc), executor())
+
+    async def _fetch_desc(
+            self,
+            addr: int,
+            layout: struct.Struct,
+            pri: int) -> tuple:
+        """Read and decode the descriptor at addr."""
+        mem = self._mem()
+        await self._arb_acquire(pri)
+        try:
+            if self._has_burst():
+                buf = await mem.read_burst(addr, layout.size)
+            else:
+                words = []
+                for off in range(0, layout.size, 8):
+                    words.append((await mem.read(addr + off)).to_bytes(8, "little"))
+                buf = b"".join(words)
+        finally:
+            self.arb.release()
+        return layout.unpack(buf)
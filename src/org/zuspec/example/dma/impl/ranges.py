@@ -0,0 +1,205 @@
+
+import bisect
+import enum
+import zuspec.dataclasses as zdc
+from typing import List, Tuple
+
+Range = Tuple[int, int]     # [start, end)
+
+
+class OverlapPolicy(enum.IntEnum):
+    """How DmaOpOpAlg handles transfers whose address ranges conflict."""
+    NONE = 0        # No checking
+    SERIALIZE = 1   # Wait for conflicting in-flight transfers to complete
+    REJECT = 2      # Raise ValueError
+
+
+class RangeClaim(object):
+    """Address ranges held by one in-flight transfer."""
+    __slots__ = ("reads", "writes", "ev")
+
+    def __init__(self, reads: List[Range], writes: List[Range]):
+        self.reads = reads
+        self.writes = writes
+        # Created when a conflicting transfer waits for this one
+        self.ev = None
+
+    async def wait(self):
+        """Wait until the claim is released."""
+        if self.ev is None:
+            self.ev = zdc.Event()
+        await self.ev.wait()
+
+
+class _Intervals(object):
+    """Intervals sorted by start address.
+
+    A lookup bisects to the intervals that start within max_len of the
+    queried range, so it costs O(log n) plus the few candidates checked.
+    The sorted interval lengths keep max_len current as intervals are
+    removed, so one long transfer does not widen later lookups.
+    """
+    __slots__ = ("starts", "items", "lens", "max_len")
+
+    def __init__(self):
+        self.starts: List[int] = []
+        self.items: List[Tuple[int, RangeClaim]] = []   # (end, claim)
+        self.lens: List[int] = []
+        self.max_len = 0
+
+    def find(self, start: int, end: int) -> RangeClaim:
+        """Returns the claim of an interval overlapping [start, end), or
+        None."""
+        lo = bisect.bisect_right(self.starts, start - self.max_len)
+        hi = bisect.bisect_left(self.starts, end)
+        for i in range(lo, hi):
+            if self.items[i][0] > start:
+                return self.items[i][1]
+        return None
+
+    def add(self, start: int, end: int, claim: RangeClaim):
+        i = bisect.bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.items.insert(i, (end, claim))
+        bisect.insort(self.lens, end - start)
+        self.max_len = self.lens[-1]
+
+    def remove(self, start: int, claim: RangeClaim):
+        i = bisect.bisect_left(self.starts, start)
+        while self.items[i][1] is not claim:
+            i += 1
+        end = self.items[i][0]
+        del self.starts[i]
+        del self.items[i]
+        del self.lens[bisect.bisect_left(self.lens, end - start)]
+        self.max_len = self.lens[-1] if self.lens else 0
+
+
+class RangeIndex(object):
+    """Index of the source (read) and destination (write) address ranges
+    of in-flight transfers.
+
+    A transfer conflicts with an in-flight one if it writes a range the
+    other reads or writes, or reads a range the other writes. Transfers
+    that only share read ranges do not conflict.
+    """
+
+    def __init__(self):
+        self._rd = _Intervals()
+        self._wr = _Intervals()
+
+    def __len__(self) -> int:
+        return len(self._rd.starts) + len(self._wr.starts)
+
+    def conflict(self, reads: List[Range], writes: List[Range]) -> RangeClaim:
+        """Returns an in-flight claim that conflicts with the given ranges,
+        or None."""
+        for start, end in writes:
+            c = self._wr.find(start, end) or self._rd.find(start, end)
+            if c is not None:
+                return c
+        for start, end in reads:
+            c = self._wr.find(start, end)
+            if c is not None:
+                return c
+        return None
+
+    def add(self, reads: List[Range], writes: List[Range]) -> RangeClaim:
+        """Record the ranges of a transfer. Returns its claim."""
+        claim = RangeClaim(reads, writes)
+        for start, end in reads:
+            self._rd.add(start, end, claim)
+        for start, end in writes:
+            self._wr.add(start, end, claim)
+        return claim
+
+    def remove(self, claim: RangeClaim):
+        """Remove a transfer's ranges, waking transfers waiting on it."""
+        for start, _ in claim.reads:
+            self._rd.remove(start, claim)
+        for start, _ in claim.writes:
+            self._wr.remove(start, claim)
+        if claim.ev is not None:
+            claim.ev.set()
+
+
+def self_overlap(reads: List[Range], writes: List[Range]) -> bool:
+    """Returns True if any write range of a transfer overlaps another of
+    its ranges."""
+    if not writes or len(reads) + len(writes) < 2:
+        return False
+    # Sweep by start address, tracking the furthest end seen so far
+    ranges = sorted([(s, e, False) for s, e in reads]
+                    + [(s, e, True) for s, e in writes])
+    any_end = wr_end = ranges[0][0]
+    for start, end, is_write in ranges:
+        if start < (any_end if is_write else wr_end):
+            return True
+        any_end = max(any_end, end)
+        if is_write:
+            wr_end = max(wr_end, end)
+    return False
+
+
+class RegionMap(object):
+    """Non-overlapping address regions sorted by base address.
+
+    Regions are any objects with `base` and `end` attributes, covering
+    [base, end). Used by the memories that place targets or mapped files
+    at fixed addresses.
+    """
+    __slots__ = ("bases", "regions")
+
+    def __init__(self):
+        # bases mirrors region.base
+        self.bases: List[int] = []
+        self.regions: List = []
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def __iter__(self):
+        return iter(self.regions)
+
+    def overlaps(self, base: int, end: int) -> bool:
+        """Returns True if [base, end) overlaps a region in the map."""
+        i = bisect.bisect_right(self.bases, base)
+        return ((i > 0 and self.regions[i - 1].end > base)
+                or (i < len(self.bases) and self.bases[i] < end))
+
+    def add(self, region):
+        """Insert a region. The caller checks overlaps() first."""
+        i = bisect.bisect_right(self.bases, region.base)
+        self.bases.insert(i, region.base)
+        self.regions.insert(i, region)
+
+    def remove(self, base: int):
+        """Remove and return the region at base."""
+        i = bisect.bisect_left(self.bases, base)
+        if i == len(self.bases) or self.bases[i] != base:
+            raise KeyError("No region mapped at 0x%x" % base)
+        del self.bases[i]
+        return self.regions.pop(i)
+
+    def clear(self):
+        self.bases.clear()
+        self.regions.clear()
+
+    def find(self, addr: int):
+        """Returns the region containing addr, or None."""
+        i = bisect.bisect_right(self.bases, addr) - 1
+        if i >= 0 and addr < self.regions[i].end:
+            return self.regions[i]
+        return None
+
+    def span(self, addr: int, nbytes: int):
+        """Returns (region, n): the region containing addr (None if
+        unmapped) and the number of bytes, up to nbytes, before the
+        next region boundary."""
+        i = bisect.bisect_right(self.bases, addr) - 1
+        if i >= 0 and addr < self.regions[i].end:
+            r = self.regions[i]
+            return r, min(nbytes, r.end - addr)
+        if i + 1 < len(self.bases):
+            return None, min(nbytes, self.bases[i + 1] - addr)
+        return None, nbytes
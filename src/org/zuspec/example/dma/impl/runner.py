@@ -0,0 +1,291 @@
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import time
+import zuspec.dataclasses as zdc
+from typing import Dict, Iterable, List
+
+from ..op import DevCpy, MemCpy
+from .mem_paged import PagedMemory
+from .op_op_alg import DmaOpOpAlg
+from .stats import XferStats
+
+OPS = ("memcpy", "memcpy_chain", "devcpy", "devcpy_chain")
+
+# Transfer i reads from SRC_BASE + 2*i*XFER_SPAN and writes to the
+# following XFER_SPAN bytes
+SRC_BASE = 0x100000
+XFER_SPAN = 0x100000
+
+
+@dataclasses.dataclass
+class Scenario(object):
+    """A DMA simulation described as plain (picklable) data.
+
+    `concurrency` copies of the operation run at once, each on its own
+    source and destination span. Chains split each copy into `chain_len`
+    segments. Device copies read incrementing memory and write a device
+    FIFO at the destination address, with every chunk already requested.
+    `dma` holds DmaOpOpAlg field values to apply, for example
+    {"pipeline_depth": 2}.
+    """
+    name: str
+    op: str = "memcpy"
+    # "burst" (PagedMemory) or "word" (single-word MemoryOp only)
+    mem: str = "burst"
+    sz: int = 4096
+    src_off: int = 0
+    dst_off: int = 0
+    acc_sz: int = 4
+    chk_sz: int = 16
+    read_ns: int = 0
+    write_ns: int = 0
+    beat_ns: int = 0
+    concurrency: int = 1
+    chain_len: int = 4
+    dma: Dict[str, object] = dataclasses.field(default_factory=dict)
+    # Check memory copies reproduced the source data
+    check: bool = False
+
+
+@dataclasses.dataclass
+class ScenarioResult(object):
+    """Outcome of running a Scenario."""
+    name: str
+    nbytes: int = 0
+    sim_ns: int = 0
+    host_s: float = 0.0
+    # Counters of all transfers in the scenario (kind "total")
+    stats: XferStats = None
+    # Description of the exception raised, if the scenario failed
+    error: str = None
+
+    @property
+    def sim_bw(self) -> float:
+        """Simulated throughput in bytes/ns (None if untimed)."""
+        return self.nbytes / self.sim_ns if self.sim_ns else None
+
+    @property
+    def host_rate(self) -> float:
+        """Simulated bytes per host second."""
+        return self.nbytes / self.host_s if self.host_s else 0.0
+
+
+@zdc.dataclass
+class _WordMemory(zdc.Component):
+    """Memory limited to single-word MemoryOp accesses."""
+    pages: PagedMemory = zdc.field()
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        return await self.pages.read(addr)
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        await self.pages.write(addr, data, size)
+
+
+@zdc.dataclass
+class _BurstTop(zdc.Component):
+    mem: PagedMemory = zdc.field()
+    dma: DmaOpOpAlg = zdc.field()
+
+    def __bind__(self):
+        return {self.dma.mem: self.mem}
+
+    @property
+    def pages(self) -> PagedMemory:
+        return self.mem
+
+
+@zdc.dataclass
+class _WordTop(zdc.Component):
+    mem: _WordMemory = zdc.field()
+    dma: DmaOpOpAlg = zdc.field()
+
+    def __bind__(self):
+        return {self.dma.mem: self.mem}
+
+    @property
+    def pages(self) -> PagedMemory:
+        return self.mem.pages
+
+
+_TOP_TYPES = {"burst": _BurstTop, "word": _WordTop}
+
+
+class ScenarioRunner(object):
+    """Runs scenarios, reusing one elaborated component tree per memory
+    kind and one event loop.
+
+    Between scenarios, memory and the arbiter state are cleared and the
+    DMA fields a scenario set are restored, so each scenario starts from
+    the same state as on a fresh tree. A tree whose scenario raised is
+    discarded.
+    """
+
+    def __init__(self):
+        self._tops = {}
+        self._loop = None
+
+    def run(self, sc: Scenario) -> ScenarioResult:
+        """Run one scenario. Exceptions are reported in the result."""
+        if sc.op not in OPS:
+            return ScenarioResult(sc.name, error="Unknown op %r" % sc.op)
+        if sc.mem not in _TOP_TYPES:
+            return ScenarioResult(sc.name, error="Unknown mem %r" % sc.mem)
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        top = self._tops.get(sc.mem)
+        if top is None:
+            top = self._tops[sc.mem] = _TOP_TYPES[sc.mem]()
+
+        saved = {}
+        res = ScenarioResult(sc.name, nbytes=sc.sz * sc.concurrency)
+        t0 = time.perf_counter()
+        try:
+            saved = {k: getattr(top.dma, k) for k in sc.dma}
+            self._loop.run_until_complete(self._run(top, sc, res))
+        except Exception as e:
+            res.error = "%s: %s" % (type(e).__name__, e)
+            del self._tops[sc.mem]
+            top.shutdown()
+        else:
+            for k, v in saved.items():
+                setattr(top.dma, k, v)
+        res.host_s = time.perf_counter() - t0
+        return res
+
+    def close(self):
+        """Shut down the component trees and the event loop."""
+        for top in self._tops.values():
+            top.shutdown()
+        self._tops.clear()
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    async def _run(self, top, sc: Scenario, res: ScenarioResult):
+        pages = top.pages
+        pages.clear()
+        pages.read_delay = zdc.Time.ns(sc.read_ns) if sc.read_ns else None
+        pages.write_delay = zdc.Time.ns(sc.write_ns) if sc.write_ns else None
+        pages.beat_delay = zdc.Time.ns(sc.beat_ns) if sc.beat_ns else None
+
+        dma = top.dma
+        dma.stats = True
+        dma.stats_total = XferStats(kind="total")
+        dma.stats_pri.clear()
+        dma.arb.reset()
+        dma.max_pending_req = 1 << 20
+        for k, v in sc.dma.items():
+            setattr(dma, k, v)
+
+        data = {}
+        for i in range(sc.concurrency):
+            src = SRC_BASE + 2 * i * XFER_SPAN
+            if sc.check:
+                data[i] = bytes((src + j) & 0xFF for j in range(sc.sz + 8))
+            else:
+                data[i] = bytes(sc.sz + 8)
+            pages.load(src, data[i])
+
+        start = top.time().as_ns()
+        await asyncio.gather(*(
+            _transfer(dma, sc, i) for i in range(sc.concurrency)))
+        res.sim_ns = top.time().as_ns() - start
+        res.stats = dma.stats_total
+
+        if sc.check and sc.op.startswith("memcpy"):
+            for i in range(sc.concurrency):
+                src, dst = _addrs(sc, i)
+                got = pages.dump(dst, sc.sz)
+                if got != data[i][sc.src_off:sc.src_off + sc.sz]:
+                    raise AssertionError(
+                        "Data mismatch at 0x%x in transfer %d" % (dst, i))
+
+
+def _addrs(sc: Scenario, i: int):
+    base = SRC_BASE + 2 * i * XFER_SPAN
+    return base + sc.src_off, base + XFER_SPAN + sc.dst_off
+
+
+def _segments(src: int, dst: int, sz: int, n_seg: int):
+    seg = (sz + n_seg - 1) // n_seg
+    off = 0
+    while off < sz:
+        n = min(seg, sz - off)
+        yield src + off, dst + off, n
+        off += n
+
+
+async def _transfer(dma: DmaOpOpAlg, sc: Scenario, idx: int):
+    src, dst = _addrs(sc, idx)
+    sz = sc.sz
+    acc_sz, chk_sz = sc.acc_sz, sc.chk_sz
+
+    if sc.op == "memcpy":
+        await dma.memcpy(src=src, dst=dst, sz=sz)
+    elif sc.op == "memcpy_chain":
+        await dma.memcpy_chain([
+            MemCpy(src=s, dst=d, sz=n)
+            for s, d, n in _segments(src, dst, sz, sc.chain_len)])
+    else:
+        segs = list(_segments(src, dst, sz, sc.chain_len)) \
+            if sc.op == "devcpy_chain" else [(src, dst, sz)]
+        chunk = acc_sz * chk_sz
+        for _, _, n in segs:
+            for _ in range((n + chunk - 1) // chunk):
+                await dma.req_transfer(idx)
+        if sc.op == "devcpy":
+            await dma.devcpy(
+                src=src, dst=dst, sz=sz, acc_sz=acc_sz, chk_sz=chk_sz,
+                inc_src=True, inc_dst=False, req_id=idx)
+        else:
+            await dma.devcpy_chain([
+                DevCpy(src=s, dst=dst, sz=n, acc_sz=acc_sz, chk_sz=chk_sz,
+                       inc_src=True, inc_dst=False)
+                for s, _, n in segs], req_id=idx)
+
+
+# Runner of the current worker process, created on its first scenario
+_worker_runner: ScenarioRunner = None
+
+
+def _run_in_worker(sc: Scenario) -> ScenarioResult:
+    global _worker_runner
+    if _worker_runner is None:
+        _worker_runner = ScenarioRunner()
+    return _worker_runner.run(sc)
+
+
+def run_scenarios(
+        scenarios: Iterable[Scenario],
+        processes: int = None,
+        chunksize: int = 8) -> List[ScenarioResult]:
+    """Run scenarios across a pool of processes. Returns their results,
+    in order.
+
+    Each worker process keeps a ScenarioRunner, so component trees are
+    elaborated once per worker rather than once per scenario. processes
+    defaults to the number of CPUs; with processes=1, scenarios run in
+    the calling process.
+    """
+    scenarios = list(scenarios)
+    if processes == 1:
+        runner = ScenarioRunner()
+        try:
+            return [runner.run(sc) for sc in scenarios]
+        finally:
+            runner.close()
+
+    with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+        return list(pool.map(_run_in_worker, scenarios, chunksize=chunksize))
+
+
+def aggregate(results: Iterable[ScenarioResult]) -> XferStats:
+    """Returns the counters of all successful results, summed."""
+    total = XferStats(kind="total")
+    for r in results:
+        if r.stats is not None:
+            total.add(r.stats)
+    return total
@@ -0,0 +1,46 @@
+
+import asyncio
+import zuspec.dataclasses as zdc
+from typing import List
+
+
+class FifoSem(object):
+    """Counting semaphore that grants waiters in FIFO order.
+
+    Up to `limit` holders at once. release() hands its unit directly to
+    the oldest waiter, so a task arriving in between cannot take it. A
+    waiter cancelled before its grant leaves the queue; one cancelled
+    after the grant passes the unit on.
+    """
+    __slots__ = ("limit", "active", "waiters")
+
+    def __init__(self, limit: int = 1):
+        self.limit = limit
+        self.active = 0
+        self.waiters: List[zdc.Event] = []
+
+    def locked(self) -> bool:
+        """Returns True if acquire() would wait."""
+        return self.active >= self.limit or bool(self.waiters)
+
+    async def acquire(self):
+        if not self.locked():
+            self.active += 1
+            return
+        ev = zdc.Event()
+        self.waiters.append(ev)
+        try:
+            await ev.wait()
+        except asyncio.CancelledError:
+            if ev in self.waiters:
+                self.waiters.remove(ev)
+            else:
+                self.release()
+            raise
+
+    def release(self):
+        # A lowered limit drains holders before waiters are granted
+        if self.waiters and self.active <= self.limit:
+            self.waiters.pop(0).set()
+        else:
+            self.active -= 1
@@ -0,0 +1,115 @@
+
+import dataclasses
+from typing import Dict
+
+
+@dataclasses.dataclass
+class XferStats(object):
+    """Performance counters for a transfer, or an aggregate of transfers.
+
+    Times are simulated nanoseconds. `writes` counts single-word writes
+    per access size; MemoryOp reads always return a full word, so they
+    are counted as a single class. Burst accesses are counted separately.
+    """
+    kind: str = ""
+    pri: int = 0
+    n_xfers: int = 0
+    start_ns: int = None
+    end_ns: int = None
+    # Bytes written to the destination
+    nbytes: int = 0
+    reads: int = 0
+    writes: Dict[int, int] = dataclasses.field(default_factory=dict)
+    burst_reads: int = 0
+    burst_writes: int = 0
+    # Time spent waiting for memory-port grants
+    arb_wait_ns: int = 0
+    # devcpy: time from the first request to the first data access
+    req_latency_ns: int = None
+    # Checksum of the data written (see DmaOpOpAlg.csum_mode)
+    csum: int = None
+
+    @property
+    def accesses(self) -> int:
+        """Total number of memory accesses, bursts included."""
+        return (self.reads + sum(self.writes.values())
+                + self.burst_reads + self.burst_writes)
+
+    @property
+    def elapsed_ns(self) -> int:
+        if self.start_ns is None or self.end_ns is None:
+            return 0
+        return self.end_ns - self.start_ns
+
+    @property
+    def bandwidth(self) -> float:
+        """Achieved bandwidth in bytes/ns (0 for an untimed transfer)."""
+        elapsed = self.elapsed_ns
+        return self.nbytes / elapsed if elapsed else 0.0
+
+    def add(self, other: "XferStats"):
+        """Accumulate other into this record."""
+        self.n_xfers += other.n_xfers
+        if other.start_ns is not None and (
+                self.start_ns is None or other.start_ns < self.start_ns):
+            self.start_ns = other.start_ns
+        if other.end_ns is not None and (
+                self.end_ns is None or other.end_ns > self.end_ns):
+            self.end_ns = other.end_ns
+        self.nbytes += other.nbytes
+        self.reads += other.reads
+        for sz, n in other.writes.items():
+            self.writes[sz] = self.writes.get(sz, 0) + n
+        self.burst_reads += other.burst_reads
+        self.burst_writes += other.burst_writes
+        self.arb_wait_ns += other.arb_wait_ns
+        if other.req_latency_ns is not None and (
+                self.req_latency_ns is None
+                or other.req_latency_ns > self.req_latency_ns):
+            # Aggregates keep the worst case
+            self.req_latency_ns = other.req_latency_ns
+
+
+class _StatsMem(object):
+    """Wraps a memory port, counting accesses into an XferStats record."""
+    __slots__ = ("mem", "st")
+
+    def __init__(self, mem, st: XferStats):
+        self.mem = mem
+        self.st = st
+
+    async def read(self, addr: int) -> int:
+        self.st.reads += 1
+        return await self.mem.read(addr)
+
+    async def write(self, addr: int, data: int, size: int):
+        writes = self.st.writes
+        writes[size] = writes.get(size, 0) + 1
+        self.st.nbytes += size
+        await self.mem.write(addr, data, size)
+
+    def read_lt(self, addr: int, delay: int):
+        self.st.reads += 1
+        return self.mem.read_lt(addr, delay)
+
+    def write_lt(self, addr: int, data: int, size: int, delay: int) -> int:
+        writes = self.st.writes
+        writes[size] = writes.get(size, 0) + 1
+        self.st.nbytes += size
+        return self.mem.write_lt(addr, data, size, delay)
+
+    async def read_burst(self, addr: int, nbytes: int) -> bytes:
+        self.st.burst_reads += 1
+        return await self.mem.read_burst(addr, nbytes)
+
+    async def write_burst(self, addr: int, data: bytes):
+        self.st.burst_writes += 1
+        self.st.nbytes += len(data)
+        await self.mem.write_burst(addr, data)
+
+    def load(self, addr: int, data: bytes):
+        self.st.nbytes += len(data)
+        self.mem.load(addr, data)
+
+    def dump(self, addr: int, nbytes: int) -> bytes:
+        return self.mem.dump(addr, nbytes)
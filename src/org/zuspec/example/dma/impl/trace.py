@@ -0,0 +1,177 @@
+
+import asyncio
+import struct
+import zuspec.dataclasses as zdc
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from ..mem import MemoryOp, _optional_op
+from .op_op_alg import current_xfer
+
+# Trace record: time (ns), addr, size (bytes), kind, channel, priority,
+# padded to 24 bytes. Write data is not recorded; replay writes zeros.
+TRACE_REC = struct.Struct("<QQIBbbx")
+
+# Record kinds
+TRACE_READ = 0
+TRACE_WRITE = 1
+TRACE_READ_BURST = 2
+TRACE_WRITE_BURST = 3
+
+TraceRec = Tuple[int, int, int, int, int, int]
+
+
+def read_trace(path: str) -> Iterator[TraceRec]:
+    """Yields the records of a trace file written by TraceMemory."""
+    rsz = TRACE_REC.size
+    with open(path, "rb") as fp:
+        while True:
+            buf = fp.read(rsz * 4096)
+            if not buf:
+                break
+            yield from TRACE_REC.iter_unpack(buf[:len(buf) - len(buf) % rsz])
+
+
+@zdc.dataclass
+class TraceMemory(MemoryOp, zdc.Component):
+    """Memory port adapter that records every access passing through it.
+
+    Bind the DMA's mem port to a TraceMemory, and the TraceMemory's mem
+    port to the real memory. Each access is recorded as a TRACE_REC
+    (time, addr, size, kind, channel, priority) in a preallocated ring of
+    `capacity` records. Channel and priority identify the DMA transfer
+    that issued the access; they are -1 and 0 for other requesters.
+
+    If `path` is set, the ring is written to that file each time it fills
+    and by close(), so the file holds the complete trace. Otherwise, the
+    ring keeps the most recent `capacity` records.
+
+    The burst and backdoor methods are only present if the traced memory
+    has them, so the DMA selects the same burst and functional paths as it
+    would without the adapter. Backdoor (functional) accesses are not
+    recorded. The loosely-timed methods (read_lt/write_lt) are not
+    forwarded: with lt_quantum set, a traced DMA uses the timed word path,
+    so each recorded access carries its own time.
+    """
+
+    mem: MemoryOp = zdc.port()
+
+    capacity: zdc.u32 = zdc.field(default=1 << 16)
+    path: str = zdc.field(default=None)
+
+    def __post_init__(self):
+        self._buf = None
+        self._n = 0         # Records written in total
+        self._fp = None
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        self._record(addr, 8, TRACE_READ)
+        return await self.mem.read(addr)
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        self._record(addr, size, TRACE_WRITE)
+        await self.mem.write(addr, data, size)
+
+    async def _read_burst(self, addr: zdc.u64, nbytes: zdc.u32) -> bytes:
+        self._record(addr, nbytes, TRACE_READ_BURST)
+        return await self.mem.read_burst(addr, nbytes)
+
+    async def _write_burst(self, addr: zdc.u64, data: bytes) -> None:
+        self._record(addr, len(data), TRACE_WRITE_BURST)
+        await self.mem.write_burst(addr, data)
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails. Backdoor accesses are not
+        # recorded, so load/dump go straight to the traced memory
+        return _optional_op(self, name, [self.mem])
+
+    @property
+    def count(self) -> int:
+        """Number of accesses recorded since the last clear()."""
+        return self._n
+
+    def records(self) -> List[TraceRec]:
+        """Returns the records held in the ring, oldest first."""
+        if self._buf is None:
+            return []
+        cap = self.capacity
+        n = min(self._n, cap)
+        first = self._n - n
+        if self.path is not None:
+            # Full rings have already been written out
+            first = self._n - self._n % cap
+            n = self._n - first
+        return [TRACE_REC.unpack_from(self._buf, (i % cap) * TRACE_REC.size)
+                for i in range(first, first + n)]
+
+    def clear(self):
+        """Discard recorded accesses."""
+        self._n = 0
+
+    def close(self):
+        """Write out records not yet in the trace file and close it."""
+        if self._fp is not None:
+            n = self._n % self.capacity
+            self._fp.write(memoryview(self._buf)[:n * TRACE_REC.size])
+            self._fp.close()
+            self._fp = None
+
+    def _record(self, addr: int, size: int, kind: int):
+        if self._buf is None:
+            self._buf = bytearray(self.capacity * TRACE_REC.size)
+            if self.path is not None:
+                self._fp = open(self.path, "wb")
+        ch, pri = current_xfer()
+        cap = self.capacity
+        TRACE_REC.pack_into(
+            self._buf, (self._n % cap) * TRACE_REC.size,
+            int(self.time().as_ns()), addr, size, kind, ch, pri)
+        self._n += 1
+        if self._fp is not None and self._n % cap == 0:
+            self._fp.write(self._buf)
+
+
+@zdc.dataclass
+class TraceReplay(zdc.Component):
+    """Re-issues a recorded trace against a memory.
+
+    Records are grouped into one stream per channel, so accesses that
+    overlapped in the recording overlap in replay. With `timed` set, each
+    access is issued no earlier than its recorded time (relative to the
+    first record); otherwise each stream issues its accesses back-to-back.
+    Write data is zero.
+    """
+
+    mem: MemoryOp = zdc.port()
+
+    timed: bool = zdc.field(default=True)
+
+    async def replay(self, records: Iterable[TraceRec]) -> int:
+        """Replay records. Returns the elapsed simulated time in ns."""
+        streams: Dict[int, List[TraceRec]] = {}
+        t0 = None
+        for rec in records:
+            if t0 is None:
+                t0 = rec[0]
+            streams.setdefault(rec[4], []).append(rec)
+
+        start = self.time().as_ns()
+        await asyncio.gather(*(
+            self._replay_stream(recs, start - (t0 or 0))
+            for recs in streams.values()))
+        return self.time().as_ns() - start
+
+    async def _replay_stream(self, recs: List[TraceRec], offset: int):
+        mem = self.mem
+        for t, addr, size, kind, _, _ in recs:
+            if self.timed:
+                delay = t + offset - self.time().as_ns()
+                if delay > 0:
+                    await self.wait(zdc.Time.ns(delay))
+            if kind == TRACE_READ:
+                await mem.read(addr)
+            elif kind == TRACE_WRITE:
+                await mem.write(addr, 0, size)
+            elif kind == TRACE_READ_BURST:
+                await mem.read_burst(addr, size)
+            else:
+                await mem.write_burst(addr, bytes(size))
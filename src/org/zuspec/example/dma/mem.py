@@ -1,5 +1,18 @@
 import zuspec.dataclasses as zdc
-from typing import Protocol
+from typing import Protocol, Tuple
+
+
+class MemoryAddressError(ValueError):
+    """Raised by a memory for an access to an address it does not map.
+
+    `addr` is the faulting address; `write` is True for a write.
+    """
+
+    def __init__(self, addr: int, write: bool):
+        super().__init__("%s unmapped address 0x%x" % (
+            "Write to" if write else "Read of", addr))
+        self.addr = addr
+        self.write = write
 
 
 class MemoryOp(Protocol):
@@ -24,3 +37,107 @@ class MemoryOp(Protocol):
             data: Data value to write
         """
         ...
+
+
+class MemoryBurstOp(MemoryOp, Protocol):
+    """Optional burst extension to MemoryOp.
+
+    A memory that implements this protocol accepts multi-word accesses.
+    The DMA engine detects these methods on the bound port and uses them
+    for the 8-byte-aligned body of a transfer. Memories that only
+    implement MemoryOp are accessed one word at a time.
+    """
+
+    async def read_burst(self, addr: zdc.u64, nbytes: zdc.u32) -> bytes:
+        """Read a contiguous block of memory.
+
+        Args:
+            addr: Starting address (8-byte aligned)
+            nbytes: Number of bytes to read
+
+        Returns:
+            Bytes-like object of length nbytes
+        """
+        ...
+
+    async def write_burst(self, addr: zdc.u64, data: bytes) -> None:
+        """Write a contiguous block of memory.
+
+        Args:
+            addr: Starting address
+            data: Bytes-like object to write
+        """
+        ...
+
+
+class MemoryBackdoorOp(Protocol):
+    """Optional untimed (backdoor) access to memory contents.
+
+    The DMA engine uses these methods in functional mode to perform a
+    whole transfer as a single copy without consuming simulated time.
+    """
+
+    def load(self, addr: int, data: bytes) -> None:
+        """Write data starting at addr without consuming simulated time."""
+        ...
+
+    def dump(self, addr: int, nbytes: int) -> bytes:
+        """Read nbytes starting at addr without consuming simulated time."""
+        ...
+
+
+class MemoryLtOp(Protocol):
+    """Optional loosely-timed extension to MemoryOp.
+
+    Each access completes immediately, without yielding to the scheduler,
+    and adds its latency to the caller's annotated delay (in ns), in the
+    style of TLM-2.0 loosely-timed transport. The DMA engine uses these
+    methods when its lt_quantum is set, synchronizing with simulated time
+    only once the accumulated delay reaches the quantum.
+    """
+
+    def read_lt(self, addr: zdc.u64, delay: int) -> Tuple[int, int]:
+        """Read a word from memory.
+
+        Args:
+            addr: Memory address
+            delay: Delay (ns) annotated so far
+
+        Returns:
+            (data, delay) with the read latency added to delay
+        """
+        ...
+
+    def write_lt(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8, delay: int) -> int:
+        """Write the low 'size' bytes of data to memory.
+
+        Args:
+            addr: Memory address
+            data: Data value to write
+            size: Number of bytes to write
+            delay: Delay (ns) annotated so far
+
+        Returns:
+            delay with the write latency added
+        """
+        ...
+
+
+def _optional_op(adapter, name: str, mems):
+    """Looks up an optional memory protocol method on an adapter that
+    wraps the memories in mems. For use from the adapter's __getattr__.
+
+    read_burst, write_burst, load and dump are exposed only when every
+    wrapped memory implements them. The adapter's own `_<name>` method
+    is returned if it has one; otherwise, the method of the single
+    wrapped memory is returned directly. Raises AttributeError when the
+    method is not available.
+    """
+    if (name in ("read_burst", "write_burst", "load", "dump")
+            and mems and all(hasattr(m, name) for m in mems)):
+        impl = getattr(type(adapter), "_" + name, None)
+        if impl is not None:
+            return impl.__get__(adapter)
+        if len(mems) == 1:
+            return getattr(mems[0], name)
+    raise AttributeError(name)
@@ -1,6 +1,8 @@
 import zuspec.dataclasses as zdc
 from typing import List, Protocol
 
+from .handle import XferHandle
+
 @zdc.dataclass
 class MemCpy(zdc.Struct):
     src: zdc.uptr = zdc.field()
@@ -25,6 +27,32 @@ class DmaOp(Protocol):
             pri: zdc.i32 = 0):
         ...
 
+    async def fill(
+            self,
+            dst: zdc.uptr,
+            pattern: zdc.u64,
+            sz: zdc.u32,
+            pattern_width: zdc.u8 = 1,
+            pri: zdc.i32 = 0):
+        """Fill sz bytes at dst with a repeating pattern_width-byte pattern."""
+        ...
+
+    async def memcpy_2d(
+            self,
+            src: zdc.uptr,
+            dst: zdc.uptr,
+            row_sz: zdc.u32,
+            n_rows: zdc.u32,
+            src_stride: zdc.u32,
+            dst_stride: zdc.u32,
+            n_planes: zdc.u32 = 1,
+            src_plane_stride: zdc.u32 = 0,
+            dst_plane_stride: zdc.u32 = 0,
+            pri: zdc.i32 = 0):
+        """Copy n_planes x n_rows rows of row_sz bytes between strided
+        source and destination layouts."""
+        ...
+
     async def memcpy_chain(
             self,
             xfers: List[MemCpy],
@@ -51,3 +79,55 @@ class DmaOp(Protocol):
             pri: zdc.i32 = 0):
         ...
 
+    async def memcpy_desc(
+            self,
+            desc: zdc.uptr,
+            pri: zdc.i32 = 0):
+        """Execute the linked MemCpy descriptors at desc (see desc.py)."""
+        ...
+
+    async def devcpy_desc(
+            self,
+            desc: zdc.uptr,
+            req_id: zdc.i32,
+            pri: zdc.i32 = 0):
+        """Execute the linked DevCpy descriptors at desc (see desc.py)."""
+        ...
+
+    async def submit_memcpy(
+            self,
+            src: zdc.uptr,
+            dst: zdc.uptr,
+            sz: zdc.u32,
+            pri: zdc.i32 = 0) -> XferHandle:
+        """Queue a memcpy. Returns a handle that completes with it."""
+        ...
+
+    async def submit_memcpy_chain(
+            self,
+            xfers: List[MemCpy],
+            pri: zdc.i32 = 0) -> XferHandle:
+        """Queue a memcpy_chain. Returns a handle that completes with it."""
+        ...
+
+    async def submit_devcpy(
+            self,
+            src: zdc.uptr,
+            dst: zdc.uptr,
+            sz: zdc.u32,
+            acc_sz: zdc.u8,
+            chk_sz: zdc.u32,
+            inc_src: bool,
+            inc_dst: bool,
+            req_id: zdc.i32,
+            pri: zdc.i32 = 0) -> XferHandle:
+        """Queue a devcpy. Returns a handle that completes with it."""
+        ...
+
+    async def submit_devcpy_chain(
+            self,
+            xfers: List[DevCpy],
+            req_id: zdc.i32,
+            pri: zdc.i32 = 0) -> XferHandle:
+        """Queue a devcpy_chain. Returns a handle that completes with it."""
+        ...
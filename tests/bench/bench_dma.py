@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# ****************************************************************************
+#  Benchmarks for DmaOpOpAlg (op_op_alg.py)
+#
+#  Sweeps transfer size, src/dst alignment, access size, chunk size, memory
+#  latency, burst beat time and concurrency for memcpy, memcpy_chain, devcpy
+#  and devcpy_chain. Each scenario reports:
+#    - sim_bw:    simulated throughput (bytes per simulated ns)
+#    - host_rate: simulation rate (simulated bytes per host second)
+#
+#  Scenarios run through the package's scenario runner; --jobs spreads them
+#  over a process pool (host rates are most comparable with --jobs 1).
+#
+#  Results are compared against baseline.json. A scenario regresses if
+#  sim_bw drops by more than the 'sim_bw' threshold or host_rate drops by
+#  more than the 'host_rate' threshold. Simulated throughput is
+#  deterministic and is stored for every scenario. Host rate depends on
+#  the machine, so it is stored per host name (by --update-baseline
+#  without --no-host-rate) and only compared on a host that has an entry.
+#  Each scenario runs --repeat times and reports its best host rate,
+#  which keeps the comparison stable on a loaded machine.
+#
+#  Usage:
+#    bench_dma.py [--filter SUBSTR] [--output FILE] [--update-baseline]
+#                 [--no-host-rate] [--jobs N] [--repeat N]
+# ****************************************************************************
+
+import sys
+import os
+import argparse
+import json
+import platform
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../../packages/zuspec-dataclasses/src'))
+
+from org.zuspec.example.dma.impl.runner import (  # noqa: E402
+    OPS, Scenario, run_scenarios)
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Default scenario; the sweep varies one parameter at a time around it
+DEFAULT = dict(
+    mem="burst", sz=4096, src_off=0, dst_off=0, acc_sz=4, chk_sz=16,
+    latency=1, beat=1, concurrency=1)
+
+SWEEP = {
+    "mem": ["word", "burst"],
+    "sz": [64, 4096, 65536],
+    "src_off": [0, 1, 3],
+    "dst_off": [0, 5],
+    "acc_sz": [1, 4, 8],
+    "chk_sz": [1, 16, 256],
+    "latency": [0, 1, 10],
+    # Time per 8-byte beat after a burst's first (0: bursts cost one access)
+    "beat": [0, 1, 4],
+    "concurrency": [1, 4],
+}
+
+# Parameters that only affect device copies
+DEV_ONLY = ("acc_sz", "chk_sz")
+
+# Segments per chain
+CHAIN_LEN = 4
+
+
+def scenarios():
+    """Returns the list of (name, op, params) scenarios in the sweep."""
+    ret = []
+    seen = set()
+    for op in OPS:
+        for key, values in SWEEP.items():
+            if key in DEV_ONLY and not op.startswith("devcpy"):
+                continue
+            for v in values:
+                p = dict(DEFAULT)
+                p[key] = v
+                name = scenario_name(op, p)
+                if name not in seen:
+                    seen.add(name)
+                    ret.append((name, op, p))
+    return ret
+
+
+def scenario_name(op: str, p: dict) -> str:
+    name = "%s/%s/sz%d/s%d/d%d" % (
+        op, p["mem"], p["sz"], p["src_off"], p["dst_off"])
+    if op.startswith("devcpy"):
+        name += "/a%d/c%d" % (p["acc_sz"], p["chk_sz"])
+    return name + "/l%d/b%d/n%d" % (
+        p["latency"], p["beat"], p["concurrency"])
+
+
+def to_scenario(name: str, op: str, p: dict) -> Scenario:
+    """Returns the runner Scenario for a point in the sweep."""
+    return Scenario(
+        name=name, op=op, mem=p["mem"], sz=p["sz"], src_off=p["src_off"],
+        dst_off=p["dst_off"], acc_sz=p["acc_sz"], chk_sz=p["chk_sz"],
+        read_ns=p["latency"], write_ns=p["latency"], beat_ns=p["beat"],
+        concurrency=p["concurrency"], chain_len=CHAIN_LEN)
+
+
+def compare(results: dict, baseline: dict, host: str = None) -> list:
+    """Returns a list of regression messages. Host rates are compared
+    against the entries recorded for host, if any."""
+    thresholds = baseline.get("thresholds", {})
+    host_rates = baseline.get("host_rate", {}).get(host, {})
+    ret = []
+    for name, cur in results.items():
+        base = dict(baseline.get("results", {}).get(name, {}))
+        if name in host_rates:
+            base["host_rate"] = host_rates[name]
+        for key in ("sim_bw", "host_rate"):
+            if base.get(key) is None or cur[key] is None \
+                    or key not in thresholds:
+                continue
+            limit = base[key] * (1.0 - thresholds[key])
+            if cur[key] < limit:
+                ret.append("%s: %s %.4g < %.4g (baseline %.4g)" % (
+                    name, key, cur[key], limit, base[key]))
+    return ret
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="DmaOpOpAlg benchmarks")
+    parser.add_argument("--filter", default=None,
+                        help="Only run scenarios whose name contains FILTER")
+    parser.add_argument("--output", default=None,
+                        help="Also write the report to OUTPUT")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store these results as the new baseline")
+    parser.add_argument("--no-host-rate", action="store_true",
+                        help="Do not compare or store host simulation rate")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes (0: one per CPU)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Runs of each scenario; the fastest is reported")
+    args = parser.parse_args(argv)
+
+    batch = [to_scenario(name, op, p) for name, op, p in scenarios()
+             if not args.filter or args.filter in name]
+    best = {}
+    for _ in range(max(args.repeat, 1)):
+        for sr in run_scenarios(batch, processes=args.jobs or None):
+            if sr.error is not None:
+                print("%s: %s" % (sr.name, sr.error))
+                return 1
+            if sr.name not in best or sr.host_s < best[sr.name].host_s:
+                best[sr.name] = sr
+
+    results = {}
+    lines = ["%-52s %10s %10s %14s" % (
+        "scenario", "sim_ns", "B/ns", "sim B/host s")]
+    for sc in batch:
+        sr = best[sc.name]
+        r = results[sr.name] = {
+            "bytes": sr.nbytes,
+            "sim_ns": sr.sim_ns,
+            # Untimed (zero-latency) scenarios have no simulated throughput
+            "sim_bw": sr.sim_bw,
+            "host_rate": sr.host_rate,
+        }
+        bw = "-" if r["sim_bw"] is None else "%.4f" % r["sim_bw"]
+        lines.append("%-52s %10d %10s %14.4g" % (
+            sr.name, r["sim_ns"], bw, r["host_rate"]))
+
+    baseline = {}
+    if os.path.isfile(BASELINE):
+        with open(BASELINE) as fp:
+            baseline = json.load(fp)
+
+    host = None if args.no_host_rate else platform.node()
+    regressions = compare(results, baseline, host)
+    lines.append("")
+    lines.append("%d scenarios, %d regressions" % (
+        len(results), len(regressions)))
+    lines.extend(regressions)
+
+    report = "\n".join(lines)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as fp:
+            fp.write(report + "\n")
+
+    if args.update_baseline:
+        stored = baseline.get("results", {})
+        host_rates = baseline.get("host_rate", {})
+        for name, r in results.items():
+            ent = {}
+            if r["sim_bw"] is not None:
+                ent["sim_bw"] = round(r["sim_bw"], 6)
+            stored[name] = ent
+            if host is not None:
+                host_rates.setdefault(host, {})[name] = round(r["host_rate"])
+        baseline = {
+            "thresholds": baseline.get(
+                "thresholds", {"sim_bw": 0.01, "host_rate": 0.25}),
+            "results": dict(sorted(stored.items())),
+        }
+        if host_rates:
+            baseline["host_rate"] = {
+                h: dict(sorted(rates.items()))
+                for h, rates in sorted(host_rates.items())}
+        with open(BASELINE, "w") as fp:
+            json.dump(baseline, fp, indent=2)
+            fp.write("\n")
+        return 0
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# ****************************************************************************
+#  Unit Tests for MemArbiter (arbiter.py)
+# ****************************************************************************
+
+import sys
+import os
+import asyncio
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../../packages/zuspec-dataclasses/src'))
+
+import zuspec.dataclasses as zdc  # noqa: E402
+from org.zuspec.example.dma.impl.arbiter import ArbMode, MemArbiter  # noqa: E402
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+async def grant_order(top, arb, reqs, hold_ns=10):
+    """Issue requests and return the order in which they were granted.
+
+    The first request is granted immediately and held while the rest
+    queue up behind it (one per ns), so the remaining order reflects
+    the policy.
+
+    Args:
+        top: Component used as the time base
+        arb: Arbiter under test
+        reqs: List of (name, pri) in request order
+        hold_ns: Time each requester holds the grant
+    """
+    order = []
+
+    async def requester(name, pri, delay):
+        await top.wait(zdc.Time.ns(delay))
+        await arb.acquire(pri)
+        order.append(name)
+        await top.wait(zdc.Time.ns(hold_ns))
+        arb.release()
+
+    await asyncio.gather(*(
+        requester(name, pri, i)
+        for i, (name, pri) in enumerate(reqs)))
+    return order
+
+
+# =============================================================================
+# Policy Tests
+# =============================================================================
+
+def test_arbiter_strict_priority():
+    """Test strict mode grants the highest priority first, FIFO within a level."""
+    print("\n=== Test: Arbiter strict priority ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        arb: MemArbiter = zdc.field()
+
+        async def run(self):
+            order = await grant_order(self, self.arb, [
+                ("first", 0), ("lo", 1), ("hi", 15), ("mid_a", 7), ("mid_b", 7)])
+            assert order == ["first", "hi", "mid_a", "mid_b", "lo"], \
+                f"Grant order: {order}"
+            assert self.arb.max_wait[1] == 39, f"max_wait: {self.arb.max_wait}"
+
+            print("  Arbiter strict priority test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_arbiter_priority_clamped():
+    """Test out-of-range priorities are clamped to 0..15."""
+    print("\n=== Test: Arbiter priority clamp ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        arb: MemArbiter = zdc.field()
+
+        async def run(self):
+            order = await grant_order(self, self.arb, [
+                ("first", 0), ("neg", -4), ("big", 99), ("top", 15)])
+            assert order == ["first", "big", "top", "neg"], f"Grant order: {order}"
+            assert set(self.arb.max_wait.keys()) == {0, 15}
+
+            print("  Arbiter priority clamp test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_arbiter_aging():
+    """Test aging lets a low-priority waiter overtake newer high-priority ones."""
+    print("\n=== Test: Arbiter aging ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        arb: MemArbiter = zdc.field()
+
+        async def run(self):
+            self.arb.aging = 1
+            order = []
+
+            async def hog(name, pri, n):
+                for _ in range(n):
+                    await self.arb.acquire(pri)
+                    order.append(name)
+                    await self.wait(zdc.Time.ns(10))
+                    self.arb.release()
+                    await self.wait(zdc.Time.ns(1))
+
+            async def low():
+                await self.wait(zdc.Time.ns(1))
+                await self.arb.acquire(12)
+                order.append("low")
+                self.arb.release()
+
+            await asyncio.gather(hog("a", 14, 4), hog("b", 14, 4), low())
+
+            # Without aging, "low" would be granted last
+            assert order.index("low") < len(order) - 1, f"Grant order: {order}"
+
+            print("  Arbiter aging test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_arbiter_wrr():
+    """Test weighted round-robin serves every level, weighted by priority."""
+    print("\n=== Test: Arbiter WRR ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        arb: MemArbiter = zdc.field()
+
+        async def run(self):
+            self.arb.mode = ArbMode.WRR
+            reqs = [("first", 0)]
+            reqs += [("hi", 2)] * 6
+            reqs += [("lo", 0)] * 2
+            order = await grant_order(self, self.arb, reqs)
+
+            # Level 2 gets 3 grants per round, level 0 gets 1
+            assert order == ["first", "hi", "hi", "hi", "lo", "hi", "hi", "hi", "lo"], \
+                f"Grant order: {order}"
+
+            print("  Arbiter WRR test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_arbiter_add_ports():
+    """Test raising n_ports grants waiting requesters without a release."""
+    print("\n=== Test: Arbiter add ports ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        arb: MemArbiter = zdc.field()
+
+        async def run(self):
+            granted = {}
+
+            async def requester(name, pri):
+                await self.arb.acquire(pri)
+                granted[name] = self.time().as_ns()
+
+            await self.arb.acquire(0)
+            tasks = [asyncio.ensure_future(requester(name, pri))
+                     for name, pri in (("lo", 1), ("hi", 7), ("min", 0))]
+            await self.wait(zdc.Time.ns(5))
+            assert granted == {}, f"Granted: {granted}"
+
+            # Two new ports go to the two highest-priority waiters
+            self.arb.n_ports = 3
+            await self.wait(zdc.Time.ns(1))
+            assert granted == {"hi": 5, "lo": 5}, f"Granted: {granted}"
+
+            self.arb.release()
+            await asyncio.gather(*tasks)
+            assert granted["min"] == 6, f"Granted: {granted}"
+
+            print("  Arbiter add ports test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Main Test Runner
+# =============================================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MemArbiter Unit Tests")
+    print("=" * 60)
+
+    test_arbiter_strict_priority()
+    test_arbiter_priority_clamped()
+    test_arbiter_aging()
+    test_arbiter_wrr()
+    test_arbiter_add_ports()
+
+    print("\n" + "=" * 60)
+    print("All MemArbiter tests PASSED!")
+    print("=" * 60)
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+# ****************************************************************************
+#  Unit Tests for DmaCsr (dma_csr.py)
+# ****************************************************************************
+
+import sys
+import os
+import asyncio
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../../packages/zuspec-dataclasses/src'))
+
+import zuspec.dataclasses as zdc  # noqa: E402
+from org.zuspec.example.dma import csr  # noqa: E402
+from org.zuspec.example.dma.impl.dma_csr import DmaCsr  # noqa: E402
+from org.zuspec.example.dma.impl.mem_paged import PagedMemory  # noqa: E402
+from org.zuspec.example.dma.impl.mem_router import MemRouter  # noqa: E402
+from org.zuspec.example.dma.impl.op_op_alg import DmaOpOpAlg  # noqa: E402
+from org.zuspec.example.dma.impl.ranges import OverlapPolicy  # noqa: E402
+
+CSR_BASE = 0x4000_0000
+
+
+@zdc.dataclass
+class CsrTestFixture(zdc.Component):
+    """Register block driving a DMA engine over paged memory."""
+    mem: PagedMemory = zdc.field()
+    dma: DmaOpOpAlg = zdc.field()
+    regs: DmaCsr = zdc.field()
+
+    def __bind__(self):
+        return {
+            self.dma.mem: self.mem,
+            self.regs.dma: self.dma,
+        }
+
+    async def program(self, ch: int, src: int, dst: int, size: int, ctrl: int):
+        """Program a channel's registers as a driver would."""
+        self.regs.base = CSR_BASE
+        await self.regs.write(CSR_BASE + csr.GLOBAL_EN, 1, 4)
+        await self.regs.write(CSR_BASE + csr.ch_reg(ch, csr.CH_SRC_ADDR), src, 8)
+        await self.regs.write(CSR_BASE + csr.ch_reg(ch, csr.CH_DST_ADDR), dst, 8)
+        await self.regs.write(CSR_BASE + csr.ch_reg(ch, csr.CH_XFER_SIZE), size, 4)
+        await self.regs.write(CSR_BASE + csr.ch_reg(ch, csr.CH_CTRL), ctrl, 4)
+
+    async def status(self, ch: int) -> int:
+        return await self.regs.read(CSR_BASE + csr.ch_reg(ch, csr.CH_STATUS))
+
+    async def poll(self, ch: int) -> int:
+        """Poll a channel's STATUS until the transfer is no longer active."""
+        while True:
+            status = await self.status(ch)
+            if not (status & csr.STATUS_ACTIVE):
+                return status
+            await self.wait(zdc.Time.ns(1))
+
+
+# =============================================================================
+# Register Access Tests
+# =============================================================================
+
+def test_csr_register_access():
+    """Test register read-back, 32-bit halves and unmapped addresses."""
+    print("\n=== Test: CSR register access ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: CsrTestFixture = zdc.field()
+
+        async def run(self):
+            regs = self.fixture.regs
+            src = CSR_BASE + csr.ch_reg(2, csr.CH_SRC_ADDR)
+            regs.base = CSR_BASE
+
+            # 64-bit write, then replace each half with a 32-bit write
+            await regs.write(src, 0x1122334455667788, 8)
+            assert await regs.read(src) == 0x1122334455667788
+            await regs.write(src, 0xAABBCCDD, 4)
+            assert await regs.read(src) == 0x11223344AABBCCDD
+            await regs.write(src + 4, 0x01020304, 4)
+            assert await regs.read(src) == 0x01020304AABBCCDD
+            assert await regs.read(src + 4) == 0x01020304
+
+            # Byte and halfword writes replace only their bytes
+            size = CSR_BASE + csr.ch_reg(2, csr.CH_XFER_SIZE)
+            await regs.write(size, 0x12345678, 4)
+            await regs.write(size + 1, 0xAB, 1)
+            await regs.write(size + 2, 0xCDEF, 2)
+            assert await regs.read(size) == 0xCDEFAB78
+            await regs.write(src + 5, 0x99, 1)
+            assert await regs.read(src) == 0x01029904AABBCCDD
+
+            # START and RESET are self-clearing and do not read back
+            ctrl = CSR_BASE + csr.ch_reg(2, csr.CH_CTRL)
+            await regs.write(ctrl, csr.CTRL_INT_EN | csr.CTRL_START, 4)
+            assert await regs.read(ctrl) == csr.CTRL_INT_EN
+            await regs.write(ctrl + 1, csr.CTRL_ERR_INT_EN >> 8, 1)
+            assert await regs.read(ctrl) == csr.CTRL_ERR_INT_EN
+            await regs.write(ctrl, csr.CTRL_ENABLE, 1)
+            assert await regs.read(ctrl) == (
+                csr.CTRL_ERR_INT_EN | csr.CTRL_ENABLE)
+
+            assert await self.fixture.status(2) == csr.STATUS_IDLE
+            assert await regs.read(CSR_BASE + 0x80) == 0
+            assert await regs.read(CSR_BASE + csr.ch_reg(4, csr.CH_CTRL)) == 0
+
+            print("  CSR register access test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Transfer Tests
+# =============================================================================
+
+def test_csr_programmatic_transfer():
+    """Test START launches a memcpy and COMPLETE is read-to-clear."""
+    print("\n=== Test: CSR programmatic transfer ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: CsrTestFixture = zdc.field()
+
+        async def run(self):
+            f = self.fixture
+            f.mem.write_delay = zdc.Time.ns(1)
+            data = bytes((i * 7 + 1) & 0xFF for i in range(256))
+            f.mem.load(0x1000, data)
+
+            await f.program(
+                1, src=0x1000, dst=0x8000, size=64,
+                ctrl=csr.CTRL_ENABLE | csr.CTRL_START)
+            assert await f.status(1) & csr.STATUS_ACTIVE
+
+            status = await f.poll(1)
+            assert status == csr.STATUS_IDLE | csr.STATUS_COMPLETE
+            assert await f.status(1) == csr.STATUS_IDLE
+            assert f.mem.dump(0x8000, 256) == data
+            assert f.regs.channel_time(1) > 0
+
+            print("  CSR programmatic transfer test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_csr_global_enable():
+    """Test START is ignored while GLOBAL_EN is clear."""
+    print("\n=== Test: CSR global enable ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: CsrTestFixture = zdc.field()
+
+        async def run(self):
+            f = self.fixture
+            f.mem.load(0x1000, b"\x5a" * 16)
+            await f.program(
+                0, src=0x1000, dst=0x2000, size=4, ctrl=0)
+            await f.regs.write(CSR_BASE + csr.GLOBAL_EN, 0, 4)
+            await f.regs.write(
+                CSR_BASE + csr.ch_reg(0, csr.CH_CTRL),
+                csr.CTRL_ENABLE | csr.CTRL_START, 4)
+            await self.wait(zdc.Time.ns(10))
+
+            assert await f.status(0) == csr.STATUS_IDLE
+            assert f.mem.dump(0x2000, 16) == bytes(16)
+
+            print("  CSR global enable test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_csr_peripheral_trigger():
+    """Test a TRIG_MODE channel arms on ENABLE and runs on one request."""
+    print("\n=== Test: CSR peripheral trigger ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: CsrTestFixture = zdc.field()
+
+        async def run(self):
+            f = self.fixture
+            data = bytes(range(32))
+            f.mem.load(0x1000, data)
+
+            ctrl = (csr.CTRL_ENABLE | csr.CTRL_TRIG_MODE
+                    | (5 << csr.CTRL_TRIG_SEL_SHIFT))
+            await f.program(3, src=0x1000, dst=0x3000, size=8, ctrl=ctrl)
+
+            await self.wait(zdc.Time.ns(10))
+            assert await f.status(3) == csr.STATUS_ACTIVE
+            assert f.mem.dump(0x3000, 32) == bytes(32)
+
+            await f.dma.req_transfer(5)
+            status = await f.poll(3)
+            assert status == csr.STATUS_IDLE | csr.STATUS_COMPLETE
+            assert f.mem.dump(0x3000, 32) == data
+
+            print("  CSR peripheral trigger test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_csr_reset_queued():
+    """Test RESET of a channel waiting for the memory port frees its place."""
+    print("\n=== Test: CSR reset queued ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: CsrTestFixture = zdc.field()
+
+        async def run(self):
+            f = self.fixture
+            f.mem.read_delay = zdc.Time.ns(10)
+            data = bytes((i * 3) & 0xFF for i in range(64))
+            f.mem.load(0x1000, data)
+            start = csr.CTRL_ENABLE | csr.CTRL_START
+
+            # Channel 0 holds the memory port while channel 1 queues for it
+            await f.program(0, src=0x1000, dst=0x8000, size=0x400, ctrl=start)
+            await f.program(1, src=0x1000, dst=0x2000, size=16, ctrl=start)
+            await self.wait(zdc.Time.ns(5))
+            assert len(f.dma.arb._waiters) == 1
+
+            await f.regs.write(
+                CSR_BASE + csr.ch_reg(1, csr.CH_CTRL), csr.CTRL_RESET, 4)
+            await asyncio.sleep(0)
+            assert len(f.dma.arb._waiters) == 0
+            assert await f.status(1) == csr.STATUS_IDLE
+
+            assert await f.poll(0) == csr.STATUS_IDLE | csr.STATUS_COMPLETE
+            assert f.mem.dump(0x2000, 64) == bytes(64)
+
+            # The port is free again, so channel 1 runs to completion
+            await f.program(1, src=0x1000, dst=0x2000, size=16, ctrl=start)
+            assert await f.poll(1) == csr.STATUS_IDLE | csr.STATUS_COMPLETE
+            assert f.mem.dump(0x2000, 64) == data
+            assert f.dma.arb._active == 0
+
+            print("  CSR reset queued test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Error and Interrupt Tests
+# =============================================================================
+
+def test_csr_errors():
+    """Test size and alignment errors, and RESET returning to idle."""
+    print("\n=== Test: CSR errors ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: CsrTestFixture = zdc.field()
+
+        async def run(self):
+            f = self.fixture
+            start = csr.CTRL_ENABLE | csr.CTRL_START
+            err = csr.STATUS_IDLE | csr.STATUS_ERROR
+
+            await f.program(0, src=0x1000, dst=0x2000, size=0, ctrl=start)
+            status = await f.status(0)
+            assert status == err | (csr.ERR_SIZE << csr.STATUS_ERR_CODE_SHIFT)
+
+            await f.program(0, src=0x1002, dst=0x2000, size=4, ctrl=start)
+            status = await f.status(0)
+            assert status == err | (csr.ERR_ALIGN << csr.STATUS_ERR_CODE_SHIFT)
+
+            # ERROR is read-to-clear; RESET clears ERR_CODE
+            assert not (await f.status(0) & csr.STATUS_ERROR)
+            await f.regs.write(
+                CSR_BASE + csr.ch_reg(0, csr.CH_CTRL), csr.CTRL_RESET, 4)
+            assert await f.status(0) == csr.STATUS_IDLE
+
+            print("  CSR errors test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_csr_interrupts():
+    """Test INT_STATUS and irq follow enabled completions and errors."""
+    print("\n=== Test: CSR interrupts ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: CsrTestFixture = zdc.field()
+
+        async def run(self):
+            f = self.fixture
+            int_status = CSR_BASE + csr.INT_STATUS
+            f.mem.load(0x1000, b"\x33" * 64)
+
+            # Completion without INT_EN raises no interrupt
+            await f.program(
+                0, src=0x1000, dst=0x2000, size=4,
+                ctrl=csr.CTRL_ENABLE | csr.CTRL_START)
+            await f.poll(0)
+            assert await f.regs.read(int_status) == 0
+            assert not f.regs.irq.is_set()
+
+            await f.program(
+                1, src=0x1000, dst=0x3000, size=16,
+                ctrl=csr.CTRL_ENABLE | csr.CTRL_START | csr.CTRL_INT_EN)
+            await f.program(
+                2, src=0x1000, dst=0x4000, size=0,
+                ctrl=csr.CTRL_ENABLE | csr.CTRL_START | csr.CTRL_ERR_INT_EN)
+
+            await f.regs.irq.wait()
+            while await f.regs.read(int_status) != 0b110:
+                await self.wait(zdc.Time.ns(1))
+
+            # Reading each channel's STATUS clears its interrupt
+            assert await f.status(2) & csr.STATUS_ERROR
+            assert await f.regs.read(int_status) == 0b010
+            assert f.regs.irq.is_set()
+            assert await f.status(1) & csr.STATUS_COMPLETE
+            assert await f.regs.read(int_status) == 0
+            assert not f.regs.irq.is_set()
+
+            print("  CSR interrupts test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_csr_engine_error():
+    """Test a transfer the engine rejects ends in an ERR_XFER error."""
+    print("\n=== Test: CSR engine error ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: CsrTestFixture = zdc.field()
+
+        async def run(self):
+            f = self.fixture
+            f.dma.overlap = OverlapPolicy.REJECT
+            f.mem.load(0x1000, b"\x77" * 64)
+            ctrl = csr.CTRL_ENABLE | csr.CTRL_START | csr.CTRL_ERR_INT_EN
+
+            # The destination overlaps the source, so the engine refuses it
+            await f.program(0, src=0x1000, dst=0x1010, size=16, ctrl=ctrl)
+            await f.regs.irq.wait()
+            assert await f.regs.read(CSR_BASE + csr.INT_STATUS) == 0b1
+            status = await f.status(0)
+            assert status == (csr.STATUS_IDLE | csr.STATUS_ERROR
+                              | (csr.ERR_XFER << csr.STATUS_ERR_CODE_SHIFT))
+            assert not f.regs.irq.is_set()
+
+            # The channel is usable again
+            await f.program(0, src=0x1000, dst=0x2000, size=16, ctrl=ctrl)
+            assert await f.poll(0) == csr.STATUS_IDLE | csr.STATUS_COMPLETE
+            assert f.mem.dump(0x2000, 64) == b"\x77" * 64
+
+            print("  CSR engine error test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_csr_address_errors():
+    """Test unmapped source and destination addresses set their codes."""
+    print("\n=== Test: CSR address errors ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: PagedMemory = zdc.field()
+        router: MemRouter = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+        regs: DmaCsr = zdc.field()
+
+        def __bind__(self):
+            return {
+                self.dma.mem: self.router,
+                self.regs.dma: self.dma,
+            }
+
+        async def run(self):
+            self.router.map_target(0x0, 0x10000, self.mem)
+            regs = self.regs
+            regs.base = CSR_BASE
+            await regs.write(CSR_BASE + csr.GLOBAL_EN, 1, 4)
+
+            for src, dst, code in ((0x20000, 0x2000, csr.ERR_SRC_ADDR),
+                                   (0x1000, 0x20000, csr.ERR_DST_ADDR)):
+                await regs.write(
+                    CSR_BASE + csr.ch_reg(0, csr.CH_SRC_ADDR), src, 8)
+                await regs.write(
+                    CSR_BASE + csr.ch_reg(0, csr.CH_DST_ADDR), dst, 8)
+                await regs.write(
+                    CSR_BASE + csr.ch_reg(0, csr.CH_XFER_SIZE), 4, 4)
+                await regs.write(
+                    CSR_BASE + csr.ch_reg(0, csr.CH_CTRL),
+                    csr.CTRL_ENABLE | csr.CTRL_START, 4)
+                await self.wait(zdc.Time.ns(10))
+                status = await regs.read(
+                    CSR_BASE + csr.ch_reg(0, csr.CH_STATUS))
+                assert status == (csr.STATUS_IDLE | csr.STATUS_ERROR
+                                  | (code << csr.STATUS_ERR_CODE_SHIFT))
+
+            print("  CSR address errors test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Main Test Runner
+# =============================================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("DmaCsr Unit Tests")
+    print("=" * 60)
+
+    test_csr_register_access()
+    test_csr_programmatic_transfer()
+    test_csr_global_enable()
+    test_csr_peripheral_trigger()
+    test_csr_reset_queued()
+    test_csr_errors()
+    test_csr_interrupts()
+    test_csr_engine_error()
+    test_csr_address_errors()
+
+    print("\n" + "=" * 60)
+    print("All DmaCsr tests PASSED!")
+    print("=" * 60)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# ****************************************************************************
+#  Unit Tests for the analytical transfer estimator (estimate.py)
+# ****************************************************************************
+
+import sys
+import os
+import asyncio
+from dataclasses import dataclass as py_dataclass
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../../packages/zuspec-dataclasses/src'))
+
+import zuspec.dataclasses as zdc  # noqa: E402
+from org.zuspec.example.dma.impl.align import (  # noqa: E402
+    _access_counts, _access_size)
+from org.zuspec.example.dma.impl.estimate import (  # noqa: E402
+    MemModel, XferEstimator)
+from org.zuspec.example.dma.impl.mem_paged import PagedMemory  # noqa: E402
+from org.zuspec.example.dma.impl.op_op_alg import DmaOpOpAlg  # noqa: E402
+
+
+@py_dataclass
+class MemCpyTest:
+    """Test data class for memory copy operations."""
+    src: int
+    dst: int
+    sz: int
+
+
+@py_dataclass
+class DevCpyTest:
+    """Test data class for device copy operations."""
+    src: int
+    dst: int
+    sz: int
+    acc_sz: int
+    chk_sz: int
+    inc_src: bool
+    inc_dst: bool
+
+
+@zdc.dataclass
+class WordMemory(zdc.Component):
+    """Memory limited to single-word MemoryOp accesses."""
+    pages: PagedMemory = zdc.field()
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        return await self.pages.read(addr)
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        await self.pages.write(addr, data, size)
+
+
+def check(est, st):
+    """Assert an estimate matches the engine's statistics."""
+    assert est.reads == st.reads, (est, st)
+    assert est.writes == st.writes, (est, st)
+    assert (est.burst_reads, est.burst_writes) == (
+        st.burst_reads, st.burst_writes), (est, st)
+    assert est.nbytes == st.nbytes, (est, st)
+    assert est.elapsed_ns == st.elapsed_ns, (est, st)
+
+
+# =============================================================================
+# Alignment Tests
+# =============================================================================
+
+def test_access_counts():
+    """Test the closed-form access counts match the access walk."""
+    print("\n=== Test: access counts ===")
+
+    for addr in range(16):
+        for nbytes in range(40):
+            counts = {}
+            a, n = addr, nbytes
+            while n > 0:
+                sz = _access_size(a, n)
+                counts[sz] = counts.get(sz, 0) + 1
+                a += sz
+                n -= sz
+            assert _access_counts(addr, nbytes) == counts, (addr, nbytes)
+
+    print("  access counts test PASSED")
+
+
+# =============================================================================
+# Cross-Check Tests
+# =============================================================================
+
+def test_estimate_memcpy():
+    """Test memcpy estimates against the engine, burst and word paths."""
+    print("\n=== Test: estimate memcpy ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        pages: PagedMemory = zdc.field()
+        words: WordMemory = zdc.field()
+        dma_burst: DmaOpOpAlg = zdc.field()
+        dma_word: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {
+                self.dma_burst.mem: self.pages,
+                self.dma_word.mem: self.words,
+            }
+
+        async def run(self):
+            for mem in (self.pages, self.words.pages):
+                mem.read_delay = zdc.Time.ns(7)
+                mem.write_delay = zdc.Time.ns(5)
+                mem.beat_delay = zdc.Time.ns(1)
+            for dma in (self.dma_burst, self.dma_word):
+                dma.stats = True
+                dma.max_burst = 512
+                dma.arb_quantum = 1000
+
+            model = MemModel.from_paged(self.pages)
+            est_burst = XferEstimator.for_engine(self.dma_burst, model)
+            est_word = XferEstimator.for_engine(
+                self.dma_word, MemModel(7, 5, burst=False))
+
+            for sz in (1, 13, 100, 2999):
+                for src_off, dst_off in ((0, 0), (3, 0), (0, 6), (5, 2)):
+                    src, dst = 0x10000 + src_off, 0x20000 + dst_off
+                    st = await self.dma_burst.memcpy(src=src, dst=dst, sz=sz)
+                    check(est_burst.memcpy(src, dst, sz), st)
+                    st = await self.dma_word.memcpy(src=src, dst=dst, sz=sz)
+                    check(est_word.memcpy(src, dst, sz), st)
+
+            xfers = [MemCpyTest(0x10001, 0x20000, 700),
+                     MemCpyTest(0x11000, 0x21003, 90)]
+            st = await self.dma_burst.memcpy_chain(xfers)
+            check(est_burst.memcpy_chain(xfers), st)
+
+            print("  estimate memcpy test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_estimate_devcpy():
+    """Test devcpy estimates against the engine."""
+    print("\n=== Test: estimate devcpy ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: PagedMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def devcpy(self, xfers):
+            # Requests are pending for every chunk before the copy starts
+            for x in xfers:
+                chunk = x.acc_sz * x.chk_sz
+                for _ in range((x.sz + chunk - 1) // chunk):
+                    await self.dma.req_transfer(4)
+            return await self.dma.devcpy_chain(xfers, req_id=4)
+
+        async def run(self):
+            self.mem.read_delay = zdc.Time.ns(7)
+            self.mem.write_delay = zdc.Time.ns(5)
+            self.mem.beat_delay = zdc.Time.ns(2)
+            self.dma.stats = True
+            est = XferEstimator.for_engine(
+                self.dma, MemModel.from_paged(self.mem))
+
+            for acc_sz in (1, 2, 4, 8):
+                for inc_src, inc_dst in ((True, True), (True, False), (False, True)):
+                    x = DevCpyTest(0x1003, 0x4005, 50, acc_sz=acc_sz, chk_sz=3,
+                                   inc_src=inc_src, inc_dst=inc_dst)
+                    st = await self.devcpy([x])
+                    check(est.devcpy_chain([x]), st)
+                    check(est.devcpy(x.src, x.dst, x.sz, x.acc_sz, x.chk_sz,
+                                     x.inc_src, x.inc_dst), st)
+
+            print("  estimate devcpy test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_estimate_large():
+    """Test estimates of large transfers are computed in closed form."""
+    print("\n=== Test: estimate large ===")
+
+    est = XferEstimator(MemModel(10, 10, 1))
+    st = est.memcpy(0x3, 0x1 << 40, 1 << 40)
+    assert st.burst_reads == (1 << 40) // 4096
+    assert st.nbytes == 1 << 40
+    assert st.bandwidth > 0
+
+    print("  estimate large test PASSED")
+
+
+# =============================================================================
+# Main Test Runner
+# =============================================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Estimator Unit Tests")
+    print("=" * 60)
+
+    test_access_counts()
+    test_estimate_memcpy()
+    test_estimate_devcpy()
+    test_estimate_large()
+
+    print("\n" + "=" * 60)
+    print("All estimator tests PASSED!")
+    print("=" * 60)
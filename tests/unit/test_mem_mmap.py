@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# ****************************************************************************
+#  Unit Tests for MmapMemory (mem_mmap.py)
+# ****************************************************************************
+
+import sys
+import os
+import asyncio
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../../packages/zuspec-dataclasses/src'))
+
+import zuspec.dataclasses as zdc  # noqa: E402
+from org.zuspec.example.dma.impl.mem_mmap import MmapMemory  # noqa: E402
+from org.zuspec.example.dma.impl.op_op_alg import DmaOpOpAlg  # noqa: E402
+
+
+def make_image(dirname, name, data):
+    """Write data to a file in dirname and return its path."""
+    path = os.path.join(dirname, name)
+    with open(path, "wb") as fp:
+        fp.write(data)
+    return path
+
+
+# =============================================================================
+# Mapping Tests
+# =============================================================================
+
+def test_mmap_read_only():
+    """Test reads come from the mapped file and writes are rejected."""
+    print("\n=== Test: MmapMemory read-only ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: MmapMemory = zdc.field()
+
+        async def run(self):
+            with tempfile.TemporaryDirectory() as tmp:
+                data = bytes(range(256)) * 64
+                path = make_image(tmp, "fw.bin", data)
+
+                # Map a window starting at an unaligned file offset
+                assert self.mem.map_file(0x10000, path, offset=100, size=1000) == 1000
+                assert self.mem.dump(0x10000, 1000) == data[100:1100]
+                assert await self.mem.read(0x10000) == \
+                    int.from_bytes(data[100:108], "little")
+
+                # Straddles the end of the region into unmapped memory
+                assert self.mem.dump(0x10000 + 996, 8) == data[1096:1100] + bytes(4)
+
+                try:
+                    await self.mem.write(0x10000, 0, 8)
+                    assert False, "Write to read-only mapping should fail"
+                except PermissionError:
+                    pass
+
+                # Unmapped memory is still writable
+                await self.mem.write(0x20000, 0x1234, 2)
+                assert await self.mem.read(0x20000) == 0x1234
+
+                try:
+                    self.mem.map_file(0x10200, path)
+                    assert False, "Overlapping mapping should fail"
+                except ValueError:
+                    pass
+
+                self.mem.close()
+
+            print("  MmapMemory read-only test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_mmap_copy_on_write():
+    """Test copy-on-write mappings accept writes without modifying the file."""
+    print("\n=== Test: MmapMemory copy-on-write ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: MmapMemory = zdc.field()
+
+        async def run(self):
+            with tempfile.TemporaryDirectory() as tmp:
+                data = bytes(4096)
+                path = make_image(tmp, "ds.bin", data)
+
+                self.mem.map_file(0x8000, path, cow=True)
+                await self.mem.write(0x8010, 0xDEADBEEF, 4)
+                assert await self.mem.read(0x8010) == 0xDEADBEEF
+
+                self.mem.unmap(0x8000)
+                with open(path, "rb") as fp:
+                    assert fp.read() == data
+
+            print("  MmapMemory copy-on-write test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_mmap_dma_and_save():
+    """Test DMA from a mapped image into pages and saving the result."""
+    print("\n=== Test: MmapMemory DMA and save ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: MmapMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            with tempfile.TemporaryDirectory() as tmp:
+                data = bytes((i * 7) & 0xFF for i in range(100000))
+                path = make_image(tmp, "img.bin", data)
+                self.mem.map_file(0x100000, path)
+
+                await self.dma.memcpy(src=0x100003, dst=0x400001, sz=90000)
+                assert self.mem.dump(0x400001, 90000) == data[3:90003]
+
+                # Save a range spanning the mapping, a gap, and the copy
+                out = os.path.join(tmp, "out.bin")
+                self.mem.save(0x100000, 0x400001 + 90000 - 0x100000, out, chunk=4096)
+                with open(out, "rb") as fp:
+                    saved = fp.read()
+                assert saved[:len(data)] == data
+                assert saved[len(data):0x300001] == bytes(0x300001 - len(data))
+                assert saved[0x300001:] == data[3:90003]
+
+                self.mem.close()
+
+            print("  MmapMemory DMA and save test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Main Test Runner
+# =============================================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MmapMemory Unit Tests")
+    print("=" * 60)
+
+    test_mmap_read_only()
+    test_mmap_copy_on_write()
+    test_mmap_dma_and_save()
+
+    print("\n" + "=" * 60)
+    print("All MmapMemory tests PASSED!")
+    print("=" * 60)
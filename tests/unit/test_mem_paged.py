@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# ****************************************************************************
+#  Unit Tests for PagedMemory (mem_paged.py)
+# ****************************************************************************
+
+import sys
+import os
+import asyncio
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../../packages/zuspec-dataclasses/src'))
+
+import zuspec.dataclasses as zdc  # noqa: E402
+from org.zuspec.example.dma.impl.mem_paged import PagedMemory  # noqa: E402
+from org.zuspec.example.dma.impl.op_op_alg import DmaOpOpAlg  # noqa: E402
+
+
+# =============================================================================
+# Access Tests
+# =============================================================================
+
+def test_paged_read_write():
+    """Test word accesses, including ones that straddle a page boundary."""
+    print("\n=== Test: PagedMemory read/write ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: PagedMemory = zdc.field()
+
+        async def run(self):
+            self.mem.page_size = 64
+
+            # Unwritten memory reads as zero and allocates nothing
+            assert await self.mem.read(0x1000) == 0
+            assert len(self.mem._pages) == 0
+
+            await self.mem.write(0x1000, 0x1122334455667788, 8)
+            assert await self.mem.read(0x1000) == 0x1122334455667788
+
+            # Only the low 'size' bytes are written
+            await self.mem.write(0x2000, 0xAABBCCDD, 2)
+            assert await self.mem.read(0x2000) == 0xCCDD
+
+            # Straddles the 64-byte page boundary at 0x3040
+            await self.mem.write(0x303D, 0x0807060504030201, 8)
+            assert await self.mem.read(0x303D) == 0x0807060504030201
+            assert self.mem.dump(0x3040, 5) == bytes([4, 5, 6, 7, 8])
+
+            print("  PagedMemory read/write test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_paged_load_dump():
+    """Test bulk load/dump across pages and unallocated gaps."""
+    print("\n=== Test: PagedMemory load/dump ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: PagedMemory = zdc.field()
+
+        async def run(self):
+            data = bytes((i * 13) & 0xFF for i in range(10000))
+            self.mem.load(0x10003, data)
+            assert self.mem.dump(0x10003, len(data)) == data
+            assert self.mem.dump(0x10000, 3) == bytes(3)
+
+            # Gap between two loaded regions reads as zero
+            self.mem.load(0x40000, b"\xff" * 16)
+            gap = self.mem.dump(0x10003 + len(data), 0x40000 - 0x10003 - len(data))
+            assert gap == bytes(len(gap))
+
+            self.mem.clear()
+            assert self.mem.dump(0x10003, 16) == bytes(16)
+
+            print("  PagedMemory load/dump test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_paged_delays():
+    """Test word and burst access latency."""
+    print("\n=== Test: PagedMemory delays ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: PagedMemory = zdc.field()
+
+        async def run(self):
+            self.mem.read_delay = zdc.Time.ns(10)
+            self.mem.write_delay = zdc.Time.ns(20)
+            self.mem.beat_delay = zdc.Time.ns(2)
+
+            start = self.time().as_ns()
+            await self.mem.write(0x100, 1, 1)
+            await self.mem.read(0x100)
+            assert self.time().as_ns() - start == 30
+
+            # 64-byte burst: latency + 7 additional beats
+            start = self.time().as_ns()
+            await self.mem.write_burst(0x100, bytes(64))
+            assert self.time().as_ns() - start == 20 + 7 * 2
+            start = self.time().as_ns()
+            await self.mem.read_burst(0x100, 64)
+            assert self.time().as_ns() - start == 10 + 7 * 2
+
+            print("  PagedMemory delays test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# DMA Integration Tests
+# =============================================================================
+
+def test_paged_dma_memcpy():
+    """Test DMA memcpy through PagedMemory, using the burst path."""
+    print("\n=== Test: PagedMemory DMA memcpy ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: PagedMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            sz = 1 << 20
+            data = bytes((i * 31 + 7) & 0xFF for i in range(sz))
+            self.mem.load(0x100005, data)
+
+            await self.dma.memcpy(src=0x100005, dst=0x800003, sz=sz)
+
+            assert self.mem.dump(0x800003, sz) == data
+            assert self.mem.dump(0x800000, 3) == bytes(3)
+            assert self.mem.dump(0x800003 + sz, 8) == bytes(8)
+
+            print("  PagedMemory DMA memcpy test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Main Test Runner
+# =============================================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PagedMemory Unit Tests")
+    print("=" * 60)
+
+    test_paged_read_write()
+    test_paged_load_dump()
+    test_paged_delays()
+    test_paged_dma_memcpy()
+
+    print("\n" + "=" * 60)
+    print("All PagedMemory tests PASSED!")
+    print("=" * 60)
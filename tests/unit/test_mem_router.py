@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# ****************************************************************************
+#  Unit Tests for the address router (mem_router.py)
+# ****************************************************************************
+
+import sys
+import os
+import asyncio
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../../packages/zuspec-dataclasses/src'))
+
+import zuspec.dataclasses as zdc  # noqa: E402
+from org.zuspec.example.dma.impl.mem_router import MemRouter  # noqa: E402
+from org.zuspec.example.dma.impl.mem_paged import PagedMemory  # noqa: E402
+from org.zuspec.example.dma.impl.op_op_alg import DmaOpOpAlg  # noqa: E402
+
+
+@zdc.dataclass
+class WordMemory(zdc.Component):
+    """Memory limited to single-word MemoryOp accesses."""
+    pages: PagedMemory = zdc.field()
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        return await self.pages.read(addr)
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        await self.pages.write(addr, data, size)
+
+
+# =============================================================================
+# Routing Tests
+# =============================================================================
+
+def test_router_map():
+    """Test region mapping, address translation and boundary splitting."""
+    print("\n=== Test: router map ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        ddr: PagedMemory = zdc.field()
+        sram: PagedMemory = zdc.field()
+        router: MemRouter = zdc.field()
+
+        async def run(self):
+            r = self.router
+            r.map_target(0x0000, 0x1000, self.ddr)
+            r.map_target(0x1000, 0x1000, self.sram, tgt_base=0)
+
+            for base, size in ((0x1800, 0x10), (0x0, 0x1), (0x1FFF, 0x2)):
+                try:
+                    r.map_target(base, size, self.ddr)
+                    assert False, "Expected ValueError"
+                except ValueError:
+                    pass
+
+            # Backdoor accesses are split and translated
+            data = bytes(range(32))
+            r.load(0x0FF0, data)
+            assert self.ddr.dump(0x0FF0, 16) == data[:16]
+            assert self.sram.dump(0x0000, 16) == data[16:]
+            assert r.dump(0x0FF0, 32) == data
+
+            # Word accesses spanning the boundary
+            assert await r.read(0x0FFC) == int.from_bytes(data[12:20], "little")
+            await r.write(0x0FFE, 0xAABBCCDD, 4)
+            assert self.ddr.dump(0x0FFE, 2) == b"\xdd\xcc"
+            assert self.sram.dump(0x0000, 2) == b"\xbb\xaa"
+
+            # Bursts spanning the boundary
+            await r.write_burst(0x0FF8, bytes([0x55] * 16))
+            assert self.sram.dump(0, 8) == bytes([0x55] * 8)
+            assert await r.read_burst(0x0FF8, 16) == bytes([0x55] * 16)
+
+            # A word read past the top of the map reads zeros there
+            self.sram.load(0x0FFC, b"\x01\x02\x03\x04")
+            assert await r.read(0x1FFC) == 0x04030201
+            try:
+                await r.write(0x1FFC, 0, 8)
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+
+            assert r.target_stats(0x1000)[0] > 0
+            r.unmap(0x1000)
+            try:
+                r.unmap(0x1000)
+                assert False, "Expected KeyError"
+            except KeyError:
+                pass
+
+            print("  router map test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_router_protocols():
+    """Test bursts and backdoor are only exposed if every target has them."""
+    print("\n=== Test: router protocols ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        ddr: PagedMemory = zdc.field()
+        fifo: WordMemory = zdc.field()
+        router: MemRouter = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.router}
+
+        async def run(self):
+            r = self.router
+            assert not hasattr(r, "read_burst")
+            r.map_target(0x0000, 0x10000, self.ddr)
+            assert hasattr(r, "read_burst") and hasattr(r, "load")
+
+            r.map_target(0x10000, 0x1000, self.fifo)
+            assert not hasattr(r, "read_burst") and not hasattr(r, "dump")
+
+            # Word-path copy from the DDR into the word-only target
+            data = bytes((i * 3) & 0xFF for i in range(100))
+            self.ddr.load(0x103, data)
+            await self.dma.memcpy(src=0x103, dst=0x10001, sz=len(data))
+            assert self.fifo.pages.dump(0x10001, len(data)) == data
+
+            print("  router protocols test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Contention Tests
+# =============================================================================
+
+def test_router_contention():
+    """Test transfers to different targets overlap, and to one do not."""
+    print("\n=== Test: router contention ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        ddr: PagedMemory = zdc.field()
+        sram: PagedMemory = zdc.field()
+        router: MemRouter = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.router}
+
+        async def run(self):
+            self.ddr.read_delay = zdc.Time.ns(20)
+            self.ddr.write_delay = zdc.Time.ns(20)
+            self.sram.read_delay = zdc.Time.ns(5)
+            self.sram.write_delay = zdc.Time.ns(5)
+            self.router.map_target(0x00000, 0x10000, self.ddr)
+            self.router.map_target(0x10000, 0x10000, self.sram)
+            self.dma.arb.n_ports = 2
+
+            async def elapsed(*xfers):
+                start = self.time().as_ns()
+                await asyncio.gather(*(
+                    self.dma.memcpy(src=s, dst=d, sz=0x100)
+                    for s, d in xfers))
+                return self.time().as_ns() - start
+
+            # Copies within each target, alone and side by side
+            t_ddr = await elapsed((0x0000, 0x1000))
+            t_sram = await elapsed((0x10000, 0x11000))
+            t_both = await elapsed((0x0000, 0x2000), (0x10000, 0x12000))
+            assert t_both == max(t_ddr, t_sram), (t_ddr, t_sram, t_both)
+
+            # Two copies within the DDR share its single port
+            t_ddr2 = await elapsed((0x0000, 0x3000), (0x4000, 0x5000))
+            assert t_ddr2 >= 2 * t_ddr - 40, (t_ddr, t_ddr2)
+            assert self.router.target_stats(0x0)[1] > 0
+            assert self.router.target_stats(0x10000)[1] == 0
+
+            print("  router contention test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_router_cancel():
+    """Test an access cancelled while waiting for a port frees its place."""
+    print("\n=== Test: router cancel ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        ddr: PagedMemory = zdc.field()
+        router: MemRouter = zdc.field()
+
+        async def run(self):
+            self.ddr.read_delay = zdc.Time.ns(20)
+            self.router.map_target(0x0, 0x10000, self.ddr)
+            self.ddr.load(0x100, b"\x11" * 8)
+
+            first = asyncio.ensure_future(self.router.read(0x100))
+            queued = asyncio.ensure_future(self.router.read(0x100))
+            await self.wait(zdc.Time.ns(5))
+            queued.cancel()
+            assert await first == 0x1111111111111111
+
+            # Cancelled just as the port is handed over
+            first = asyncio.ensure_future(self.router.read(0x100))
+            queued = asyncio.ensure_future(self.router.read(0x100))
+            await self.wait(zdc.Time.ns(20))
+            queued.cancel()
+            await first
+
+            start = self.time().as_ns()
+            assert await self.router.read(0x100) == 0x1111111111111111
+            assert self.time().as_ns() - start == 20
+
+            print("  router cancel test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Main Test Runner
+# =============================================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Memory Router Unit Tests")
+    print("=" * 60)
+
+    test_router_map()
+    test_router_protocols()
+    test_router_contention()
+    test_router_cancel()
+
+    print("\n" + "=" * 60)
+    print("All memory router tests PASSED!")
+    print("=" * 60)
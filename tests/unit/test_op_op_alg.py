@@ -16,7 +16,9 @@ sys.path.insert(0, os.path.join(
 
 import zuspec.dataclasses as zdc  # noqa: E402
 from org.zuspec.example.dma.op import DmaOp  # noqa: E402
+from org.zuspec.example.dma.desc import pack_devcpy_desc, pack_memcpy_desc  # noqa: E402
 from org.zuspec.example.dma.impl.op_op_alg import DmaOpOpAlg  # noqa: E402
+from org.zuspec.example.dma.impl.mem_paged import PagedMemory  # noqa: E402
 from org.zuspec.example.dma.mem import MemoryOp  # noqa: E402
 from org.zuspec.example.dma.req import ReqOp  # noqa: E402
 
@@ -81,6 +83,101 @@ class MockMemory(zdc.Component):
             self.storage[addr + i] = (data >> (i * 8)) & 0xFF
 
 
+@zdc.dataclass
+class BurstMemory(MockMemory):
+    """Mock memory that also implements the MemoryBurstOp extension.
+
+    Records (addr, nbytes) for every burst and (addr, size) for every
+    word write so tests can check which path the DMA used.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.bursts = []
+        self.word_writes = []
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        self.word_writes.append((addr, size))
+        await super().write(addr, data, size)
+
+    async def read_burst(self, addr: zdc.u64, nbytes: zdc.u32) -> bytes:
+        if self.read_delay is not None:
+            await self.wait(self.read_delay)
+        return bytes(self.storage.get(addr + i, 0) for i in range(nbytes))
+
+    async def write_burst(self, addr: zdc.u64, data: bytes) -> None:
+        if self.write_delay is not None:
+            await self.wait(self.write_delay)
+        self.bursts.append((addr, len(data)))
+        for i, b in enumerate(data):
+            self.storage[addr + i] = b
+
+
+# Address of the device FIFO register in FifoMemory
+FIFO_ADDR = 0xF000
+
+
+@zdc.dataclass
+class FifoMemory(zdc.Component):
+    """Burst-capable memory with a device FIFO register at FIFO_ADDR.
+
+    Each read of the register pops fifo_sz bytes from rx, and each write
+    to it appends the written bytes to tx.
+    """
+    pages: PagedMemory = zdc.field()
+
+    def __post_init__(self):
+        self.fifo_sz = 1
+        self.rx = bytearray()
+        self.tx = bytearray()
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        if addr == FIFO_ADDR:
+            data = self.rx[:self.fifo_sz]
+            del self.rx[:self.fifo_sz]
+            return int.from_bytes(data, "little")
+        return await self.pages.read(addr)
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        if addr == FIFO_ADDR:
+            self.tx += data.to_bytes(size, "little")
+        else:
+            await self.pages.write(addr, data, size)
+
+    async def read_burst(self, addr: zdc.u64, nbytes: zdc.u32) -> bytes:
+        return await self.pages.read_burst(addr, nbytes)
+
+    async def write_burst(self, addr: zdc.u64, data: bytes) -> None:
+        await self.pages.write_burst(addr, data)
+
+
+@zdc.dataclass
+class FaultMemory(MockMemory):
+    """Mock memory whose accesses to chosen addresses raise ValueError.
+
+    Counts every access, so tests can check nothing touches memory after
+    a transfer has failed.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.bad_reads = set()
+        self.bad_writes = set()
+        self.accesses = 0
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        self.accesses += 1
+        if addr in self.bad_reads:
+            raise ValueError("Read fault at 0x%x" % addr)
+        return await super().read(addr)
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        self.accesses += 1
+        if addr in self.bad_writes:
+            raise ValueError("Write fault at 0x%x" % addr)
+        await super().write(addr, data, size)
+
+
 # =============================================================================
 # Test Fixture: DMA with Memory
 # =============================================================================
@@ -346,6 +443,67 @@ def test_memcpy_unaligned():
     t.shutdown()
 
 
+def test_memcpy_dual_alignment():
+    """Test memcpy keeps reads and writes aligned when src/dst alignments differ."""
+    print("\n=== Test: Dual-alignment memcpy ===")
+
+    @zdc.dataclass
+    class CountingMemory(MockMemory):
+        """Memory that records (addr, size) for every access."""
+
+        def __post_init__(self):
+            super().__post_init__()
+            self.reads = []
+            self.writes = []
+
+        async def read(self, addr: zdc.u64) -> zdc.u64:
+            self.reads.append(addr)
+            return await super().read(addr)
+
+        async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+            self.writes.append((addr, size))
+            await super().write(addr, data, size)
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: CountingMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            sz = 4096
+            for i in range(sz):
+                self.mem.storage[0x1003 + i] = (i * 11 + 5) & 0xFF
+
+            # src % 8 == 3, dst % 8 == 5
+            await self.dma.memcpy(src=0x1003, dst=0x2005, sz=sz)
+
+            for i in range(sz):
+                expected = (i * 11 + 5) & 0xFF
+                actual = self.mem.storage.get(0x2005 + i, 0)
+                assert actual == expected, f"Byte {i}: {actual:#x} != {expected:#x}"
+            assert 0x2004 not in self.mem.storage
+            assert 0x2005 + sz not in self.mem.storage
+
+            # Every write is naturally aligned
+            for addr, size in self.mem.writes:
+                assert addr % size == 0, f"Misaligned write of {size} at {addr:#x}"
+            assert sum(size for (_, size) in self.mem.writes) == sz
+
+            # ~512 accesses each way rather than ~4096 byte accesses
+            print(f"  Reads: {len(self.mem.reads)}, writes: {len(self.mem.writes)}")
+            assert len(self.mem.reads) == 515, f"Reads: {len(self.mem.reads)}"
+            assert len(self.mem.writes) == 515, f"Writes: {len(self.mem.writes)}"
+
+            print("  Dual-alignment memcpy test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
 # =============================================================================
 # memcpy_chain Tests
 # =============================================================================
@@ -556,6 +714,162 @@ def test_devcpy_multi_access_chunk():
     t.shutdown()
 
 
+def test_devcpy_prefetch():
+    """Test devcpy prefetch hides the source reads from the device."""
+    print("\n=== Test: devcpy prefetch ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def timed(self, dst):
+            dma = self.fixture.dma
+
+            async def device_requests():
+                # Requests arrive well after the previous chunk is done
+                for _ in range(3):
+                    await self.wait(zdc.Time.ns(200))
+                    await dma.req_transfer(5)
+                return self.time().as_ns()
+
+            t_req, _ = await asyncio.gather(
+                device_requests(),
+                dma.devcpy(
+                    src=0x1000, dst=dst, sz=40, acc_sz=4, chk_sz=4,
+                    inc_src=True, inc_dst=True, req_id=5))
+            # Time from the last request to completion
+            return self.time().as_ns() - t_req
+
+        async def run(self):
+            self.fixture.mem.read_delay = zdc.Time.ns(10)
+            self.fixture.mem.write_delay = zdc.Time.ns(10)
+            data = [0x1000 + i for i in range(10)]
+            self.fixture.init_memory(0x1000, data, 4)
+
+            # Last chunk: 2 reads + 2 writes on request
+            assert await self.timed(0x2000) == 40
+            assert self.fixture.read_memory(0x2000, 10, 4) == data
+
+            # Only the writes remain on the request path
+            self.fixture.dma.devcpy_prefetch = 1
+            assert await self.timed(0x3000) == 20
+            assert self.fixture.read_memory(0x3000, 10, 4) == data
+
+            print("  devcpy prefetch test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_devcpy_prefetch_fault():
+    """Test a failed prefetched devcpy leaves the req_id's requests alone."""
+    print("\n=== Test: devcpy prefetch fault ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: FaultMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.mem.read_delay = zdc.Time.ns(2)
+            self.dma.devcpy_prefetch = 2
+            self.mem.bad_reads.add(0x1010)
+
+            # The second chunk's source read fails, with requests pending
+            # for the first three chunks
+            for _ in range(3):
+                await self.dma.req_transfer(3)
+            try:
+                await self.dma.devcpy(
+                    src=0x1000, dst=0x2000, sz=64, acc_sz=8, chk_sz=2,
+                    inc_src=True, inc_dst=True, req_id=3)
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+            accesses = self.mem.accesses
+            await self.wait(zdc.Time.ns(100))
+            assert self.mem.accesses == accesses
+            assert len(asyncio.all_tasks()) == 1
+            assert self.dma._req_credits[3].count == 2
+
+            # The next devcpy on the id gets the remaining requests
+            self.mem.storage.update({0x3000 + i: i for i in range(32)})
+            await self.dma.devcpy(
+                src=0x3000, dst=0x4000, sz=32, acc_sz=8, chk_sz=2,
+                inc_src=True, inc_dst=True, req_id=3)
+            assert [self.mem.storage[0x4000 + i] for i in range(32)] == \
+                list(range(32))
+            assert 3 not in self.dma._req_credits
+
+            print("  devcpy prefetch fault test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_devcpy_combine():
+    """Test narrow device accesses are combined on the memory side."""
+    print("\n=== Test: devcpy combine ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: FifoMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def devcpy(self, n_req, **kwargs):
+            async def device_requests():
+                for _ in range(n_req):
+                    await self.wait(zdc.Time.ns(10))
+                    await self.dma.req_transfer(3)
+
+            _, st = await asyncio.gather(
+                device_requests(), self.dma.devcpy(req_id=3, **kwargs))
+            return st
+
+        async def run(self):
+            self.dma.stats = True
+            self.dma.combine = True
+
+            # Device to memory: byte reads gathered into aligned writes,
+            # per 16-byte chunk 1@3, 4@4, a burst @8, 2@0, 1@2
+            self.mem.rx = bytearray(range(64))
+            st = await self.devcpy(
+                4, src=FIFO_ADDR, dst=0x2003, sz=64, acc_sz=1, chk_sz=16,
+                inc_src=False, inc_dst=True)
+            assert self.mem.pages.dump(0x2003, 64) == bytes(range(64))
+            assert st.reads == 64
+            assert st.writes == {1: 8, 4: 4, 2: 4}, st.writes
+            assert st.burst_writes == 4
+
+            # Memory to device: aligned reads split into halfword writes,
+            # per 32-byte chunk 3 head reads, a burst and 1 tail read
+            data = bytes((i * 11) & 0xFF for i in range(64))
+            self.mem.pages.load(0x3001, data)
+            for prefetch in (0, 2):
+                self.dma.devcpy_prefetch = prefetch
+                self.mem.tx = bytearray()
+                st = await self.devcpy(
+                    2, src=0x3001, dst=FIFO_ADDR, sz=64, acc_sz=2, chk_sz=16,
+                    inc_src=True, inc_dst=False)
+                assert bytes(self.mem.tx) == data
+                assert st.writes == {2: 32}
+                assert (st.reads, st.burst_reads) == (8, 2)
+
+            print("  devcpy combine test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
 # =============================================================================
 # devcpy_chain Tests
 # =============================================================================
@@ -605,6 +919,144 @@ def test_devcpy_chain_basic():
     t.shutdown()
 
 
+# =============================================================================
+# Descriptor Chain Tests
+# =============================================================================
+
+def test_memcpy_desc_prefetch():
+    """Test in-memory MemCpy descriptors, with and without prefetch."""
+    print("\n=== Test: memcpy_desc prefetch ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: PagedMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        def build_chain(self, base, dst):
+            # Three 64-byte copies; descriptors are not contiguous
+            addrs = [base, base + 0x100, base + 0x40]
+            for i, addr in enumerate(addrs):
+                nxt = addrs[i + 1] if i + 1 < len(addrs) else 0
+                self.mem.load(addr, pack_memcpy_desc(
+                    src=0x10000 + 64 * i, dst=dst + 64 * i, sz=64, next=nxt))
+
+        async def timed_chain(self, base, dst):
+            self.build_chain(base, dst)
+            start = self.time().as_ns()
+            await self.dma.memcpy_desc(base)
+            assert self.mem.dump(dst, 192) == self.mem.dump(0x10000, 192)
+            return self.time().as_ns() - start
+
+        async def run(self):
+            self.mem.read_delay = zdc.Time.ns(10)
+            self.mem.write_delay = zdc.Time.ns(10)
+            self.dma.arb.n_ports = 2
+            self.mem.load(0x10000, bytes(range(192)))
+
+            # Each descriptor: one 10ns fetch + one 20ns read/write burst
+            self.dma.desc_prefetch = 0
+            elapsed = await self.timed_chain(0x1000, 0x20000)
+            assert elapsed == 90, f"No prefetch: {elapsed}ns"
+
+            # Fetches after the first are hidden behind the transfers
+            self.dma.desc_prefetch = 1
+            elapsed = await self.timed_chain(0x2000, 0x30000)
+            assert elapsed == 70, f"Prefetch: {elapsed}ns"
+
+            print("  memcpy_desc prefetch test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_desc_prefetch_fault():
+    """Test a failed descriptor stops the descriptor fetcher."""
+    print("\n=== Test: desc prefetch fault ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: FaultMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.mem.read_delay = zdc.Time.ns(10)
+            self.dma.desc_prefetch = 2
+            for i in range(4):
+                addr = 0x1000 + 0x40 * i
+                desc = pack_memcpy_desc(
+                    src=0x8000, dst=0x9000 + 0x100 * i, sz=16,
+                    next=addr + 0x40 if i < 3 else 0)
+                self.mem.storage.update(
+                    {addr + j: b for j, b in enumerate(desc)})
+            # The first descriptor's copy fails
+            self.mem.bad_writes.add(0x9000)
+
+            try:
+                await self.dma.memcpy_desc(0x1000)
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+            accesses = self.mem.accesses
+            await self.wait(zdc.Time.ns(200))
+            assert self.mem.accesses == accesses
+            assert len(asyncio.all_tasks()) == 1
+            assert self.dma.arb._active == 0
+
+            print("  desc prefetch fault test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_devcpy_desc():
+    """Test in-memory DevCpy descriptors fetched with word reads."""
+    print("\n=== Test: devcpy_desc ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        def load_bytes(self, addr, data):
+            for i, b in enumerate(data):
+                self.fixture.mem.storage[addr + i] = b
+
+        async def run(self):
+            self.fixture.init_memory(0x1000, [0x11, 0x22])
+            self.fixture.init_memory(0x3000, [0x33])
+            self.load_bytes(0x8000, pack_devcpy_desc(
+                src=0x1000, dst=0x2000, sz=16, acc_sz=8, chk_sz=1,
+                inc_src=True, inc_dst=True, next=0x8040))
+            self.load_bytes(0x8040, pack_devcpy_desc(
+                src=0x3000, dst=0x4000, sz=16, acc_sz=8, chk_sz=1,
+                inc_src=False, inc_dst=True))
+
+            async def device_requests():
+                for _ in range(4):
+                    await self.wait(zdc.Time.ns(10))
+                    await self.fixture.dma.req_transfer(12)
+
+            await asyncio.gather(
+                device_requests(),
+                self.fixture.dma.devcpy_desc(0x8000, req_id=12))
+
+            assert self.fixture.read_memory(0x2000, 2) == [0x11, 0x22]
+            assert self.fixture.read_memory(0x4000, 2) == [0x33, 0x33]
+
+            print("  devcpy_desc test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
 # =============================================================================
 # ReqOp Interface Tests
 # =============================================================================
@@ -683,6 +1135,122 @@ def test_multiple_concurrent_req_ids():
     t.shutdown()
 
 
+def test_shared_req_id():
+    """Test concurrent transfers on one req_id share its requests."""
+    print("\n=== Test: Shared req_id ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            dma = self.fixture.dma
+            self.fixture.init_memory(0x1000, [0xC1])
+            self.fixture.init_memory(0x3000, [0xD1])
+
+            async def device_requests():
+                for _ in range(2):
+                    await self.wait(zdc.Time.ns(20))
+                    await dma.req_transfer(7)
+
+            # The first transfer to finish leaves the id armed for the other
+            await asyncio.gather(
+                device_requests(),
+                dma.devcpy(src=0x1000, dst=0x2000, sz=8, acc_sz=8, chk_sz=1,
+                           inc_src=True, inc_dst=True, req_id=7),
+                dma.devcpy(src=0x3000, dst=0x4000, sz=8, acc_sz=8, chk_sz=1,
+                           inc_src=True, inc_dst=True, req_id=7))
+
+            assert self.fixture.read_memory(0x2000, 1) == [0xC1]
+            assert self.fixture.read_memory(0x4000, 1) == [0xD1]
+            assert 7 not in dma._req_credits
+
+            print("  Shared req_id test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_req_transfer_back_to_back():
+    """Test back-to-back and pre-arm requests are counted, not lost."""
+    print("\n=== Test: req_transfer back-to-back ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            data = [0x21, 0x22, 0x23, 0x24]
+            self.fixture.init_memory(0x1000, data)
+
+            # Two requests before the DMA is armed...
+            await self.fixture.dma.req_transfer(7)
+            await self.fixture.dma.req_transfer(7)
+
+            async def device_requests():
+                # ...and two more back-to-back while it is busy
+                await self.wait(zdc.Time.ns(5))
+                await self.fixture.dma.req_transfer(7)
+                await self.fixture.dma.req_transfer(7)
+
+            async def dma_transfer():
+                await self.fixture.dma.devcpy(
+                    src=0x1000, dst=0x2000, sz=32, acc_sz=8, chk_sz=1,
+                    inc_src=True, inc_dst=True, req_id=7)
+
+            await asyncio.gather(device_requests(), dma_transfer())
+
+            result = self.fixture.read_memory(0x2000, 4)
+            assert result == data, f"Data mismatch: {result} != {data}"
+            assert 7 not in self.fixture.dma._req_credits
+
+            print("  req_transfer back-to-back test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_req_transfer_pending_limit():
+    """Test requests beyond max_pending_req are dropped."""
+    print("\n=== Test: req_transfer pending limit ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            self.fixture.dma.max_pending_req = 2
+            self.fixture.init_memory(0x1000, [1, 2, 3, 4])
+
+            for _ in range(4):
+                await self.fixture.dma.req_transfer(9)
+            assert self.fixture.dma._req_credits[9].count == 2
+
+            async def device_requests():
+                # The two dropped requests must be re-issued
+                await self.wait(zdc.Time.ns(100))
+                await self.fixture.dma.req_transfer(9)
+                await self.fixture.dma.req_transfer(9)
+
+            async def dma_transfer():
+                await self.fixture.dma.devcpy(
+                    src=0x1000, dst=0x2000, sz=32, acc_sz=8, chk_sz=1,
+                    inc_src=True, inc_dst=True, req_id=9)
+                return self.time().as_ns()
+
+            _, end = await asyncio.gather(device_requests(), dma_transfer())
+            assert end >= 100, f"Completed at {end}ns"
+            assert self.fixture.read_memory(0x2000, 4) == [1, 2, 3, 4]
+
+            print("  req_transfer pending limit test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
 # =============================================================================
 # Memory Lock Tests
 # =============================================================================
@@ -772,12 +1340,908 @@ def test_memcpy_with_delay():
     t.shutdown()
 
 
-# =============================================================================
-# Main Test Runner
-# =============================================================================
+def test_memcpy_priority_preempts_at_quantum():
+    """Test a high-priority memcpy is granted at the next arbitration quantum."""
+    print("\n=== Test: memcpy priority arbitration ===")
 
-if __name__ == "__main__":
-    print("=" * 60)
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: MockMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.mem.read_delay = zdc.Time.ns(10)
+            self.mem.write_delay = zdc.Time.ns(10)
+            self.dma.arb_quantum = 64
+            done = {}
+
+            async def low():
+                # 1 KiB at 20ns per word: 2560ns if uninterrupted
+                await self.dma.memcpy(src=0x10000, dst=0x20000, sz=1024, pri=0)
+                done["low"] = self.time().as_ns()
+
+            async def high():
+                await self.wait(zdc.Time.ns(50))
+                await self.dma.memcpy(src=0x1000, dst=0x2000, sz=64, pri=15)
+                done["high"] = self.time().as_ns()
+
+            await asyncio.gather(low(), high())
+
+            # High waits for at most one 64-byte quantum (160ns), then runs
+            assert done["high"] <= 160 + 160, f"High finished at {done['high']}ns"
+            assert done["low"] > done["high"]
+            assert self.dma.arb.max_wait[15] <= 160
+
+            print("  memcpy priority arbitration test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Channel / Outstanding Transaction Tests
+# =============================================================================
+
+async def timed_concurrent_memcpy(top, n):
+    """Run n concurrent 64-byte memcpys and return the elapsed time (ns)."""
+    for i in range(n):
+        top.fixture.init_memory(0x1000 * (i + 1), [i * 8 + j for j in range(8)])
+    start = top.time().as_ns()
+    await asyncio.gather(*(
+        top.fixture.dma.memcpy(
+            src=0x1000 * (i + 1), dst=0x10000 + 0x1000 * i, sz=64)
+        for i in range(n)))
+    for i in range(n):
+        result = top.fixture.read_memory(0x10000 + 0x1000 * i, 8)
+        assert result == [i * 8 + j for j in range(8)], f"Transfer {i} mismatch"
+    return top.time().as_ns() - start
+
+
+def test_outstanding_transactions_overlap():
+    """Test transfers on different channels overlap with multiple ports."""
+    print("\n=== Test: Outstanding transactions overlap ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            self.fixture.mem.read_delay = zdc.Time.ns(10)
+            self.fixture.mem.write_delay = zdc.Time.ns(10)
+
+            # One port: 2 x 8 words x 20ns, fully serialized
+            elapsed = await timed_concurrent_memcpy(self, 2)
+            assert elapsed == 320, f"1 port: {elapsed}ns"
+
+            # Two ports: both transfers proceed in parallel
+            self.fixture.clear_memory()
+            self.fixture.dma.arb.n_ports = 2
+            elapsed = await timed_concurrent_memcpy(self, 4)
+            assert elapsed == 320, f"2 ports, 4 transfers: {elapsed}ns"
+
+            print("  Outstanding transactions overlap test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_channel_limit():
+    """Test transfers beyond n_channels wait for a free channel."""
+    print("\n=== Test: Channel limit ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            self.fixture.mem.read_delay = zdc.Time.ns(10)
+            self.fixture.mem.write_delay = zdc.Time.ns(10)
+            self.fixture.dma.arb.n_ports = 4
+            self.fixture.dma.n_channels = 2
+
+            # 4 transfers on 2 channels: two rounds of 160ns
+            elapsed = await timed_concurrent_memcpy(self, 4)
+            assert elapsed == 320, f"2 channels: {elapsed}ns"
+            assert len(self.fixture.dma._ch_busy) == 0
+
+            print("  Channel limit test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_channel_wait_cancel():
+    """Test a transfer cancelled while waiting for a channel frees its place."""
+    print("\n=== Test: Channel wait cancel ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            dma = self.fixture.dma
+            self.fixture.mem.read_delay = zdc.Time.ns(10)
+            dma.n_channels = 1
+
+            first = asyncio.ensure_future(
+                dma.memcpy(src=0x1000, dst=0x2000, sz=64))
+            queued = asyncio.ensure_future(
+                dma.memcpy(src=0x1000, dst=0x3000, sz=64))
+            await self.wait(zdc.Time.ns(5))
+            assert len(dma._ch_sem.waiters) == 1
+
+            queued.cancel()
+            await asyncio.sleep(0)
+            assert len(dma._ch_sem.waiters) == 0
+            await first
+
+            # Cancelled just as the channel is handed over: it passes
+            # the channel on to the next waiter
+            ch = await dma._acquire_channel()
+            waiters = [asyncio.ensure_future(dma._acquire_channel())
+                       for _ in range(2)]
+            await asyncio.sleep(0)
+            dma._release_channel(ch)
+            waiters[0].cancel()
+            assert await waiters[1] == ch
+            assert waiters[0].cancelled()
+            dma._release_channel(ch)
+
+            await dma.memcpy(src=0x1000, dst=0x4000, sz=64)
+            assert len(dma._ch_busy) == 0
+
+            print("  Channel wait cancel test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Burst Tests
+# =============================================================================
+
+def test_memcpy_burst():
+    """Test memcpy uses bursts for the aligned body and words for head/tail."""
+    print("\n=== Test: memcpy burst ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: BurstMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.dma.max_burst = 64
+            for i in range(150):
+                self.mem.storage[0x1003 + i] = (i * 7) & 0xFF
+
+            # 5-byte head, 144-byte burst body (64 + 64 + 16), 1-byte tail
+            await self.dma.memcpy(src=0x1003, dst=0x2003, sz=150)
+
+            for i in range(150):
+                expected = (i * 7) & 0xFF
+                actual = self.mem.storage.get(0x2003 + i, 0)
+                assert actual == expected, f"Byte {i}: {actual:#x} != {expected:#x}"
+
+            assert self.mem.bursts == [(0x2008, 64), (0x2048, 64), (0x2088, 16)], \
+                f"Unexpected bursts: {self.mem.bursts}"
+            head_tail = sum(s for (_, s) in self.mem.word_writes)
+            assert head_tail == 150 - 144, f"Word-access bytes: {head_tail}"
+
+            print("  memcpy burst test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_devcpy_burst():
+    """Test incrementing devcpy chunks use bursts; FIFO chunks do not."""
+    print("\n=== Test: devcpy burst ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: BurstMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            for i in range(32):
+                self.mem.storage[0x1000 + i] = i + 1
+
+            async def device_requests():
+                await self.wait(zdc.Time.ns(10))
+                for _ in range(4):
+                    await self.dma.req_transfer(5)
+                    await self.wait(zdc.Time.ns(10))
+
+            async def dma_transfer():
+                await self.dma.devcpy(
+                    src=0x1000, dst=0x2000, sz=16, acc_sz=8, chk_sz=1,
+                    inc_src=True, inc_dst=True, req_id=5)
+                await self.dma.devcpy(
+                    src=0x1000, dst=0x3000, sz=16, acc_sz=8, chk_sz=1,
+                    inc_src=False, inc_dst=True, req_id=5)
+
+            await asyncio.gather(device_requests(), dma_transfer())
+
+            assert self.mem.bursts == [(0x2000, 8), (0x2008, 8)], \
+                f"Unexpected bursts: {self.mem.bursts}"
+            assert self.mem.word_writes == [(0x3000, 8), (0x3008, 8)], \
+                f"Unexpected word writes: {self.mem.word_writes}"
+            for i in range(16):
+                assert self.mem.storage[0x2000 + i] == i + 1
+                assert self.mem.storage[0x3000 + i] == (i % 8) + 1
+
+            print("  devcpy burst test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Pipelining Tests
+# =============================================================================
+
+def test_memcpy_pipelined():
+    """Test pipelined memcpy overlaps reads with writes."""
+    print("\n=== Test: Pipelined memcpy ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            self.fixture.mem.read_delay = zdc.Time.ns(10)
+            self.fixture.mem.write_delay = zdc.Time.ns(10)
+            self.fixture.dma.pipeline_depth = 2
+            data = [0x10, 0x11, 0x12, 0x13]
+            self.fixture.init_memory(0x1000, data)
+
+            start = self.time().as_ns()
+            await self.fixture.dma.memcpy(src=0x1000, dst=0x2000, sz=32)
+            elapsed = self.time().as_ns() - start
+
+            # 4 reads back-to-back, last write completes one write later
+            assert elapsed == 50, f"Elapsed: {elapsed}ns"
+            assert self.fixture.read_memory(0x2000, 4) == data
+
+            print("  Pipelined memcpy test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_memcpy_pipelined_unaligned():
+    """Test pipelined memcpy with differing alignments across quanta."""
+    print("\n=== Test: Pipelined unaligned memcpy ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            self.fixture.mem.read_delay = zdc.Time.ns(3)
+            self.fixture.mem.write_delay = zdc.Time.ns(5)
+            self.fixture.dma.pipeline_depth = 4
+            self.fixture.dma.arb_quantum = 64
+            storage = self.fixture.mem.storage
+            for i in range(1000):
+                storage[0x1003 + i] = (i * 17 + 3) & 0xFF
+
+            await asyncio.gather(
+                self.fixture.dma.memcpy(src=0x1003, dst=0x4005, sz=1000),
+                self.fixture.dma.memcpy(src=0x1003, dst=0x8002, sz=999))
+
+            for i in range(1000):
+                expected = (i * 17 + 3) & 0xFF
+                assert storage.get(0x4005 + i) == expected, f"Byte {i} (dst 0x4005)"
+                if i < 999:
+                    assert storage.get(0x8002 + i) == expected, f"Byte {i} (dst 0x8002)"
+            assert 0x4005 + 1000 not in storage
+            assert 0x8002 + 999 not in storage
+
+            print("  Pipelined unaligned memcpy test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_devcpy_pipelined():
+    """Test pipelined devcpy overlaps reads with writes within a chunk."""
+    print("\n=== Test: Pipelined devcpy ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            self.fixture.mem.read_delay = zdc.Time.ns(10)
+            self.fixture.mem.write_delay = zdc.Time.ns(10)
+            self.fixture.dma.pipeline_depth = 1
+            self.fixture.mem.storage[0x1000] = 0x5A
+
+            async def device_requests():
+                await self.fixture.dma.req_transfer(3)
+
+            async def dma_transfer():
+                await self.fixture.dma.devcpy(
+                    src=0x1000, dst=0x2000, sz=32, acc_sz=8, chk_sz=4,
+                    inc_src=False, inc_dst=True, req_id=3)
+
+            await self.wait(zdc.Time.ns(1))
+            start = self.time().as_ns()
+            await asyncio.gather(dma_transfer(), device_requests())
+            elapsed = self.time().as_ns() - start
+
+            assert elapsed == 50, f"Elapsed: {elapsed}ns"
+            assert self.fixture.read_memory(0x2000, 4) == [0x5A] * 4
+
+            print("  Pipelined devcpy test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_pipelined_fault():
+    """Test a failed pipelined copy stops its reader and writer."""
+    print("\n=== Test: Pipelined fault ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: FaultMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def check_fails(self, xfer):
+            try:
+                await xfer
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+            # Nothing is left running or accessing memory
+            accesses = self.mem.accesses
+            await self.wait(zdc.Time.ns(100))
+            assert self.mem.accesses == accesses
+            assert len(asyncio.all_tasks()) == 1
+            assert self.dma.arb._active == 0
+
+        async def run(self):
+            self.mem.read_delay = zdc.Time.ns(2)
+            self.mem.write_delay = zdc.Time.ns(10)
+            self.dma.pipeline_depth = 2
+            self.mem.bad_writes.add(0x2010)
+
+            await self.check_fails(
+                self.dma.memcpy(src=0x1000, dst=0x2000, sz=64))
+            await self.dma.req_transfer(1)
+            await self.check_fails(self.dma.devcpy(
+                src=0x1000, dst=0x2000, sz=64, acc_sz=8, chk_sz=8,
+                inc_src=True, inc_dst=True, req_id=1))
+
+            # Later transfers are unaffected
+            self.mem.storage.update({0x3000 + i: i for i in range(64)})
+            await self.dma.memcpy(src=0x3000, dst=0x4000, sz=64)
+            assert [self.mem.storage[0x4000 + i] for i in range(64)] == \
+                list(range(64))
+
+            print("  Pipelined fault test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Functional Mode Tests
+# =============================================================================
+
+def test_memcpy_functional():
+    """Test functional mode matches the timed path in zero simulated time."""
+    print("\n=== Test: memcpy functional mode ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: PagedMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.mem.read_delay = zdc.Time.ns(10)
+            self.mem.write_delay = zdc.Time.ns(10)
+            data = bytes((i * 3 + 1) & 0xFF for i in range(5000))
+            self.mem.load(0x10005, data)
+
+            start = self.time().as_ns()
+            await self.dma.memcpy(src=0x10005, dst=0x20003, sz=len(data))
+            timed = self.time().as_ns() - start
+            assert timed > 0
+
+            self.dma.functional = True
+            start = self.time().as_ns()
+            await self.dma.memcpy(src=0x10005, dst=0x30003, sz=len(data))
+            assert self.time().as_ns() == start, "Functional copy should take no time"
+            assert self.mem.dump(0x30000, len(data) + 6) == \
+                self.mem.dump(0x20000, len(data) + 6)
+
+            # Analytically-timed functional copy: 5000 bytes at 4 bytes/ns
+            self.dma.functional_bw = 4.0
+            start = self.time().as_ns()
+            await self.dma.memcpy(src=0x10005, dst=0x40003, sz=len(data))
+            assert self.time().as_ns() - start == 1250
+            assert self.mem.dump(0x40003, len(data)) == data
+
+            print("  memcpy functional mode test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_memcpy_functional_fallback():
+    """Test functional mode falls back to the timed path without a backdoor."""
+    print("\n=== Test: memcpy functional fallback ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            self.fixture.mem.read_delay = zdc.Time.ns(10)
+            self.fixture.dma.functional = True
+            self.fixture.init_memory(0x1000, [1, 2, 3, 4])
+
+            start = self.time().as_ns()
+            await self.fixture.dma.memcpy(src=0x1000, dst=0x2000, sz=32)
+            assert self.time().as_ns() - start == 40
+            assert self.fixture.read_memory(0x2000, 4) == [1, 2, 3, 4]
+
+            print("  memcpy functional fallback test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Loosely-Timed Mode Tests
+# =============================================================================
+
+@zdc.dataclass
+class LtWordMemory(zdc.Component):
+    """Word-only memory implementing MemoryLtOp. Counts timed accesses."""
+    pages: PagedMemory = zdc.field()
+
+    def __post_init__(self):
+        self.n_timed = 0
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        self.n_timed += 1
+        return await self.pages.read(addr)
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        self.n_timed += 1
+        await self.pages.write(addr, data, size)
+
+    def read_lt(self, addr: zdc.u64, delay: int):
+        return self.pages.read_lt(addr, delay)
+
+    def write_lt(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8, delay: int) -> int:
+        return self.pages.write_lt(addr, data, size, delay)
+
+
+def test_memcpy_lt():
+    """Test the loosely-timed path keeps data and total time."""
+    print("\n=== Test: memcpy loosely-timed ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: LtWordMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def timed(self, dst):
+            start = self.time().as_ns()
+            await self.dma.memcpy(src=0x1003, dst=dst, sz=1000)
+
+            async def device_requests():
+                for _ in range(4):
+                    await self.dma.req_transfer(2)
+
+            await asyncio.gather(device_requests(), self.dma.devcpy(
+                src=0x1000, dst=dst + 0x1000, sz=64, acc_sz=4, chk_sz=4,
+                inc_src=True, inc_dst=True, req_id=2))
+            return self.time().as_ns() - start
+
+        async def run(self):
+            self.mem.pages.read_delay = zdc.Time.ns(3)
+            self.mem.pages.write_delay = zdc.Time.ns(5)
+            self.dma.arb_quantum = 256
+            data = bytes((i * 13) & 0xFF for i in range(1003))
+            self.mem.pages.load(0x1000, data)
+
+            elapsed = await self.timed(0x10000)
+            n_timed = self.mem.n_timed
+
+            self.dma.lt_quantum = zdc.Time.ns(100)
+            assert await self.timed(0x20000) == elapsed
+            assert self.mem.n_timed == n_timed
+            for base in (0x10000, 0x20000):
+                assert self.mem.pages.dump(base, 1000) == data[3:]
+                assert self.mem.pages.dump(base + 0x1000, 64) == data[:64]
+
+            print("  memcpy loosely-timed test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Submission Tests
+# =============================================================================
+
+def test_submit_memcpy():
+    """Test submitted transfers run on workers and complete their handles."""
+    print("\n=== Test: submit memcpy ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            dma = self.fixture.dma
+            self.fixture.mem.read_delay = zdc.Time.ns(10)
+            self.fixture.mem.write_delay = zdc.Time.ns(10)
+            dma.arb.n_ports = 4
+            dma.n_channels = 2
+            for i in range(8):
+                self.fixture.init_memory(0x1000 + i * 0x100, [i + 1] * 4)
+
+            completed = []
+            handles = []
+            for i in range(8):
+                h = await dma.submit_memcpy(
+                    src=0x1000 + i * 0x100, dst=0x8000 + i * 0x100, sz=32)
+                h.add_done_callback(lambda h, i=i: completed.append(i))
+                handles.append(h)
+
+            # Submission does not wait; at most n_channels workers run
+            assert self.time().as_ns() == 0
+            assert not handles[0].done()
+            assert dma._n_workers == 2
+
+            for h in handles:
+                assert await h is None
+            assert completed == list(range(8))
+            # Eight 80ns copies on two channels
+            assert self.time().as_ns() == 320
+            for i in range(8):
+                assert self.fixture.read_memory(0x8000 + i * 0x100, 4) == [i + 1] * 4
+
+            # Workers exit once the queue drains
+            await self.wait(zdc.Time.ns(1))
+            assert dma._n_workers == 0
+
+            # Callbacks added after completion run immediately
+            handles[0].add_done_callback(lambda h: completed.append(-1))
+            assert completed[-1] == -1
+
+            print("  submit memcpy test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_submit_depth():
+    """Test submitters wait while the submission queue is full."""
+    print("\n=== Test: submit depth ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            dma = self.fixture.dma
+            self.fixture.mem.read_delay = zdc.Time.ns(10)
+            dma.n_channels = 1
+            dma.submit_depth = 2
+
+            submit_times = []
+            handles = []
+            for i in range(5):
+                handles.append(await dma.submit_memcpy(
+                    src=0x1000, dst=0x2000 + i * 0x10, sz=8))
+                submit_times.append(self.time().as_ns())
+
+            # One running and two queued; each copy takes 10ns
+            assert submit_times == [0, 0, 0, 10, 20]
+            await handles[-1]
+            assert self.time().as_ns() == 50
+
+            print("  submit depth test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_submit_chains_and_errors():
+    """Test chain submission, stats results, and failed transfers."""
+    print("\n=== Test: submit chains and errors ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            dma = self.fixture.dma
+            dma.stats = True
+            self.fixture.init_memory(0x1000, [0x11, 0x22, 0x33, 0x44])
+
+            await dma.req_transfer(9)
+            h_dev = await dma.submit_devcpy_chain(
+                [DevCpyTest(src=0x1000, dst=0x3000, sz=16, acc_sz=8, chk_sz=2,
+                            inc_src=True, inc_dst=True)], req_id=9)
+            h_mem = await dma.submit_memcpy_chain(
+                [MemCpyTest(src=0x1010, dst=0x4000, sz=16)])
+            h_bad = await dma.submit_memcpy_chain([None])
+
+            st = await h_mem
+            assert st.kind == "memcpy_chain" and st.nbytes == 16
+            assert (await h_dev).kind == "devcpy_chain"
+            assert self.fixture.read_memory(0x3000, 2) == [0x11, 0x22]
+            assert self.fixture.read_memory(0x4000, 2) == [0x33, 0x44]
+
+            await asyncio.sleep(0)
+            assert h_bad.done()
+            assert isinstance(h_bad.exception(), AttributeError)
+            try:
+                await h_bad
+                assert False, "Expected AttributeError"
+            except AttributeError:
+                pass
+
+            print("  submit chains and errors test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_submit_callback_error():
+    """Test a failing done callback is reported and the worker carries on."""
+    print("\n=== Test: submit callback error ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            dma = self.fixture.dma
+            dma.n_channels = 1
+            self.fixture.init_memory(0x1000, [0x55] * 4)
+            errors = []
+            asyncio.get_running_loop().set_exception_handler(
+                lambda loop, ctx: errors.append(ctx["exception"]))
+
+            completed = []
+            h1 = await dma.submit_memcpy(src=0x1000, dst=0x2000, sz=32)
+            h1.add_done_callback(lambda h: 1 // 0)
+            h1.add_done_callback(lambda h: completed.append(1))
+            h2 = await dma.submit_memcpy(src=0x1000, dst=0x3000, sz=32)
+            assert len(dma._workers) == 1
+
+            await h2
+            assert completed == [1]
+            assert len(errors) == 1
+            assert isinstance(errors[0], ZeroDivisionError)
+            assert self.fixture.read_memory(0x3000, 4) == [0x55] * 4
+
+            await asyncio.sleep(0)
+            assert dma._n_workers == 0 and not dma._workers
+
+            print("  submit callback error test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Fill Tests
+# =============================================================================
+
+def test_fill_words():
+    """Test fill issues only aligned writes, with the pattern anchored at dst."""
+    print("\n=== Test: fill words ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            dma = self.fixture.dma
+            storage = self.fixture.mem.storage
+            dma.stats = True
+
+            st = await dma.fill(
+                dst=0x1003, pattern=0xDDCCBBAA, sz=30, pattern_width=4)
+            expected = bytes([0xAA, 0xBB, 0xCC, 0xDD] * 8)[:30]
+            assert bytes(storage.get(0x1003 + i, 0) for i in range(30)) == expected
+            assert storage.get(0x1002) is None
+            assert storage.get(0x1003 + 30) is None
+
+            # 1 + 4 head, 3 x 8 body, 1 tail; no reads
+            assert st.reads == 0
+            assert st.writes == {1: 2, 4: 1, 8: 3}
+            assert st.nbytes == 30
+
+            await dma.fill(dst=0x2000, pattern=0x5A, sz=5)
+            assert [storage[0x2000 + i] for i in range(5)] == [0x5A] * 5
+
+            try:
+                await dma.fill(dst=0x2000, pattern=0, sz=8, pattern_width=3)
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+
+            print("  fill words test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_fill_burst():
+    """Test fill uses write bursts for the aligned body."""
+    print("\n=== Test: fill burst ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: BurstMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.dma.max_burst = 64
+            self.dma.arb_quantum = 128
+
+            await self.dma.fill(
+                dst=0x1006, pattern=0x0807060504030201, sz=200, pattern_width=8)
+
+            pat = bytes(range(1, 9))
+            expected = (pat * 26)[:200]
+            actual = bytes(self.mem.storage.get(0x1006 + i, 0) for i in range(200))
+            assert actual == expected
+
+            # Bursts split at the max_burst and arb_quantum boundaries
+            assert self.mem.bursts == [
+                (0x1008, 64), (0x1048, 56), (0x1080, 64), (0x10C0, 8)]
+            assert self.mem.word_writes == [(0x1006, 2), (0x10C8, 4), (0x10CC, 2)]
+
+            print("  fill burst test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Strided Transfer Tests
+# =============================================================================
+
+def test_memcpy_2d():
+    """Test a strided tile copy holds one grant for all rows."""
+    print("\n=== Test: memcpy_2d ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        fixture: DmaTestFixture = zdc.field()
+
+        async def run(self):
+            dma = self.fixture.dma
+            storage = self.fixture.mem.storage
+            for i in range(64):
+                storage[0x1000 + i] = i
+
+            # 4 rows of 6 bytes: src rows 16 apart, dst rows packed at 8
+            await dma.memcpy_2d(
+                src=0x1001, dst=0x2000, row_sz=6, n_rows=4,
+                src_stride=16, dst_stride=8)
+            for r in range(4):
+                row = [storage.get(0x2000 + r * 8 + i) for i in range(8)]
+                assert row == [1 + r * 16 + i for i in range(6)] + [None, None]
+            assert dma.arb._grants == 1
+
+            # Re-arbitrated every 32 bytes, not every row
+            dma.arb_quantum = 32
+            await dma.memcpy_2d(
+                src=0x1000, dst=0x3000, row_sz=24, n_rows=4,
+                src_stride=0, dst_stride=24)
+            assert dma.arb._grants == 1 + 3
+            assert [storage[0x3000 + 24 * 3 + i] for i in range(24)] == list(range(24))
+
+            print("  memcpy_2d test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_memcpy_2d_planes_burst():
+    """Test a 3D copy over bursts, and contiguous rows merged into a block."""
+    print("\n=== Test: memcpy_2d planes burst ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: BurstMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            for i in range(0x400):
+                self.mem.storage[0x1000 + i] = i & 0xFF
+
+            # 2 planes of 3 rows of 16 bytes
+            await self.dma.memcpy_2d(
+                src=0x1000, dst=0x4000, row_sz=16, n_rows=3,
+                src_stride=0x40, dst_stride=0x10, n_planes=2,
+                src_plane_stride=0x100, dst_plane_stride=0x30)
+            for p in range(2):
+                for r in range(3):
+                    for i in range(16):
+                        assert self.mem.storage[0x4000 + p * 0x30 + r * 0x10 + i] \
+                            == (p * 0x100 + r * 0x40 + i) & 0xFF
+            assert len(self.mem.bursts) == 6
+
+            # Contiguous rows and planes are a single block
+            self.mem.bursts.clear()
+            await self.dma.memcpy_2d(
+                src=0x1000, dst=0x5000, row_sz=16, n_rows=4,
+                src_stride=16, dst_stride=16, n_planes=2,
+                src_plane_stride=64, dst_plane_stride=64)
+            assert self.mem.bursts == [(0x5000, 128)]
+
+            print("  memcpy_2d planes burst test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Main Test Runner
+# =============================================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
     print("DmaOpOpAlg Unit Tests")
     print("=" * 60)
 
@@ -790,6 +2254,7 @@ if __name__ == "__main__":
     test_memcpy_with_priority()
     test_memcpy_large_transfer()
     test_memcpy_unaligned()
+    test_memcpy_dual_alignment()
 
     # memcpy_chain tests
     test_memcpy_chain_basic()
@@ -799,19 +2264,67 @@ if __name__ == "__main__":
     test_devcpy_basic()
     test_devcpy_no_increment()
     test_devcpy_multi_access_chunk()
+    test_devcpy_prefetch()
+    test_devcpy_prefetch_fault()
+    test_devcpy_combine()
 
     # devcpy_chain tests
     test_devcpy_chain_basic()
 
+    # Descriptor chain tests
+    test_memcpy_desc_prefetch()
+    test_desc_prefetch_fault()
+    test_devcpy_desc()
+
     # ReqOp tests
     test_req_transfer_unknown_id()
     test_multiple_concurrent_req_ids()
+    test_shared_req_id()
+    test_req_transfer_back_to_back()
+    test_req_transfer_pending_limit()
 
     # Memory lock tests
     test_concurrent_memcpy()
 
     # Timing tests
     test_memcpy_with_delay()
+    test_memcpy_priority_preempts_at_quantum()
+
+    # Channel tests
+    test_outstanding_transactions_overlap()
+    test_channel_limit()
+    test_channel_wait_cancel()
+
+    # Burst tests
+    test_memcpy_burst()
+    test_devcpy_burst()
+
+    # Pipelining tests
+    test_memcpy_pipelined()
+    test_memcpy_pipelined_unaligned()
+    test_devcpy_pipelined()
+    test_pipelined_fault()
+
+    # Functional mode tests
+    test_memcpy_functional()
+    test_memcpy_functional_fallback()
+
+    # Loosely-timed mode tests
+    test_memcpy_lt()
+
+    # Submission tests
+    test_submit_memcpy()
+    test_submit_depth()
+    test_submit_chains_and_errors()
+    test_submit_callback_error()
+
+    # Fill tests
+    test_fill_words()
+    test_fill_burst()
+
+    # Strided transfer tests
+    test_memcpy_2d()
+    test_memcpy_2d_planes_burst()
 
     print("\n" + "=" * 60)
     print("All DmaOpOpAlg tests PASSED!")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# ****************************************************************************
+#  Unit Tests for the scenario runner (runner.py)
+# ****************************************************************************
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../../packages/zuspec-dataclasses/src'))
+
+from org.zuspec.example.dma.impl.estimate import (  # noqa: E402
+    MemModel, XferEstimator)
+from org.zuspec.example.dma.impl.runner import (  # noqa: E402
+    Scenario, ScenarioRunner, aggregate, run_scenarios)
+
+
+# =============================================================================
+# Runner Tests
+# =============================================================================
+
+def test_runner_reuse():
+    """Test scenarios reuse the component tree and start from its state."""
+    print("\n=== Test: runner reuse ===")
+
+    runner = ScenarioRunner()
+    try:
+        sc = Scenario("copy", sz=3000, src_off=3, dst_off=1, read_ns=7,
+                      write_ns=5, beat_ns=1, check=True)
+        r1 = runner.run(sc)
+        assert r1.error is None, r1.error
+        top = runner._tops["burst"]
+
+        est = XferEstimator(MemModel(7, 5, 1)).memcpy(
+            0x100003, 0x200001, 3000)
+        assert r1.sim_ns == est.elapsed_ns
+        assert r1.stats.nbytes == 3000
+        assert r1.stats.burst_reads == est.burst_reads
+
+        # DMA settings apply to one scenario only
+        small = Scenario("small_burst", op="memcpy_chain", sz=512, read_ns=2,
+                         write_ns=2, dma={"max_burst": 64}, check=True)
+        r2 = runner.run(small)
+        assert r2.error is None, r2.error
+        assert runner._tops["burst"] is top
+        assert top.dma.max_burst == 4096
+        assert r2.stats.burst_reads == 8
+
+        r3 = runner.run(sc)
+        assert (r3.sim_ns, r3.stats.accesses) == (r1.sim_ns, r1.stats.accesses)
+
+        # Arbiter waits of one scenario do not carry over to the next
+        r4 = runner.run(Scenario("shared", sz=512, read_ns=2, concurrency=4))
+        assert r4.error is None, r4.error
+        assert top.dma.arb.max_wait[0] > 0
+        assert runner.run(sc).error is None
+        assert top.dma.arb.max_wait == {0: 0}
+
+        r = runner.run(Scenario("bad", op="memmove"))
+        assert r.error is not None and r.stats is None
+        r = runner.run(Scenario("typo", dma={"pipline_depth": 2}))
+        assert r.error.startswith("AttributeError"), r.error
+        assert runner.run(sc).error is None
+    finally:
+        runner.close()
+
+    print("  runner reuse test PASSED")
+
+
+def test_run_scenarios_pool():
+    """Test a process pool gives the same results as running in-process."""
+    print("\n=== Test: run scenarios pool ===")
+
+    batch = []
+    for op in ("memcpy", "memcpy_chain", "devcpy", "devcpy_chain"):
+        for mem in ("burst", "word"):
+            batch.append(Scenario(
+                "%s/%s" % (op, mem), op=op, mem=mem, sz=1000, src_off=1,
+                acc_sz=2, chk_sz=8, read_ns=3, write_ns=2, concurrency=2,
+                check=True))
+
+    local = run_scenarios(batch, processes=1)
+    pooled = run_scenarios(batch, processes=2, chunksize=3)
+    assert [r.name for r in pooled] == [sc.name for sc in batch]
+    for a, b in zip(local, pooled):
+        assert a.error is None and b.error is None, (a.error, b.error)
+        assert (a.sim_ns, a.stats.accesses) == (b.sim_ns, b.stats.accesses)
+
+    total = aggregate(pooled)
+    assert total.n_xfers == 2 * len(batch)
+    assert total.accesses == sum(r.stats.accesses for r in pooled)
+
+    print("  run scenarios pool test PASSED")
+
+
+# =============================================================================
+# Main Test Runner
+# =============================================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Scenario Runner Unit Tests")
+    print("=" * 60)
+
+    test_runner_reuse()
+    test_run_scenarios_pool()
+
+    print("\n" + "=" * 60)
+    print("All scenario runner tests PASSED!")
+    print("=" * 60)
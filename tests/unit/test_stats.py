@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# ****************************************************************************
+#  Unit Tests for transfer statistics (stats.py)
+# ****************************************************************************
+
+import sys
+import os
+import asyncio
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../../packages/zuspec-dataclasses/src'))
+
+import zuspec.dataclasses as zdc  # noqa: E402
+from org.zuspec.example.dma.impl.mem_paged import PagedMemory  # noqa: E402
+from org.zuspec.example.dma.impl.op_op_alg import DmaOpOpAlg  # noqa: E402
+from org.zuspec.example.dma.impl.stats import XferStats  # noqa: E402
+
+
+@zdc.dataclass
+class WordMemory(zdc.Component):
+    """Word-access-only memory (no burst or backdoor support)."""
+    delay: zdc.Time = zdc.field(default=None)
+
+    def __post_init__(self):
+        self.mem = bytearray(0x10000)
+
+    async def read(self, addr: zdc.u64) -> zdc.u64:
+        if self.delay is not None:
+            await self.wait(self.delay)
+        return int.from_bytes(self.mem[addr:addr + 8], "little")
+
+    async def write(self, addr: zdc.u64, data: zdc.u64, size: zdc.i8) -> None:
+        if self.delay is not None:
+            await self.wait(self.delay)
+        self.mem[addr:addr + size] = data.to_bytes(8, "little")[:size]
+
+
+# =============================================================================
+# Per-Transfer Tests
+# =============================================================================
+
+def test_stats_disabled():
+    """Test transfers return no record and keep no totals by default."""
+    print("\n=== Test: stats disabled ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: WordMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            st = await self.dma.memcpy(src=0x100, dst=0x200, sz=16)
+            assert st is None
+            assert self.dma.stats_total.n_xfers == 0
+            assert self.dma.stats_pri == {}
+
+            print("  stats disabled test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_stats_memcpy_words():
+    """Test access counts, time and bandwidth of a word-path memcpy."""
+    print("\n=== Test: stats memcpy words ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: WordMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.dma.stats = True
+            self.mem.delay = zdc.Time.ns(1)
+            await self.wait(zdc.Time.ns(3))
+
+            # Reads at 0x1001: 1, 2, 4, 8, 1 bytes; writes at 0x2000: 8, 8
+            st = await self.dma.memcpy(src=0x1001, dst=0x2000, sz=16, pri=2)
+            assert isinstance(st, XferStats)
+            assert st.kind == "memcpy" and st.pri == 2
+            assert st.nbytes == 16
+            assert st.reads == 5
+            assert st.writes == {8: 2}
+            assert st.accesses == 7
+            assert st.start_ns == 3 and st.end_ns == 10
+            assert st.bandwidth == 16 / 7
+            assert st.arb_wait_ns == 0
+            assert st.req_latency_ns is None
+
+            print("  stats memcpy words test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_stats_memcpy_burst():
+    """Test bursts and word accesses are counted separately."""
+    print("\n=== Test: stats memcpy burst ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: PagedMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.dma.stats = True
+            st = await self.dma.memcpy(src=0x10000, dst=0x20000, sz=4099)
+            assert st.nbytes == 4099
+            assert st.burst_reads == 1 and st.burst_writes == 1
+            # 3-byte tail: 2- and 1-byte accesses
+            assert st.reads == 2
+            assert st.writes == {2: 1, 1: 1}
+
+            print("  stats memcpy burst test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+def test_stats_devcpy_req_latency():
+    """Test request-to-first-access latency includes arbitration wait."""
+    print("\n=== Test: stats devcpy request latency ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: WordMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.dma.stats = True
+
+            async def device():
+                await self.wait(zdc.Time.ns(10))
+                await self.dma.req_transfer(3)
+
+            async def other_master():
+                # Holds the memory port until t=15
+                await self.dma.arb.acquire(0)
+                await self.wait(zdc.Time.ns(15))
+                self.dma.arb.release()
+
+            async def xfer():
+                return await self.dma.devcpy(
+                    src=0x100, dst=0x200, sz=32, acc_sz=8, chk_sz=4,
+                    inc_src=True, inc_dst=True, req_id=3)
+
+            _, _, st = await asyncio.gather(device(), other_master(), xfer())
+            assert st.kind == "devcpy"
+            assert st.req_latency_ns == 5
+            assert st.arb_wait_ns == 5
+            assert st.reads == 4 and st.writes == {8: 4}
+
+            print("  stats devcpy request latency test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Aggregation Tests
+# =============================================================================
+
+def test_stats_aggregate():
+    """Test engine totals and per-priority aggregates."""
+    print("\n=== Test: stats aggregate ===")
+
+    @zdc.dataclass
+    class Top(zdc.Component):
+        mem: WordMemory = zdc.field()
+        dma: DmaOpOpAlg = zdc.field()
+
+        def __bind__(self):
+            return {self.dma.mem: self.mem}
+
+        async def run(self):
+            self.dma.stats = True
+            self.dma.arb_quantum = 0
+            self.mem.delay = zdc.Time.ns(1)
+
+            async def late_memcpy():
+                await self.wait(zdc.Time.ns(1))
+                return await self.dma.memcpy(
+                    src=0x3000, dst=0x4000, sz=32, pri=7)
+
+            first, second = await asyncio.gather(
+                self.dma.memcpy(src=0x1000, dst=0x2000, sz=64, pri=1),
+                late_memcpy())
+            await self.dma.memcpy(src=0x5000, dst=0x6000, sz=8, pri=1)
+
+            # The first copy holds the port for its 16 accesses
+            assert first.arb_wait_ns == 0
+            assert second.arb_wait_ns == 15
+
+            total = self.dma.stats_total
+            assert total.n_xfers == 3
+            assert total.nbytes == 104
+            assert total.writes == {8: 13}
+            assert total.start_ns == 0 and total.end_ns == 26
+            assert total.arb_wait_ns == 15
+
+            assert sorted(self.dma.stats_pri.keys()) == [1, 7]
+            assert self.dma.stats_pri[1].n_xfers == 2
+            assert self.dma.stats_pri[1].nbytes == 72
+            assert self.dma.stats_pri[7].nbytes == 32
+
+            print("  stats aggregate test PASSED")
+
+    t = Top()
+    asyncio.run(t.run())
+    t.shutdown()
+
+
+# =============================================================================
+# Main Test Runner
+# =============================================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("XferStats Unit Tests")
+    print("=" * 60)
+
+    test_stats_disabled()
+    test_stats_memcpy_words()
+    test_stats_memcpy_burst()
+    test_stats_devcpy_req_latency()
+    test_stats_aggregate()
+
+    print("\n" + "=" * 60)
+    print("All XferStats tests PASSED!")
+    print("=" * 60)